@@ -6,6 +6,8 @@ import mlflow.tracking as tracking  # noqa
 
 log_param = tracking.log_param
 log_metric = tracking.log_metric
+log_params = tracking.log_params
+log_metrics = tracking.log_metrics
 log_artifacts = tracking.log_artifacts
 log_artifact = tracking.log_artifact
 active_run = tracking.active_run
@@ -18,5 +20,6 @@ create_experiment = tracking.create_experiment
 
 run = projects.run
 
-__all__ = ["log_param", "log_metric", "log_artifacts", "log_artifact", "active_run",
-           "start_run", "end_run", "get_artifact_uri", "set_tracking_uri", "create_experiment"]
+__all__ = ["log_param", "log_metric", "log_params", "log_metrics", "log_artifacts", "log_artifact",
+           "active_run", "start_run", "end_run", "get_artifact_uri", "set_tracking_uri",
+           "create_experiment"]
@@ -113,11 +113,25 @@ def add_to_model(model, loader_module, data=None, code=None, env=None):
     return model.add_flavor(FLAVOR_NAME, **parms)
 
 
-def load_pyfunc(path, run_id=None):
+def load_pyfunc(path, run_id=None, use_cache=False):
     """ Load model stored in python-function format.
+
+    :param path: Local path of the model, or its artifact path within the run if `run_id` is given.
+    :param run_id: ID of the run that produced the model.
+    :param use_cache: If True, the model is returned from the process-wide model cache (see
+                      :py:func:`mlflow.pyfunc.model_cache.get_model_cache`) when it was loaded
+                      before and its MLmodel file has not changed since, and added to it
+                      otherwise. The same model object is then shared by all callers.
     """
+    if use_cache:
+        from mlflow.pyfunc.model_cache import get_model_cache
+        return get_model_cache().load(path, run_id)
     if run_id:
         path = tracking._get_model_log_dir(path, run_id)
+    return _load_pyfunc(path)
+
+
+def _load_pyfunc(path):
     conf_path = os.path.join(path, "MLmodel")
     model = Model.load(conf_path)
     if FLAVOR_NAME not in model.flavors:
@@ -126,11 +140,17 @@ def load_pyfunc(path, run_id=None):
     conf = model.flavors[FLAVOR_NAME]
     if CODE in conf and conf[CODE]:
         code_path = os.path.join(path, conf[CODE])
-        sys.path = [code_path] + _get_code_dirs(code_path) + sys.path
+        _add_to_sys_path([code_path] + _get_code_dirs(code_path))
     data_path = os.path.join(path, conf[DATA]) if (DATA in conf) else path
     return importlib.import_module(conf[MAIN]).load_pyfunc(data_path)
 
 
+def _add_to_sys_path(paths):
+    """ Prepends paths to sys.path, skipping the ones already on it so that it does not grow. """
+    new_paths = [path for path in paths if path not in sys.path]
+    sys.path = new_paths + sys.path
+
+
 def _get_code_dirs(src_code_path, dst_code_path=None):
     if not dst_code_path:
         dst_code_path = src_code_path
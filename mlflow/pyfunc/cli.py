@@ -19,7 +19,13 @@ def commands():
 @cli_args.MODEL_PATH
 @cli_args.RUN_ID
 @click.option("--port", "-p", default=5000, help="Server port. [default: 5000]")
-def serve(model_path, run_id, port):
+@click.option("--max-batch-size", type=int, default=None,
+              help="If greater than 1, gather concurrent requests into batches of up to this "
+                   "number of rows, on which the model predicts at once. [default: no batching]")
+@click.option("--max-batch-wait-ms", type=float, default=None,
+              help="Maximum time in milliseconds a request waits for others to batch with. "
+                   "[default: 5]")
+def serve(model_path, run_id, port, max_batch_size, max_batch_wait_ms):
     """
     Serve a PythonFunction model saved with MLflow.
 
@@ -28,7 +34,8 @@ def serve(model_path, run_id, port):
     """
     if run_id:
         model_path = _get_model_log_dir(model_path, run_id)
-    app = scoring_server.init(load_pyfunc(model_path))
+    app = scoring_server.init(load_pyfunc(model_path), max_batch_size=max_batch_size,
+                              max_batch_wait_ms=max_batch_wait_ms)
     app.run(port=port)
 
 
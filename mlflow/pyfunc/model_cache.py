@@ -0,0 +1,163 @@
+import collections
+import os
+import threading
+
+from mlflow.utils.env import get_env
+
+
+_MAX_MODELS_ENV_VAR = "MLFLOW_PYFUNC_MODEL_CACHE_MAX_MODELS"
+_MAX_SIZE_ENV_VAR = "MLFLOW_PYFUNC_MODEL_CACHE_MAX_SIZE"
+
+_DEFAULT_MAX_MODELS = 8
+_DEFAULT_MAX_SIZE = 2 * 1024 * 1024 * 1024
+
+ModelCacheStats = collections.namedtuple("ModelCacheStats", ["hits", "misses", "evictions",
+                                                             "num_models", "size_bytes"])
+
+_CachedModel = collections.namedtuple("_CachedModel", ["mtime", "model", "size"])
+
+_model_cache = None
+_model_cache_lock = threading.Lock()
+
+
+def get_model_cache():
+    """
+    Returns the process-wide model cache, bounded by the MLFLOW_PYFUNC_MODEL_CACHE_MAX_MODELS (8
+    by default) and MLFLOW_PYFUNC_MODEL_CACHE_MAX_SIZE (in bytes, 2GB by default) environment
+    variables.
+    """
+    global _model_cache
+    with _model_cache_lock:
+        if _model_cache is None:
+            max_models = int(get_env(_MAX_MODELS_ENV_VAR) or _DEFAULT_MAX_MODELS)
+            max_size = int(get_env(_MAX_SIZE_ENV_VAR) or _DEFAULT_MAX_SIZE)
+            _model_cache = ModelCache(max_models, max_size)
+        return _model_cache
+
+
+def _get_directory_size(path):
+    size = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            file_path = os.path.join(root, name)
+            if not os.path.islink(file_path):
+                size += os.path.getsize(file_path)
+    return size
+
+
+class ModelCache(object):
+    """
+    Thread-safe in-memory cache of loaded pyfunc models, so that loading the same model again
+    neither re-reads its configuration nor re-imports and deserializes it.
+
+    Models are cached by the real path of their directory, and reloaded when the modification time
+    of their MLmodel file changes. The local directory of a model logged to a run is memoized by
+    run ID and artifact path, so that it is not looked up from the tracking server again while it
+    exists. Once more than `max_models` models are cached, or their directories total more than
+    `max_size_bytes`, the least recently used ones are evicted.
+
+    :param max_models: Maximum number of cached models.
+    :param max_size_bytes: Total on-disk size of the cached models' directories, used as an
+                           estimate of their size in memory, above which the least recently used
+                           ones are evicted.
+    """
+
+    def __init__(self, max_models, max_size_bytes):
+        self.max_models = max_models
+        self.max_size_bytes = max_size_bytes
+        self._entries = collections.OrderedDict()
+        # Map from (run ID, artifact path) --> local model directory
+        self._run_model_dirs = {}
+        # Map from model directory --> lock held while the model is being loaded
+        self._load_locks = {}
+        self._lock = threading.Lock()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def _get_local_path(self, path, run_id):
+        if not run_id:
+            return path
+        with self._lock:
+            local_path = self._run_model_dirs.get((run_id, path))
+        if local_path is None or not os.path.exists(os.path.join(local_path, "MLmodel")):
+            from mlflow import tracking
+            local_path = tracking._get_model_log_dir(path, run_id)
+            with self._lock:
+                self._run_model_dirs[(run_id, path)] = local_path
+        return local_path
+
+    def _get_cached(self, real_path, mtime):
+        """ Returns the cached model, marking it as recently used, if it is up to date. """
+        entry = self._entries.get(real_path)
+        if entry is None or entry.mtime != mtime:
+            return None
+        self._entries[real_path] = self._entries.pop(real_path)
+        self._hits += 1
+        return entry.model
+
+    def load(self, path, run_id=None):
+        """
+        Returns the pyfunc model at `path`, loading it first if it is not cached or out of date.
+
+        :param path: Local path of the model, or its artifact path within the run if `run_id` is
+                     given.
+        :param run_id: ID of the run that produced the model.
+        """
+        local_path = self._get_local_path(path, run_id)
+        real_path = os.path.realpath(local_path)
+        mtime = os.path.getmtime(os.path.join(local_path, "MLmodel"))
+        with self._lock:
+            model = self._get_cached(real_path, mtime)
+            if model is not None:
+                return model
+            load_lock = self._load_locks.setdefault(real_path, threading.Lock())
+        try:
+            # Concurrent loads of the same model wait for the first one rather than load it again
+            with load_lock:
+                with self._lock:
+                    model = self._get_cached(real_path, mtime)
+                    if model is not None:
+                        return model
+                from mlflow.pyfunc import _load_pyfunc  # pylint: disable=cyclic-import
+                model = _load_pyfunc(local_path)
+                self._put(real_path, _CachedModel(mtime, model, _get_directory_size(local_path)))
+                return model
+        finally:
+            # Also when loading fails, so that the lock of a model that cannot be loaded does not
+            # stay around
+            with self._lock:
+                if self._load_locks.get(real_path) is load_lock:
+                    del self._load_locks[real_path]
+
+    def _put(self, real_path, entry):
+        with self._lock:
+            self._misses += 1
+            previous = self._entries.pop(real_path, None)
+            if previous is not None:
+                self._size -= previous.size
+            if entry.size > self.max_size_bytes or self.max_models <= 0:
+                return
+            self._entries[real_path] = entry
+            self._size += entry.size
+            while len(self._entries) > self.max_models or self._size > self.max_size_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.size
+                self._evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._run_model_dirs.clear()
+            self._size = 0
+
+    @property
+    def stats(self):
+        """
+        :return: `ModelCacheStats` with the number of cache hits, misses and evictions so far,
+                 and the number and total size of the cached models.
+        """
+        with self._lock:
+            return ModelCacheStats(self._hits, self._misses, self._evictions, len(self._entries),
+                                   self._size)
@@ -3,17 +3,28 @@ Scoring server for python model format.
 The passed int model is expected to have function:
    predict(pandas.Dataframe) -> pandas.DataFrame
 
-Input, expected intext/csv or application/json format,
-is parsed into pandas.DataFrame and passed to the model.
+Input, expected in one of the formats of `CONTENT_TYPES` (CSV, JSON with records, split or
+columns orient, Arrow IPC stream, Parquet or NumPy .npy), is parsed into pandas.DataFrame and
+passed to the model. Predictions are returned in the format requested by the Accept header of the
+request, out of the same formats, or as JSON records by default.
 
 Defines two endpoints:
     /ping used for health check
     /invocations used for scoring
+
+Concurrent requests can optionally be gathered into batches, so that the model predicts on one
+larger DataFrame rather than on each request's. Batching relies on the `threading` module, so it
+works with threaded servers as well as with gevent workers, which patch `threading` to use
+greenlets.
 """
 from __future__ import print_function
 
-import json
+import os
+import threading
+import time
+from io import BytesIO
 
+import numpy as np
 import pandas as pd
 import flask
 
@@ -22,13 +33,324 @@ try:
 except ImportError:
     from io import StringIO
 
-from mlflow.utils import get_jsonable_obj
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+from mlflow.utils import dumps_jsonable_obj
+from mlflow.utils.env import get_env
+
+_MAX_BATCH_SIZE_ENV_VAR = "MLFLOW_SCORING_SERVER_MAX_BATCH_SIZE"
+_MAX_BATCH_WAIT_MS_ENV_VAR = "MLFLOW_SCORING_SERVER_MAX_BATCH_WAIT_MS"
+_DEFAULT_MAX_BATCH_WAIT_MS = 5
+
+CONTENT_TYPE_CSV = "text/csv"
+CONTENT_TYPE_JSON = "application/json"
+CONTENT_TYPE_JSON_SPLIT_ORIENTED = "application/json; format=pandas-split"
+CONTENT_TYPE_JSON_COLUMNS_ORIENTED = "application/json; format=pandas-columns"
+CONTENT_TYPE_ARROW = "application/vnd.apache.arrow.stream"
+CONTENT_TYPE_PARQUET = "application/vnd.apache.parquet"
+CONTENT_TYPE_NPY = "application/x-npy"
+
+# Map from the "format" parameter of a JSON content type --> pandas orient of the JSON document
+_JSON_FORMATS = {
+    "pandas-records": "records",
+    "pandas-split": "split",
+    "pandas-columns": "columns",
+}
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet  # pylint: disable=unused-variable
+    except ImportError:
+        raise Exception("Reading and writing Arrow and Parquet data requires the pyarrow "
+                        "package. Install it with `pip install pyarrow`.")
+    return pyarrow
+
+
+def _parse_csv(data, _):
+    return pd.read_csv(StringIO(data.decode('utf-8')))
+
+
+def _parse_json(data, orient):
+    return pd.read_json(StringIO(data.decode('utf-8')), orient=orient)
+
+
+def _parse_arrow(data, _):
+    pa = _import_pyarrow()
+    table = pa.ipc.open_stream(pa.py_buffer(data)).read_all()
+    # Numeric columns without nulls are converted without copying their values
+    return table.to_pandas(split_blocks=True)
+
+
+def _parse_parquet(data, _):
+    pa = _import_pyarrow()
+    return pa.parquet.read_table(pa.BufferReader(data)).to_pandas(split_blocks=True)
+
+
+def _parse_npy(data, _):
+    """
+    Reads a 1 or 2-dimensional array in the NumPy .npy format, referencing the request body rather
+    than copying it. Arrays of Python objects are rejected, as reading them would unpickle them.
+    """
+    stream = BytesIO(data)
+    version = np.lib.format.read_magic(stream)
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(stream)
+    else:
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(stream)
+    if dtype.hasobject:
+        raise Exception("Arrays of Python objects are not supported.")
+    if len(shape) > 2:
+        raise Exception("Expected a 1 or 2-dimensional array, got %s dimensions." % len(shape))
+    array = np.frombuffer(data, dtype=dtype, count=int(np.prod(shape)), offset=stream.tell())
+    array = array.reshape(shape, order="F" if fortran_order else "C")
+    if dtype.names is not None:
+        # Structured array, whose fields are the columns
+        return pd.DataFrame(array)
+    return pd.DataFrame(array, copy=False)
+
+
+def _parse_request(data, mimetype, mimetype_params):
+    """
+    :return: DataFrame parsed from a request body of the given type, or None if the type is not
+             supported.
+    """
+    if mimetype == CONTENT_TYPE_JSON:
+        orient = _JSON_FORMATS.get(mimetype_params.get("format", "pandas-records"))
+        return _parse_json(data, orient) if orient is not None else None
+    parser = {
+        CONTENT_TYPE_CSV: _parse_csv,
+        CONTENT_TYPE_ARROW: _parse_arrow,
+        CONTENT_TYPE_PARQUET: _parse_parquet,
+        CONTENT_TYPE_NPY: _parse_npy,
+    }.get(mimetype)
+    return parser(data, None) if parser is not None else None
+
+
+def _to_dataframe(predictions):
+    if isinstance(predictions, pd.DataFrame):
+        df = predictions
+    elif isinstance(predictions, pd.Series):
+        df = predictions.to_frame()
+    else:
+        df = pd.DataFrame(predictions)
+    # Arrow and Parquet require string column names
+    return df.rename(columns=str)
+
+
+def _serialize_json(predictions):
+    return dumps_jsonable_obj(predictions)
+
+
+def _serialize_json_oriented(orient):
+    return lambda predictions: _to_dataframe(predictions).to_json(orient=orient)
+
 
+def _serialize_csv(predictions):
+    return _to_dataframe(predictions).to_csv(index=False)
 
-def init(model):
+
+def _serialize_arrow(predictions):
+    pa = _import_pyarrow()
+    table = pa.Table.from_pandas(_to_dataframe(predictions), preserve_index=False)
+    sink = pa.BufferOutputStream()
+    writer = pa.ipc.new_stream(sink, table.schema)
+    writer.write_table(table)
+    writer.close()
+    return sink.getvalue().to_pybytes()
+
+
+def _serialize_parquet(predictions):
+    pa = _import_pyarrow()
+    sink = pa.BufferOutputStream()
+    table = pa.Table.from_pandas(_to_dataframe(predictions), preserve_index=False)
+    pa.parquet.write_table(table, sink)
+    return sink.getvalue().to_pybytes()
+
+
+def _serialize_npy(predictions):
+    if isinstance(predictions, (pd.DataFrame, pd.Series)):
+        predictions = predictions.values
+    stream = BytesIO()
+    np.save(stream, np.asarray(predictions), allow_pickle=False)
+    return stream.getvalue()
+
+
+# Serializers of the predictions for each response content type, JSON records first as the default
+_SERIALIZERS = [
+    (CONTENT_TYPE_JSON, _serialize_json),
+    (CONTENT_TYPE_JSON_SPLIT_ORIENTED, _serialize_json_oriented("split")),
+    (CONTENT_TYPE_JSON_COLUMNS_ORIENTED, _serialize_json_oriented("columns")),
+    (CONTENT_TYPE_CSV, _serialize_csv),
+    (CONTENT_TYPE_ARROW, _serialize_arrow),
+    (CONTENT_TYPE_PARQUET, _serialize_parquet),
+    (CONTENT_TYPE_NPY, _serialize_npy),
+]
+
+CONTENT_TYPES = [content_type for content_type, _ in _SERIALIZERS]
+
+
+class _PredictionRequest(object):
+    def __init__(self, data):
+        self.data = data
+        # Only requests with the same key are batched together
+        self.key = (tuple(data.columns), tuple(str(dtype) for dtype in data.dtypes))
+        self.result = None
+        self.error = None
+        self.done = threading.Event()
+
+
+def _split_predictions(predictions, sizes):
+    """
+    Splits the predictions made on a batch into the predictions of each of the DataFrames making
+    up the batch, given their number of rows.
+    """
+    if len(predictions) != sum(sizes):
+        raise Exception("The model returned %s predictions for a batch of %s rows."
+                        % (len(predictions), sum(sizes)))
+    parts = []
+    start = 0
+    for size in sizes:
+        if isinstance(predictions, (pd.DataFrame, pd.Series)):
+            parts.append(predictions.iloc[start:start + size].reset_index(drop=True))
+        else:
+            parts.append(predictions[start:start + size])
+        start += size
+    return parts
+
+
+class _BatchingPredictor(object):
+    """
+    Gathers DataFrames submitted concurrently to `predict` into batches, on which the model
+    predicts at once, and returns each caller the predictions for its own rows.
+
+    A batch is predicted once it holds `max_batch_size` rows, or `max_batch_wait_ms` milliseconds
+    after its first DataFrame was submitted. A batch never holds more than `max_batch_size` rows,
+    unless it consists of a single larger DataFrame. Only DataFrames with the same columns and
+    column types are concatenated. If predicting on a batch fails, each of its DataFrames is
+    predicted on separately, so that an invalid request does not fail the requests batched with it.
+
+    :param model: Model whose `predict(pandas.DataFrame)` method returns a DataFrame, Series,
+                  array or list with one prediction per row.
+    :param max_batch_size: Maximum number of rows of a batch.
+    :param max_batch_wait_ms: Maximum time, in milliseconds, that a request waits for others to
+                              batch with.
+    """
+
+    def __init__(self, model, max_batch_size, max_batch_wait_ms=_DEFAULT_MAX_BATCH_WAIT_MS):
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_batch_wait_ms = max_batch_wait_ms
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker = None
+        self._worker_pid = None
+
+    def _start_worker(self):
+        # The worker is started on first use rather than on creation, as it would not survive
+        # the fork of the server's worker processes if the model were loaded before
+        with self._lock:
+            if self._worker is None or self._worker_pid != os.getpid():
+                self._queue = queue.Queue()
+                self._worker = threading.Thread(target=self._run)
+                self._worker.daemon = True
+                self._worker.start()
+                self._worker_pid = os.getpid()
+
+    def predict(self, data):
+        if self._worker is None or self._worker_pid != os.getpid():
+            self._start_worker()
+        request = _PredictionRequest(data)
+        self._queue.put(request)
+        request.done.wait()
+        if request.error is not None:
+            raise request.error
+        return request.result
+
+    def _fits(self, batch, num_rows, request):
+        # A request with more rows than `max_batch_size` is predicted on alone
+        return len(batch) == 0 or num_rows + len(request.data) <= self.max_batch_size
+
+    def _run(self):
+        # Requests received while gathering a batch of requests with different columns
+        pending = []
+        while True:
+            if len(pending) == 0:
+                pending.append(self._queue.get())
+            key = pending[0].key
+            batch = []
+            num_rows = 0
+            for request in list(pending):
+                if request.key == key and self._fits(batch, num_rows, request):
+                    batch.append(request)
+                    num_rows += len(request.data)
+                    pending.remove(request)
+            deadline = time.time() + self.max_batch_wait_ms / 1000.0
+            while num_rows < self.max_batch_size:
+                timeout = deadline - time.time()
+                if timeout <= 0:
+                    break
+                try:
+                    request = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if request.key == key and self._fits(batch, num_rows, request):
+                    batch.append(request)
+                    num_rows += len(request.data)
+                else:
+                    pending.append(request)
+                    if request.key == key:
+                        # The batch is as full as it gets: the request starts the next one
+                        break
+            self._predict_batch(batch)
+
+    def _predict_batch(self, batch):
+        if len(batch) > 1:
+            try:
+                data = pd.concat([request.data for request in batch], ignore_index=True)
+                results = _split_predictions(self.model.predict(data),
+                                             [len(request.data) for request in batch])
+            except Exception:  # pylint: disable=broad-except
+                results = None
+            if results is not None:
+                for request, result in zip(batch, results):
+                    request.result = result
+                    request.done.set()
+                return
+        for request in batch:
+            try:
+                request.result = self.model.predict(request.data)
+            except Exception as e:  # pylint: disable=broad-except
+                request.error = e
+            request.done.set()
+
+
+def init(model, max_batch_size=None, max_batch_wait_ms=None):
     """
     Initialize the server. Loads pyfunc model from the path.
+
+    :param model: Loaded pyfunc model.
+    :param max_batch_size: If greater than 1, concurrent requests are gathered into batches of up
+                           to this number of rows, on which the model predicts at once. Defaults
+                           to the value of the MLFLOW_SCORING_SERVER_MAX_BATCH_SIZE environment
+                           variable, or no batching.
+    :param max_batch_wait_ms: Maximum time, in milliseconds, that a request waits for others to
+                              batch with. Defaults to the value of the
+                              MLFLOW_SCORING_SERVER_MAX_BATCH_WAIT_MS environment variable, or 5.
     """
+    if max_batch_size is None:
+        max_batch_size = int(get_env(_MAX_BATCH_SIZE_ENV_VAR) or 0)
+    if max_batch_wait_ms is None:
+        max_batch_wait_ms = float(get_env(_MAX_BATCH_WAIT_MS_ENV_VAR) or
+                                  _DEFAULT_MAX_BATCH_WAIT_MS)
+    predictor = model
+    if max_batch_size > 1:
+        predictor = _BatchingPredictor(model, max_batch_size, max_batch_wait_ms)
+
     app = flask.Flask(__name__)
 
     @app.route('/ping', methods=['GET'])
@@ -44,27 +366,28 @@ def init(model):
     @app.route('/invocations', methods=['POST'])
     def transformation():  # pylint: disable=unused-variable
         """
-        Do an inference on a single batch of data. In this sample server,
-        we take data as CSV or json, convert it to a pandas data frame,
-        generate predictions and convert them back to CSV.
+        Do an inference on a single batch of data. We take data in one of the supported formats,
+        convert it to a pandas data frame, generate predictions and convert them to the format
+        requested by the Accept header, JSON by default.
         """
-        # Convert from CSV to pandas
-        if flask.request.content_type == 'text/csv':
-            data = flask.request.data.decode('utf-8')
-            s = StringIO(data)
-            data = pd.read_csv(s)
-        elif flask.request.content_type == 'application/json':
-            data = flask.request.data.decode('utf-8')
-            s = StringIO(data)
-            data = pd.read_json(s, orient="records")
-        else:
+        try:
+            data = _parse_request(flask.request.get_data(), flask.request.mimetype,
+                                  flask.request.mimetype_params)
+        except Exception as e:  # pylint: disable=broad-except
+            return flask.Response(response='Failed to parse input: %s' % e, status=400,
+                                  mimetype='text/plain')
+        if data is None:
             return flask.Response(
-                response='This predictor only supports CSV or JSON  data, got %s' % str(
-                    flask.request.content_type), status=415, mimetype='text/plain')
+                response='This predictor only supports %s data, got %s' % (
+                    ", ".join(CONTENT_TYPES), str(flask.request.content_type)),
+                status=415, mimetype='text/plain')
 
         # Do the prediction
-        predictions = get_jsonable_obj(model.predict(data))
-        result = json.dumps(predictions)
-        return flask.Response(response=result, status=200, mimetype='application/json')
+        predictions = predictor.predict(data)
+        # Defaults to JSON records when the client accepts none of the supported types
+        content_type = flask.request.accept_mimetypes.best_match(CONTENT_TYPES) \
+            or CONTENT_TYPE_JSON
+        result = dict(_SERIALIZERS)[content_type](predictions)
+        return flask.Response(response=result, status=200, content_type=content_type)
 
     return app
@@ -1,37 +1,74 @@
 # Define all the service endpoint handlers here.
+import functools
+import hashlib
 import json
+import mimetypes
 import os
 import re
+import time
 
-from flask import Response, request, send_file
+from flask import Response, request
 from google.protobuf.json_format import MessageToJson, ParseDict
 from querystring_parser import parser
 
 from mlflow.entities.metric import Metric
 from mlflow.entities.param import Param
+from mlflow.entities.run_status import RunStatus
 from mlflow.entities.run_tag import RunTag
 from mlflow.protos import databricks_pb2
 from mlflow.protos.service_pb2 import CreateExperiment, MlflowService, GetExperiment, \
     GetRun, SearchRuns, ListArtifacts, GetArtifact, GetMetricHistory, CreateRun, \
-    UpdateRun, LogMetric, LogParam, ListExperiments, GetMetric, GetParam
+    UpdateRun, LogMetric, LogParam, LogBatch, ListExperiments, GetMetric, GetParam, \
+    GetMetricHistoryBulk
 from mlflow.store.artifact_repo import ArtifactRepository
+from mlflow.server.response_cache import CachedResponse, ResponseCache
 from mlflow.store.file_store import FileStore
+from mlflow.tracking import _is_database_uri
+from mlflow.utils.env import get_env
 
 
 _store = None
+_response_cache = None
+
+_JSON_CONTENT_TYPE = "application/json"
+_PROTOBUF_CONTENT_TYPE = "application/x-protobuf"
+
+_RESPONSE_CACHE_SIZE_ENV_VAR = "MLFLOW_SERVER_RESPONSE_CACHE_SIZE"
+_DEFAULT_RESPONSE_CACHE_SIZE = 64 * 1024 * 1024
+# Artifact listings of finished runs are cached by the server and clients for this many seconds
+_ARTIFACT_LISTING_MAX_AGE = 60
 
 
 def _get_store():
     from mlflow.server import FILE_STORE_ENV_VAR, ARTIFACT_ROOT_ENV_VAR
     global _store
     if _store is None:
-        store_dir = os.environ.get(FILE_STORE_ENV_VAR, os.path.abspath("mlruns"))
-        artifact_root = os.environ.get(ARTIFACT_ROOT_ENV_VAR, store_dir)
-        _store = FileStore(store_dir, artifact_root)
+        store_uri = os.environ.get(FILE_STORE_ENV_VAR, os.path.abspath("mlruns"))
+        if _is_database_uri(store_uri):
+            from mlflow.store.sqlalchemy_store import SqlAlchemyStore
+            _store = SqlAlchemyStore(store_uri, os.environ.get(ARTIFACT_ROOT_ENV_VAR))
+        else:
+            artifact_root = os.environ.get(ARTIFACT_ROOT_ENV_VAR, store_uri)
+            _store = FileStore(store_uri, artifact_root)
     return _store
 
 
+def _get_response_cache():
+    """
+    Returns the cache of read-only responses of this server process, holding at most
+    MLFLOW_SERVER_RESPONSE_CACHE_SIZE bytes (64MB by default, 0 to disable caching).
+    """
+    global _response_cache
+    if _response_cache is None:
+        max_size = int(get_env(_RESPONSE_CACHE_SIZE_ENV_VAR) or _DEFAULT_RESPONSE_CACHE_SIZE)
+        _response_cache = ResponseCache(max_size)
+    return _response_cache
+
+
 def _get_request_message(request_message, from_get=False):
+    if request.mimetype == _PROTOBUF_CONTENT_TYPE:
+        request_message.ParseFromString(request.get_data())
+        return request_message
     if from_get and len(request.query_string) > 0:
         # This is a hack to make arrays of length 1 work with the parser.
         # for example experiment_ids%5B%5D=0 should be parsed to {experiment_ids: [0]}
@@ -50,6 +87,134 @@ def _get_request_message(request_message, from_get=False):
     return request_message
 
 
+def _accepts_protobuf():
+    return request.accept_mimetypes.best_match([_JSON_CONTENT_TYPE, _PROTOBUF_CONTENT_TYPE]) == \
+        _PROTOBUF_CONTENT_TYPE
+
+
+def _wrap_response(response_message, preserving_proto_field_name=True):
+    """
+    Serializes the response message in the binary protobuf wire format if the client accepts it
+    (as RestStore does), which is much cheaper to produce and parse than JSON for large responses,
+    or as JSON otherwise (e.g. for the UI).
+    """
+    if _accepts_protobuf():
+        response = Response(mimetype=_PROTOBUF_CONTENT_TYPE)
+        response.set_data(response_message.SerializeToString())
+        return response
+    response = Response(mimetype=_JSON_CONTENT_TYPE)
+    response.set_data(MessageToJson(response_message,
+                                    preserving_proto_field_name=preserving_proto_field_name))
+    return response
+
+
+def _make_cached_response(entry):
+    """
+    Builds the response for a `CachedResponse`, answering with a bodyless 304 if the client
+    already holds the same response, as indicated by its If-None-Match header.
+    """
+    if request.if_none_match.contains(entry.etag):
+        response = Response(status=304)
+    else:
+        response = Response(mimetype=entry.mimetype)
+        response.set_data(entry.data)
+    response.set_etag(entry.etag)
+    # Unless the response sets a max age, clients must revalidate it with the ETag before reuse
+    response.headers["Cache-Control"] = entry.cache_control or "no-cache"
+    # The response is serialized in the format negotiated with the Accept header
+    response.vary.add("Accept")
+    return response
+
+
+def _cache_responses(get_version):
+    """
+    Decorates the handler of a read-only endpoint to cache its responses in memory, keyed by
+    the request, and to tag them with an ETag so that clients polling the endpoint (e.g. the UI)
+    get a cheap 304 when the response has not changed.
+
+    :param get_version: Function returning the version of the data the response to the current
+                        request is computed from, e.g. a change token of the store. Responses are
+                        cached until the version changes, or not at all if it is None.
+    """
+    def decorator(handler):
+        @functools.wraps(handler)
+        def wrapper():
+            # Get the version before computing the response, so that writes made meanwhile
+            # invalidate it
+            version = get_version()
+            if version is None:
+                response = handler()
+                response.vary.add("Accept")
+                return response
+            cache = _get_response_cache()
+            key = (handler.__name__, request.query_string, request.get_data(), request.mimetype,
+                   _accepts_protobuf())
+            entry = cache.get(key)
+            if entry is None or entry.version != version:
+                response = handler()
+                data = response.get_data()
+                entry = CachedResponse(version=version, etag=hashlib.sha1(data).hexdigest(),
+                                       mimetype=response.mimetype, data=data,
+                                       cache_control=response.headers.get("Cache-Control"))
+                cache.put(key, entry)
+            return _make_cached_response(entry)
+        return wrapper
+    return decorator
+
+
+def _get_experiments_version():
+    return _get_store().get_change_token()
+
+
+def _get_experiment_version():
+    # Only the run information of the experiment is returned, not the runs' metrics and params
+    request_message = _get_request_message(GetExperiment(), from_get=True)
+    return _get_store().get_change_token([request_message.experiment_id],
+                                         include_run_data=False)
+
+
+def _get_search_runs_version():
+    request_message = _get_request_message(SearchRuns(), from_get=True)
+    return _get_store().get_change_token(list(request_message.experiment_ids))
+
+
+def _get_artifact_listing_version():
+    """
+    Artifacts are not written through the store, so only listings of finished runs, whose
+    artifacts rarely change, are cached, and only for `_ARTIFACT_LISTING_MAX_AGE` seconds. Runs
+    can be resumed, which changes their status and invalidates their listings immediately. Only
+    the run information is read, not the metrics and params of the run.
+    """
+    request_message = _get_request_message(ListArtifacts(), from_get=True)
+    run_info = _get_store().get_run_info_by_uuid(request_message.run_uuid)
+    if run_info.status not in (RunStatus.FINISHED, RunStatus.FAILED):
+        return None
+    return (run_info.status, run_info.end_time, int(time.time() // _ARTIFACT_LISTING_MAX_AGE))
+
+
+def _get_paging_args(request_message):
+    """
+    :return: Keyword arguments for paginated store APIs, taken from the `max_results`, `page_token`
+             and `order_by` fields of the request message.
+    """
+    return {
+        "max_results": request_message.max_results
+        if request_message.HasField("max_results") else None,
+        "page_token": request_message.page_token or None,
+        "order_by": list(request_message.order_by) or None,
+    }
+
+
+def _get_metric_history_args(request_message):
+    """
+    :return: Keyword arguments for the metric history store APIs, taken from the `start_ts`,
+             `end_ts`, `max_points` and `aggregation` fields set in the request message.
+    """
+    return dict((field, getattr(request_message, field))
+                for field in ["start_ts", "end_ts", "max_points", "aggregation"]
+                if request_message.HasField(field))
+
+
 def get_handler(request_class):
     """
     :param request_class: The type of protobuf message
@@ -69,21 +234,21 @@ def _create_experiment():
     experiment_id = _get_store().create_experiment(request_message.name)
     response_message = CreateExperiment.Response()
     response_message.experiment_id = experiment_id
-    response = Response(mimetype='application/json')
-    response.set_data(MessageToJson(response_message))
-    return response
+    return _wrap_response(response_message, preserving_proto_field_name=False)
 
 
+@_cache_responses(_get_experiment_version)
 def _get_experiment():
     request_message = _get_request_message(GetExperiment(), from_get=True)
     response_message = GetExperiment.Response()
     response_message.experiment.MergeFrom(_get_store().get_experiment(request_message.experiment_id)
                                           .to_proto())
-    run_info_entities = _get_store().list_run_infos(request_message.experiment_id)
+    run_info_entities = _get_store().list_run_infos(request_message.experiment_id,
+                                                    **_get_paging_args(request_message))
     response_message.runs.extend([r.to_proto() for r in run_info_entities])
-    response = Response(mimetype='application/json')
-    response.set_data(MessageToJson(response_message, preserving_proto_field_name=True))
-    return response
+    if run_info_entities.token:
+        response_message.next_page_token = run_info_entities.token
+    return _wrap_response(response_message)
 
 
 def _create_run():
@@ -103,9 +268,7 @@ def _create_run():
 
     response_message = CreateRun.Response()
     response_message.run.MergeFrom(run.to_proto())
-    response = Response(mimetype='application/json')
-    response.set_data(MessageToJson(response_message, preserving_proto_field_name=True))
-    return response
+    return _wrap_response(response_message)
 
 
 def _update_run():
@@ -113,9 +276,7 @@ def _update_run():
     updated_info = _get_store().update_run_info(request_message.run_uuid, request_message.status,
                                          request_message.end_time)
     response_message = UpdateRun.Response(run_info=updated_info.to_proto())
-    response = Response(mimetype='application/json')
-    response.set_data(MessageToJson(response_message, preserving_proto_field_name=True))
-    return response
+    return _wrap_response(response_message)
 
 
 def _log_metric():
@@ -123,9 +284,7 @@ def _log_metric():
     metric = Metric(request_message.key, request_message.value, request_message.timestamp)
     _get_store().log_metric(request_message.run_uuid, metric)
     response_message = LogMetric.Response()
-    response = Response(mimetype='application/json')
-    response.set_data(MessageToJson(response_message, preserving_proto_field_name=True))
-    return response
+    return _wrap_response(response_message)
 
 
 def _log_param():
@@ -133,31 +292,40 @@ def _log_param():
     param = Param(request_message.key, request_message.value)
     _get_store().log_param(request_message.run_uuid, param)
     response_message = LogParam.Response()
-    response = Response(mimetype='application/json')
-    response.set_data(MessageToJson(response_message, preserving_proto_field_name=True))
-    return response
+    return _wrap_response(response_message)
+
+
+def _log_batch():
+    request_message = _get_request_message(LogBatch())
+    metrics = [Metric.from_proto(proto_metric) for proto_metric in request_message.metrics]
+    params = [Param.from_proto(proto_param) for proto_param in request_message.params]
+    tags = [RunTag.from_proto(proto_tag) for proto_tag in request_message.tags]
+    _get_store().log_batch(request_message.run_uuid, metrics, params, tags)
+    response_message = LogBatch.Response()
+    return _wrap_response(response_message)
 
 
 def _get_run():
     request_message = _get_request_message(GetRun(), from_get=True)
     response_message = GetRun.Response()
     response_message.run.MergeFrom(_get_store().get_run(request_message.run_uuid).to_proto())
-    response = Response(mimetype='application/json')
-    response.set_data(MessageToJson(response_message, preserving_proto_field_name=True))
-    return response
+    return _wrap_response(response_message)
 
 
+@_cache_responses(_get_search_runs_version)
 def _search_runs():
     request_message = _get_request_message(SearchRuns(), from_get=True)
     response_message = SearchRuns.Response()
     run_entities = _get_store().search_runs(request_message.experiment_ids,
-                                     request_message.anded_expressions)
+                                            request_message.anded_expressions,
+                                            **_get_paging_args(request_message))
     response_message.runs.extend([r.to_proto() for r in run_entities])
-    response = Response(mimetype='application/json')
-    response.set_data(MessageToJson(response_message, preserving_proto_field_name=True))
-    return response
+    if run_entities.token:
+        response_message.next_page_token = run_entities.token
+    return _wrap_response(response_message)
 
 
+@_cache_responses(_get_artifact_listing_version)
 def _list_artifacts():
     request_message = _get_request_message(ListArtifacts(), from_get=True)
     response_message = ListArtifacts.Response()
@@ -169,34 +337,93 @@ def _list_artifacts():
     artifact_entities = _get_artifact_repo(run).list_artifacts(path)
     response_message.files.extend([a.to_proto() for a in artifact_entities])
     response_message.root_uri = _get_artifact_repo(run).artifact_uri
-    response = Response(mimetype='application/json')
-    response.set_data(MessageToJson(response_message, preserving_proto_field_name=True))
+    response = _wrap_response(response_message)
+    if run.info.status in (RunStatus.FINISHED, RunStatus.FAILED):
+        response.cache_control.max_age = _ARTIFACT_LISTING_MAX_AGE
     return response
 
 
 _TEXT_EXTENSIONS = ['txt', 'yaml', 'json', 'js', 'py', 'csv', 'md', 'rst', 'MLmodel', 'MLproject']
 
 
+# Size of the chunks in which artifacts are streamed to the client
+_ARTIFACT_CHUNK_SIZE = 1024 * 1024
+
+
+def _get_artifact_mimetype(path):
+    extension = os.path.splitext(path)[-1].replace(".", "")
+    if extension in _TEXT_EXTENSIONS:
+        return 'text/plain'
+    return mimetypes.guess_type(path)[0] or 'application/octet-stream'
+
+
+def _stream_artifact(artifact_file):
+    try:
+        while True:
+            chunk = artifact_file.read(_ARTIFACT_CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+    finally:
+        artifact_file.close()
+
+
 def _get_artifact():
+    """
+    Streams an artifact file from the artifact repository to the client in chunks, so that
+    artifacts of any size are served with constant memory and without a local copy. Supports
+    single byte ranges requested through the HTTP Range header.
+    """
     request_message = _get_request_message(GetArtifact(), from_get=True)
     run = _get_store().get_run(request_message.run_uuid)
-    filename = os.path.abspath(_get_artifact_repo(run).download_artifacts(request_message.path))
-    extension = os.path.splitext(filename)[-1].replace(".", "")
-    if extension in _TEXT_EXTENSIONS:
-        return send_file(filename, mimetype='text/plain')
-    else:
-        return send_file(filename)
+    artifact_repo = _get_artifact_repo(run)
+    path = request_message.path
+    size = artifact_repo.get_artifact_size(path)
+    mimetype = _get_artifact_mimetype(path)
+    status = 200
+    start, end = 0, size
+    # Multiple ranges are not supported: the whole artifact is sent instead, as allowed by RFC 7233
+    if request.range is not None and len(request.range.ranges) == 1:
+        byte_range = request.range.range_for_length(size)
+        if byte_range is None:
+            response = Response(status=416, mimetype=mimetype)
+            response.headers['Content-Range'] = 'bytes */%s' % size
+            return response
+        status = 206
+        start, end = byte_range
+    artifact_file = artifact_repo.open_artifact(path, start, None if end == size else end)
+    response = Response(_stream_artifact(artifact_file), status=status, mimetype=mimetype,
+                        direct_passthrough=True)
+    response.headers['Accept-Ranges'] = 'bytes'
+    response.headers['Content-Length'] = str(end - start)
+    if status == 206:
+        response.headers['Content-Range'] = 'bytes %s-%s/%s' % (start, end - 1, size)
+    return response
 
 
 def _get_metric_history():
     request_message = _get_request_message(GetMetricHistory(), from_get=True)
     response_message = GetMetricHistory.Response()
     metric_entites = _get_store().get_metric_history(request_message.run_uuid,
-                                              request_message.metric_key)
+                                                     request_message.metric_key,
+                                                     **_get_metric_history_args(request_message))
     response_message.metrics.extend([m.to_proto() for m in metric_entites])
-    response = Response(mimetype='application/json')
-    response.set_data(MessageToJson(response_message, preserving_proto_field_name=True))
-    return response
+    return _wrap_response(response_message)
+
+
+def _get_metric_history_bulk():
+    request_message = _get_request_message(GetMetricHistoryBulk(), from_get=True)
+    response_message = GetMetricHistoryBulk.Response()
+    run_uuids = list(request_message.run_uuids)
+    histories = _get_store().get_metric_history_bulk(run_uuids, list(request_message.metric_keys),
+                                                     **_get_metric_history_args(request_message))
+    for run_uuid in run_uuids:
+        for metric_key, metrics in histories[run_uuid].items():
+            history = response_message.histories.add()
+            history.run_uuid = run_uuid
+            history.metric_key = metric_key
+            history.metrics.extend([m.to_proto() for m in metrics])
+    return _wrap_response(response_message)
 
 
 def _get_metric():
@@ -204,9 +431,7 @@ def _get_metric():
     response_message = GetMetric.Response()
     metric = _get_store().get_metric(request_message.run_uuid, request_message.metric_key)
     response_message.metric.MergeFrom(metric.to_proto())
-    response = Response(mimetype='application/json')
-    response.set_data(MessageToJson(response_message, preserving_proto_field_name=True))
-    return response
+    return _wrap_response(response_message)
 
 
 def _get_param():
@@ -214,18 +439,15 @@ def _get_param():
     response_message = GetParam.Response()
     parameter = _get_store().get_param(request_message.run_uuid, request_message.param_name)
     response_message.parameter.MergeFrom(parameter.to_proto())
-    response = Response(mimetype='application/json')
-    response.set_data(MessageToJson(response_message, preserving_proto_field_name=True))
-    return response
+    return _wrap_response(response_message)
 
 
+@_cache_responses(_get_experiments_version)
 def _list_experiments():
     response_message = ListExperiments.Response()
     experiment_entities = _get_store().list_experiments()
     response_message.experiments.extend([e.to_proto() for e in experiment_entities])
-    response = Response(mimetype='application/json')
-    response.set_data(MessageToJson(response_message, preserving_proto_field_name=True))
-    return response
+    return _wrap_response(response_message)
 
 
 def _get_artifact_repo(run):
@@ -270,11 +492,13 @@ HANDLERS = {
     UpdateRun: _update_run,
     LogParam: _log_param,
     LogMetric: _log_metric,
+    LogBatch: _log_batch,
     GetRun: _get_run,
     SearchRuns: _search_runs,
     ListArtifacts: _list_artifacts,
     GetArtifact: _get_artifact,
     GetMetricHistory: _get_metric_history,
+    GetMetricHistoryBulk: _get_metric_history_bulk,
     ListExperiments: _list_experiments,
     GetParam: _get_param,
     GetMetric: _get_metric,
@@ -0,0 +1,55 @@
+import collections
+import threading
+
+
+CachedResponse = collections.namedtuple("CachedResponse", ["version", "etag", "mimetype", "data",
+                                                           "cache_control"])
+
+
+class ResponseCache(object):
+    """
+    Thread-safe in-memory cache of serialized responses of the tracking server, evicting the
+    least recently used entries once their total size exceeds a maximum.
+
+    Each entry records the version of the data it was computed from, which the caller compares
+    with the current version before serving it, so that entries are only served while the data
+    is unchanged. Callers do not cache responses for which there is no version.
+
+    :param max_size_bytes: Total size of the cached response bodies above which the least
+                           recently used entries are evicted.
+    """
+
+    def __init__(self, max_size_bytes):
+        self.max_size_bytes = max_size_bytes
+        self._entries = collections.OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """
+        :return: The `CachedResponse` stored under `key`, or None if there is none.
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                # Mark the entry as recently used
+                self._entries[key] = entry
+            return entry
+
+    def put(self, key, entry):
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous.data)
+            if len(entry.data) > self.max_size_bytes:
+                return
+            self._entries[key] = entry
+            self._size += len(entry.data)
+            while self._size > self.max_size_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.data)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
@@ -54,6 +54,16 @@ class AbstractStore:
         """
         pass
 
+    def get_run_info_by_uuid(self, run_uuid):
+        """
+        Fetches the run information and tags of the run, without its metrics and params. Stores
+        that can read them separately override this to avoid reading the whole run.
+
+        :param run_uuid: Unique identifier for the run
+        :return: RunInfo of the run if it exists, otherwise raises an Exception
+        """
+        return self.get_run(run_uuid).info
+
     def update_run_info(self, run_uuid, run_status, end_time):
         """
         Updates the metadata of the specified run.
@@ -90,6 +100,37 @@ class AbstractStore:
         """
         pass
 
+    def log_batch(self, run_uuid, metrics, params, tags):
+        """
+        Logs multiple metrics, params and tags for the specified run in a single operation.
+        Defaults to logging each metric and param in turn; stores that support tags or a cheaper
+        batch operation override it.
+        :param run_uuid: String id for the run
+        :param metrics: List of Metric instances to log. A metric key may appear several times.
+        :param params: List of Param instances to log
+        :param tags: List of RunTag instances to set on the run
+        """
+        if len(tags) > 0:
+            raise Exception("%s does not support setting tags" % type(self).__name__)
+        for metric in metrics:
+            self.log_metric(run_uuid, metric)
+        for param in params:
+            self.log_param(run_uuid, param)
+
+    def get_change_token(self, experiment_ids=None, include_run_data=True):
+        """
+        Returns an opaque token that changes whenever experiments are created or modified, or the
+        runs of the given experiments are written, including by other processes, so that results
+        read from the store can be cached until it changes.
+
+        :param experiment_ids: IDs of the experiments whose runs the results depend on.
+        :param include_run_data: Whether the results depend on the metrics and params of the runs,
+                                 rather than only on their run information and tags.
+        :return: String token, or None if the store does not track its changes, in which case
+                 results must not be cached.
+        """
+        return None
+
     @abstractmethod
     def get_metric(self, run_uuid, metric_key):
         """
@@ -115,37 +156,84 @@ class AbstractStore:
         pass
 
     @abstractmethod
-    def get_metric_history(self, run_uuid, metric_key):
+    def get_metric_history(self, run_uuid, metric_key, start_ts=None, end_ts=None,
+                           max_points=None, aggregation=None):
         """
         Returns all logged value for a given metric.
 
         :param run_uuid: Unique identifier for run
         :param metric_key: Metric name within the run
+        :param start_ts: If specified, only values logged at or after this timestamp are returned
+        :param end_ts: If specified, only values logged at or before this timestamp are returned
+        :param max_points: If specified, the history is downsampled to at most this many values
+        :param aggregation: How values are aggregated when downsampling, one of "mean" (the
+                            default), "min", "max" or "lttb". See
+                            :py:func:`mlflow.utils.downsampling.downsample`.
 
         :return: A list of float values logged for the give metric if logged, else empty list
         """
         pass
 
+    def get_metric_history_bulk(self, run_uuids, metric_keys, start_ts=None, end_ts=None,
+                                max_points=None, aggregation=None):
+        """
+        Returns the histories of several metrics of several runs at once, e.g. to compare runs.
+        By default, reads each run to find the metrics it logged and then each history with
+        `get_metric_history`; stores that can read them at once override this.
+
+        :param run_uuids: List of unique identifiers of runs
+        :param metric_keys: List of metric names. Runs that did not log a metric have no history
+                            for it in the result.
+        :param start_ts: If specified, only values logged at or after this timestamp are returned
+        :param end_ts: If specified, only values logged at or before this timestamp are returned
+        :param max_points: If specified, each history is downsampled to at most this many values
+        :param aggregation: How values are aggregated when downsampling, see
+                            :py:func:`mlflow.utils.downsampling.downsample`
+
+        :return: Dictionary mapping each run UUID to a dictionary mapping each metric name logged
+                 by the run to the list of its logged `Metric` values
+        """
+        histories = {}
+        for run_uuid in run_uuids:
+            logged_keys = set(metric.key for metric in self.get_run(run_uuid).data.metrics)
+            histories[run_uuid] = dict(
+                (key, self.get_metric_history(run_uuid, key, start_ts, end_ts, max_points,
+                                              aggregation))
+                for key in metric_keys if key in logged_keys)
+        return histories
+
     @abstractmethod
-    def search_runs(self, experiment_ids, search_expressions):
+    def search_runs(self, experiment_ids, search_expressions, max_results=None, page_token=None,
+                    order_by=None):
         """
         Returns runs that match the given list of search expressions within the experiments.
         Given multiple search expressions, all these expressions are ANDed together for search.
 
         :param experiment_ids: List of experiment ids to scope the search
         :param search_expression: list of search expressions
+        :param max_results: Maximum number of runs to return. If None, all matching runs are
+                            returned.
+        :param page_token: Token returned with a previous page of results, to get the next page.
+        :param order_by: List of RunInfo attributes to order runs by, each optionally followed by
+                         "ASC" or "DESC". Defaults to ["start_time DESC"].
 
-        :return: A list of Run objects that satisfy the search expressions
+        :return: A PagedList of Run objects that satisfy the search expressions, whose `token`
+                 can be passed as `page_token` to get the next page.
         """
         pass
 
     @abstractmethod
-    def list_run_infos(self, experiment_id):
+    def list_run_infos(self, experiment_id, max_results=None, page_token=None, order_by=None):
         """
         Returns run information for runs which belong to the experiment_id
 
         :param experiment_id: The experiment id which to search.
+        :param max_results: Maximum number of runs to return. If None, all runs are returned.
+        :param page_token: Token returned with a previous page of results, to get the next page.
+        :param order_by: List of RunInfo attributes to order runs by, each optionally followed by
+                         "ASC" or "DESC". Defaults to ["start_time DESC"].
 
-        :return: A list of RunInfo objects that satisfy the search expressions
+        :return: A PagedList of RunInfo objects, whose `token` can be passed as `page_token` to
+                 get the next page.
         """
         pass
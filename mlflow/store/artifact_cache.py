@@ -0,0 +1,189 @@
+import hashlib
+import json
+import os
+import shutil
+import stat
+import tempfile
+import time
+
+from mlflow.utils.env import get_env
+from mlflow.utils.logging_utils import eprint
+
+
+_CACHE_DIR_ENV_VAR = "MLFLOW_ARTIFACT_CACHE_DIR"
+_MAX_SIZE_ENV_VAR = "MLFLOW_ARTIFACT_CACHE_MAX_SIZE"
+
+_DEFAULT_MAX_SIZE = 5 * 1024 * 1024 * 1024
+
+# Directories of the cache under construction or being deleted are hidden behind this prefix
+_TMP_PREFIX = ".tmp-"
+# Partial downloads of crashed processes older than this many seconds are deleted on eviction
+_STALE_TMP_AGE = 24 * 60 * 60
+_ENTRY_METADATA_FILE_NAME = ".mlflow_cache_entry"
+# Entries used less than this many seconds ago are not evicted, since a process may still be
+# reading them
+_EVICTION_GRACE_PERIOD = 10 * 60
+
+
+def _get_default_cache_dir():
+    cache_home = get_env("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "mlflow", "artifacts")
+
+
+def get_artifact_cache():
+    """
+    Returns the artifact cache configured through the MLFLOW_ARTIFACT_CACHE_DIR (defaulting to
+    ``mlflow/artifacts`` under the user's cache directory, i.e. ``$XDG_CACHE_HOME`` or
+    ``~/.cache``) and MLFLOW_ARTIFACT_CACHE_MAX_SIZE (in bytes, 5GB by default) environment
+    variables, or None if caching is disabled by a maximum size of 0.
+    """
+    max_size = int(get_env(_MAX_SIZE_ENV_VAR) or _DEFAULT_MAX_SIZE)
+    if max_size <= 0:
+        return None
+    cache_dir = get_env(_CACHE_DIR_ENV_VAR) or _get_default_cache_dir()
+    return ArtifactCache(cache_dir, max_size)
+
+
+class ArtifactCache(object):
+    """
+    On-disk cache of downloaded artifacts, shared by all processes using the same directory.
+
+    Entries are addressed by the name of the artifact and the manifest of the remote objects it is
+    made of (their relative paths, sizes and ETags), so an artifact that changes remotely gets a
+    new entry instead of being served stale, and identical artifacts are downloaded only once.
+
+    An entry is downloaded into a hidden temporary directory and then atomically renamed into
+    place, so other processes never observe partially downloaded artifacts; when several processes
+    populate the same entry concurrently, the first rename wins and the others discard their copy.
+    Once the total size of the entries exceeds the maximum size, the least recently used ones are
+    evicted. Entries are not locked while they are read, so an entry returned to a process can be
+    evicted by another one; entries used in the last ten minutes are never evicted, which leaves
+    time to e.g. load a model, but a process reading an entry for longer may see it disappear.
+
+    Since cached artifacts such as pickled models are executed when loaded, the cache directory is
+    created readable and writable only by its owner, and directories owned by another user or
+    writable by anyone are refused.
+
+    :param cache_dir: Directory holding the cache entries.
+    :param max_size_bytes: Total size of the entries above which the least recently used ones are
+                           evicted.
+    """
+
+    def __init__(self, cache_dir, max_size_bytes):
+        self.cache_dir = cache_dir
+        self.max_size_bytes = max_size_bytes
+
+    @staticmethod
+    def _get_entry_key(name, manifest):
+        data = json.dumps([name, sorted(manifest)]).encode("utf-8")
+        return hashlib.sha256(data).hexdigest()
+
+    @staticmethod
+    def _is_valid_entry(entry_dir, name, manifest):
+        """ Checks that the files of an entry are all present with their expected sizes. """
+        for rel_path, size, _ in manifest:
+            path = os.path.join(entry_dir, name, *rel_path.split("/")) if rel_path \
+                else os.path.join(entry_dir, name)
+            if not os.path.isfile(path) or os.path.getsize(path) != size:
+                return False
+        return True
+
+    def get_or_download(self, name, manifest, download_fn):
+        """
+        Returns the local path of a cached artifact, downloading it first if it is not cached.
+
+        :param name: Base name of the artifact.
+        :param manifest: List of (path relative to the artifact, size, ETag) tuples describing
+                         each remote object of the artifact, with an empty relative path for an
+                         artifact consisting of a single file.
+        :param download_fn: Function downloading the artifact into the directory it is passed,
+                            under the artifact's base name.
+        :return: Local path of the artifact, named after its base name.
+        """
+        self._ensure_cache_dir()
+        key = self._get_entry_key(name, manifest)
+        entry_dir = os.path.join(self.cache_dir, key)
+        if os.path.isdir(entry_dir):
+            if self._is_valid_entry(entry_dir, name, manifest):
+                # Mark the entry as recently used
+                os.utime(entry_dir, None)
+                return os.path.join(entry_dir, name)
+            eprint("WARNING: Discarding corrupted artifact cache entry %s" % entry_dir)
+            self._remove_entry(key)
+        tmp_dir = tempfile.mkdtemp(dir=self.cache_dir, prefix=_TMP_PREFIX)
+        try:
+            download_fn(tmp_dir)
+            with open(os.path.join(tmp_dir, _ENTRY_METADATA_FILE_NAME), "w") as f:
+                json.dump({"size": sum(size for _, size, _ in manifest)}, f)
+            try:
+                os.rename(tmp_dir, entry_dir)
+            except OSError:
+                # Another process populated the entry first: use its copy
+                if not os.path.isdir(entry_dir):
+                    raise
+        finally:
+            if os.path.exists(tmp_dir):
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+        self._evict(keep=key)
+        return os.path.join(entry_dir, name)
+
+    def _ensure_cache_dir(self):
+        """
+        Creates the cache directory if needed, and checks that no other user can have written
+        entries into it.
+        """
+        if not os.path.isdir(self.cache_dir):
+            try:
+                os.makedirs(self.cache_dir, 0o700)
+            except OSError:
+                # Another process created it concurrently
+                if not os.path.isdir(self.cache_dir):
+                    raise
+        dir_stat = os.stat(self.cache_dir)
+        if hasattr(os, "getuid") and dir_stat.st_uid != os.getuid():
+            raise Exception("Refusing to use artifact cache directory %s, which is owned by "
+                            "another user. Set MLFLOW_ARTIFACT_CACHE_DIR to a directory of your "
+                            "own." % self.cache_dir)
+        if dir_stat.st_mode & stat.S_IWOTH:
+            raise Exception("Refusing to use artifact cache directory %s, which is writable by "
+                            "all users. Set MLFLOW_ARTIFACT_CACHE_DIR to a directory of your "
+                            "own." % self.cache_dir)
+
+    def _remove_entry(self, key):
+        # Hide the entry with an atomic rename first, so it is never seen partially deleted
+        tmp_dir = os.path.join(self.cache_dir, "%s%s-%s" % (_TMP_PREFIX, key, os.getpid()))
+        try:
+            os.rename(os.path.join(self.cache_dir, key), tmp_dir)
+        except OSError:
+            # Already removed by another process
+            return
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def _evict(self, keep):
+        """
+        Removes the least recently used entries, other than `keep`, until the total size of the
+        entries is at most the maximum size of the cache.
+        """
+        entries = []
+        total_size = 0
+        now = time.time()
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            try:
+                if name.startswith(_TMP_PREFIX):
+                    if now - os.path.getmtime(path) > _STALE_TMP_AGE:
+                        shutil.rmtree(path, ignore_errors=True)
+                    continue
+                with open(os.path.join(path, _ENTRY_METADATA_FILE_NAME)) as f:
+                    size = json.load(f)["size"]
+                entries.append((os.path.getmtime(path), name, size))
+            except (IOError, OSError, ValueError):
+                # Concurrently removed by another process
+                continue
+            total_size += size
+        for last_used, name, size in sorted(entries):
+            if total_size <= self.max_size_bytes or now - last_used < _EVICTION_GRACE_PERIOD:
+                break
+            if name != keep:
+                self._remove_entry(name)
+                total_size -= size
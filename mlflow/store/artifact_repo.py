@@ -3,12 +3,26 @@ import shutil
 from six.moves import urllib
 from distutils import dir_util
 import os
+import threading
 
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from concurrent.futures import ThreadPoolExecutor
 
 from mlflow.utils.file_utils import (mkdir, exists, list_all, get_relative_path,
                                      get_file_info, build_path, TempDir)
 from mlflow.entities.file_info import FileInfo
+from mlflow.store.artifact_cache import get_artifact_cache
+from mlflow.utils.env import get_env
+
+
+_S3_MAX_CONCURRENCY_ENV_VAR = "MLFLOW_S3_MAX_CONCURRENCY"
+_S3_MULTIPART_THRESHOLD_ENV_VAR = "MLFLOW_S3_MULTIPART_THRESHOLD"
+_S3_MULTIPART_CHUNKSIZE_ENV_VAR = "MLFLOW_S3_MULTIPART_CHUNKSIZE"
+
+_DEFAULT_S3_MAX_CONCURRENCY = 10
+_DEFAULT_S3_MULTIPART_SIZE = 8 * 1024 * 1024
 
 
 class ArtifactRepository:
@@ -62,8 +76,28 @@ class ArtifactRepository:
         :param path: Relative source path to the desired artifact
         :return: Full path desired artifact.
         """
-        # TODO: Probably need to add a more efficient method to stream just a single artifact
-        # without downloading it, or to get a pre-signed URL for cloud storage.
+        pass
+
+    @abstractmethod
+    def get_artifact_size(self, artifact_path):
+        """
+        Return the size in bytes of an artifact file, without downloading it.
+        :param artifact_path: Relative source path to the desired artifact file
+        :return: Size of the artifact in bytes.
+        """
+        pass
+
+    @abstractmethod
+    def open_artifact(self, artifact_path, start=0, end=None):
+        """
+        Open an artifact file for streaming reads, without downloading it to local disk first.
+        :param artifact_path: Relative source path to the desired artifact file
+        :param start: Offset of the first byte to read
+        :param end: Offset one past the last byte to read, or None to read until the end of the
+                    artifact
+        :return: Binary file-like object supporting ``read(size)`` and ``close()``, yielding the
+                 requested byte range of the artifact.
+        """
         pass
 
     @staticmethod
@@ -107,9 +141,46 @@ class LocalArtifactRepository(ArtifactRepository):
         """Since this is a local file store, just return the artifacts' local path."""
         return build_path(self.artifact_uri, artifact_path)
 
+    def get_artifact_size(self, artifact_path):
+        return os.path.getsize(build_path(self.artifact_uri, artifact_path))
+
+    def open_artifact(self, artifact_path, start=0, end=None):
+        f = open(build_path(self.artifact_uri, artifact_path), "rb")
+        f.seek(start)
+        if end is None:
+            return f
+        return _BoundedReader(f, end - start)
+
 
 class S3ArtifactRepository(ArtifactRepository):
-    """Stores artifacts on Amazon S3."""
+    """
+    Stores artifacts on Amazon S3.
+
+    Files are transferred concurrently by a pool of threads sharing a single S3 client, and files
+    larger than the multipart threshold are split into parts that are themselves transferred
+    concurrently. Both can be tuned through the arguments below, which default to the values of
+    the MLFLOW_S3_MAX_CONCURRENCY, MLFLOW_S3_MULTIPART_THRESHOLD and MLFLOW_S3_MULTIPART_CHUNKSIZE
+    environment variables (in bytes for the latter two), or to 10 threads and 8MB otherwise.
+
+    :param max_concurrency: Maximum number of files, and of parts of a file, transferred at once.
+    :param multipart_threshold: Size from which files are transferred in multiple parts.
+    :param multipart_chunksize: Size of each part of a multipart transfer.
+    """
+
+    def __init__(self, artifact_uri, max_concurrency=None, multipart_threshold=None,
+                 multipart_chunksize=None):
+        super(S3ArtifactRepository, self).__init__(artifact_uri)
+        self.max_concurrency = max_concurrency or \
+            int(get_env(_S3_MAX_CONCURRENCY_ENV_VAR) or _DEFAULT_S3_MAX_CONCURRENCY)
+        multipart_threshold = multipart_threshold or \
+            int(get_env(_S3_MULTIPART_THRESHOLD_ENV_VAR) or _DEFAULT_S3_MULTIPART_SIZE)
+        multipart_chunksize = multipart_chunksize or \
+            int(get_env(_S3_MULTIPART_CHUNKSIZE_ENV_VAR) or _DEFAULT_S3_MULTIPART_SIZE)
+        self._transfer_config = TransferConfig(multipart_threshold=multipart_threshold,
+                                               multipart_chunksize=multipart_chunksize,
+                                               max_concurrency=self.max_concurrency)
+        self._client = None
+        self._client_lock = threading.Lock()
 
     @staticmethod
     def parse_s3_uri(uri):
@@ -122,27 +193,61 @@ class S3ArtifactRepository(ArtifactRepository):
             path = path[1:]
         return parsed.netloc, path
 
+    def _get_s3_client(self):
+        """
+        Returns the S3 client used for all requests of this repository. boto3 clients are
+        thread-safe, so a single one is shared by all transfer threads, which also lets them share
+        its connection pool. The pool is sized for up to ``max_concurrency`` files transferred at
+        once, each in up to ``max_concurrency`` parts, rather than botocore's default of 10
+        connections, which would make the transfer threads wait for each other.
+        """
+        with self._client_lock:
+            if self._client is None:
+                config = Config(max_pool_connections=self.max_concurrency * self.max_concurrency)
+                self._client = boto3.client('s3', config=config)
+            return self._client
+
+    def _run_transfers(self, transfer_fn, transfers):
+        """
+        Calls ``transfer_fn`` on each tuple of arguments in ``transfers`` using up to
+        ``max_concurrency`` threads, and raises the first exception raised by any call.
+        """
+        if len(transfers) <= 1:
+            for args in transfers:
+                transfer_fn(*args)
+            return
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(transfers))) as pool:
+            futures = [pool.submit(transfer_fn, *args) for args in transfers]
+            for future in futures:
+                future.result()
+
+    def _upload_file(self, local_file, bucket, key):
+        self._get_s3_client().upload_file(local_file, bucket, key, Config=self._transfer_config)
+
+    def _download_file(self, bucket, key, local_path):
+        self._get_s3_client().download_file(bucket, key, local_path, Config=self._transfer_config)
+
     def log_artifact(self, local_file, artifact_path=None):
         (bucket, dest_path) = self.parse_s3_uri(self.artifact_uri)
         if artifact_path:
             dest_path = build_path(dest_path, artifact_path)
         dest_path = build_path(dest_path, os.path.basename(local_file))
-
-        boto3.client('s3').upload_file(local_file, bucket, dest_path)
+        self._upload_file(local_file, bucket, dest_path)
 
     def log_artifacts(self, local_dir, artifact_path=None):
         (bucket, dest_path) = self.parse_s3_uri(self.artifact_uri)
         if artifact_path:
             dest_path = build_path(dest_path, artifact_path)
-        s3 = boto3.client('s3')
         local_dir = os.path.abspath(local_dir)
+        uploads = []
         for (root, _, filenames) in os.walk(local_dir):
             upload_path = dest_path
             if root != local_dir:
                 rel_path = get_relative_path(local_dir, root)
                 upload_path = build_path(dest_path, rel_path)
             for f in filenames:
-                s3.upload_file(build_path(root, f), bucket, build_path(upload_path, f))
+                uploads.append((build_path(root, f), bucket, build_path(upload_path, f)))
+        self._run_transfers(self._upload_file, uploads)
 
     def list_artifacts(self, path=None):
         (bucket, artifact_path) = self.parse_s3_uri(self.artifact_uri)
@@ -151,7 +256,7 @@ class S3ArtifactRepository(ArtifactRepository):
             dest_path = build_path(dest_path, path)
         infos = []
         prefix = dest_path + "/"
-        paginator = boto3.client('s3').get_paginator("list_objects_v2")
+        paginator = self._get_s3_client().get_paginator("list_objects_v2")
         results = paginator.paginate(Bucket=bucket, Prefix=prefix, Delimiter='/')
         for result in results:
             # Subdirectories will be listed as "common prefixes" due to the way we made the request
@@ -167,23 +272,100 @@ class S3ArtifactRepository(ArtifactRepository):
                 infos.append(FileInfo(name, False, size))
         return sorted(infos, key=lambda f: f.path)
 
+    def _get_s3_path(self, artifact_path):
+        (bucket, s3_path) = self.parse_s3_uri(self.artifact_uri)
+        return bucket, build_path(s3_path, artifact_path)
+
+    def get_artifact_size(self, artifact_path):
+        (bucket, s3_path) = self._get_s3_path(artifact_path)
+        return int(self._get_s3_client().head_object(Bucket=bucket, Key=s3_path)["ContentLength"])
+
+    def open_artifact(self, artifact_path, start=0, end=None):
+        (bucket, s3_path) = self._get_s3_path(artifact_path)
+        kwargs = {}
+        if start > 0 or end is not None:
+            # HTTP byte ranges are inclusive of their last byte
+            kwargs["Range"] = "bytes=%s-%s" % (start, "" if end is None else end - 1)
+        return self._get_s3_client().get_object(Bucket=bucket, Key=s3_path, **kwargs)["Body"]
+
+    def _list_artifact_objects(self, artifact_path):
+        """
+        Lists the S3 objects making up an artifact file or directory, listing every object under
+        a directory at once rather than one directory at a time.
+
+        :return: List of (S3 key, path relative to the artifact, size, ETag) tuples, with an empty
+                 relative path for an artifact that is a single file.
+        """
+        (bucket, s3_path) = self._get_s3_path(artifact_path)
+        prefix = s3_path + "/"
+        objects = []
+        paginator = self._get_s3_client().get_paginator("list_objects_v2")
+        for result in paginator.paginate(Bucket=bucket, Prefix=prefix):
+            for obj in result.get("Contents", []):
+                rel_path = obj.get("Key")[len(prefix):]
+                # Skip the placeholder objects some tools create for directories
+                if rel_path != "" and not rel_path.endswith("/"):
+                    objects.append((obj.get("Key"), rel_path, int(obj.get("Size")),
+                                    obj.get("ETag")))
+        if len(objects) > 0:
+            return objects
+        metadata = self._get_s3_client().head_object(Bucket=bucket, Key=s3_path)
+        return [(s3_path, "", int(metadata["ContentLength"]), metadata.get("ETag"))]
+
     def download_artifacts(self, artifact_path):
-        with TempDir(remove_on_exit=False) as tmp:
-            return self._download_artifacts_into(artifact_path, tmp.path())
-
-    def _download_artifacts_into(self, artifact_path, dest_dir):
-        """Private version of download_artifacts that takes a destination directory."""
-        basename = os.path.basename(artifact_path)
-        local_path = build_path(dest_dir, basename)
-        listing = self.list_artifacts(artifact_path)
-        if len(listing) > 0:
-            # Artifact_path is a directory, so make a directory for it and download everything
-            os.mkdir(local_path)
-            for file_info in listing:
-                self._download_artifacts_into(file_info.path, local_path)
-        else:
-            (bucket, s3_path) = self.parse_s3_uri(self.artifact_uri)
-            s3_path = build_path(s3_path, artifact_path)
-            boto3.client('s3').download_file(bucket, s3_path, local_path)
+        """
+        Downloads the artifact into the local artifact cache (see
+        :py:func:`mlflow.store.artifact_cache.get_artifact_cache`) unless it is already cached, or
+        into a new temporary directory if caching is disabled.
+        """
+        objects = self._list_artifact_objects(artifact_path)
+        name = os.path.basename(artifact_path)
+        cache = get_artifact_cache()
+        if cache is None:
+            with TempDir(remove_on_exit=False) as tmp:
+                return self._download_objects_into(name, objects, tmp.path())
+        # Without ETags the objects' contents are unknown, so only trust entries from this location
+        manifest = [(rel_path, size, etag or "%s/%s" % (self.artifact_uri, key))
+                    for key, rel_path, size, etag in objects]
+        return cache.get_or_download(
+            name, manifest, lambda dest_dir: self._download_objects_into(name, objects, dest_dir))
+
+    def _download_objects_into(self, name, objects, dest_dir):
+        """Downloads the objects listed by `_list_artifact_objects` to `dest_dir`/`name`."""
+        (bucket, _) = self.parse_s3_uri(self.artifact_uri)
+        local_path = build_path(dest_dir, name)
+        if len(objects) == 1 and objects[0][1] == "":
+            self._download_file(bucket, objects[0][0], local_path)
+            return local_path
+        # The artifact is a directory, so recreate its tree locally and download everything
+        downloads = [(bucket, key, os.path.join(local_path, *rel_path.split("/")))
+                     for key, rel_path, _, _ in objects]
+        for parent_dir in set(os.path.dirname(file_path) for _, _, file_path in downloads):
+            if not os.path.exists(parent_dir):
+                os.makedirs(parent_dir)
+        self._run_transfers(self._download_file, downloads)
         return local_path
 
+
+class _BoundedReader(object):
+    """Binary file-like object reading at most `length` bytes from an underlying file."""
+
+    def __init__(self, f, length):
+        self._file = f
+        self._remaining = length
+
+    def read(self, size=-1):
+        if size is None or size < 0 or size > self._remaining:
+            size = self._remaining
+        data = self._file.read(size)
+        self._remaining -= len(data)
+        return data
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
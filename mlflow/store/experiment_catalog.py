@@ -0,0 +1,107 @@
+import json
+import os
+
+from mlflow.utils.file_utils import FileLock, atomic_write, build_path, exists
+
+
+class ExperimentCatalog(object):
+    """
+    Index of the experiments of a `FileStore`, mapping each experiment name to its ID and holding
+    the next ID to allocate, so that experiments are created and looked up by name without reading
+    the metadata of every experiment.
+
+    The catalog is a JSON file in the store's root directory, replaced atomically on each update so
+    that readers, which never lock, always see a complete version. Updates are serialized across
+    processes (e.g. the workers of a tracking server) by an exclusive lock on a separate file.
+    The parsed catalog is cached, and only read again once the file is replaced.
+
+    A missing catalog, e.g. in a store written by an earlier version of MLflow, is built from the
+    experiment directories. So is a catalog found to be stale when the ID it allocates is already
+    taken by an experiment directory created without it.
+
+    :param root_directory: Root directory of the store.
+    :param load_experiments: Function returning all the `Experiment` objects of the store, read
+                             from their directories.
+    """
+
+    CATALOG_FILE_NAME = ".experiment_catalog"
+    LOCK_FILE_NAME = ".experiment_catalog.lock"
+
+    def __init__(self, root_directory, load_experiments):
+        self.root_directory = root_directory
+        self._load_experiments = load_experiments
+        self._catalog_path = build_path(root_directory, ExperimentCatalog.CATALOG_FILE_NAME)
+        self._lock_path = build_path(root_directory, ExperimentCatalog.LOCK_FILE_NAME)
+        self._signature = None
+        self._names = {}
+        self._next_id = 0
+
+    def _read(self):
+        """ Re-reads the catalog if it was replaced since it was last read. """
+        try:
+            stat = os.stat(self._catalog_path)
+        except OSError:
+            return False
+        signature = (stat.st_ino, stat.st_mtime, stat.st_size)
+        if signature != self._signature:
+            with open(self._catalog_path, "r") as f:
+                catalog = json.load(f)
+            self._names = catalog["names"]
+            self._next_id = catalog["next_id"]
+            self._signature = signature
+        return True
+
+    def _write(self):
+        with atomic_write(self._catalog_path) as f:
+            json.dump({"names": self._names, "next_id": self._next_id}, f)
+        self._signature = None
+
+    def _rebuild(self):
+        experiments = self._load_experiments()
+        self._names = dict((experiment.name, experiment.experiment_id)
+                           for experiment in experiments)
+        ids = [int(experiment.experiment_id) for experiment in experiments]
+        self._next_id = max(ids) + 1 if len(ids) > 0 else 0
+        self._write()
+
+    def get_experiment_id(self, name):
+        """
+        :return: ID of the experiment named `name`, or None if there is none.
+        """
+        if not self._read():
+            with FileLock(self._lock_path):
+                if not self._read():
+                    self._rebuild()
+                    self._read()
+        return self._names.get(name)
+
+    def create_experiment(self, name, create_fn, experiment_id=None, exist_ok=False):
+        """
+        Allocates an ID for a new experiment and records it in the catalog, holding the lock
+        while the experiment is created so that concurrent creations get distinct IDs and names.
+
+        :param name: Name of the experiment.
+        :param create_fn: Function creating the experiment given its name and ID.
+        :param experiment_id: ID of the experiment, allocated from the catalog if unset.
+        :param exist_ok: If True and `experiment_id` is given, an experiment with the same name and
+                         ID, e.g. created concurrently by another process, is not an error.
+        :return: ID of the created experiment.
+        """
+        with FileLock(self._lock_path):
+            if not self._read():
+                self._rebuild()
+            if experiment_id is None:
+                experiment_id = self._next_id
+                if exists(build_path(self.root_directory, str(experiment_id))):
+                    self._rebuild()
+                    experiment_id = self._next_id
+            if name in self._names:
+                if exist_ok and experiment_id is not None and \
+                        str(self._names[name]) == str(experiment_id):
+                    return experiment_id
+                raise Exception("Experiment '%s' already exists." % name)
+            create_fn(name, experiment_id)
+            self._names[name] = experiment_id
+            self._next_id = max(self._next_id, int(experiment_id) + 1)
+            self._write()
+        return experiment_id
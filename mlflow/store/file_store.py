@@ -1,6 +1,8 @@
+import json
 import os
 
 import uuid
+from multiprocessing.pool import ThreadPool
 
 from mlflow.entities.experiment import Experiment
 from mlflow.entities.metric import Metric
@@ -8,18 +10,29 @@ from mlflow.entities.param import Param
 from mlflow.entities.run import Run
 from mlflow.entities.run_data import RunData
 from mlflow.entities.run_info import RunInfo
+from mlflow.entities.run_tag import RunTag
 
 from mlflow.entities.run_status import RunStatus
 from mlflow.store.abstract_store import AbstractStore
-
+from mlflow.store.experiment_catalog import ExperimentCatalog
+from mlflow.store.metric_files import (METRIC_FORMATS, TEXT_FORMAT, append_metric_values,
+                                       read_latest_metric_value, read_metric_history)
+from mlflow.store.paged_list import PagedList
+from mlflow.store.pagination import paginate_run_infos
+from mlflow.store.search_index import ExperimentSearchIndex
+
+from mlflow.utils.downsampling import downsample
 from mlflow.utils.env import get_env
 from mlflow.utils.file_utils import (is_directory, list_subdirs, mkdir, exists,
                                      write_yaml, read_yaml, find, read_file,
-                                     list_files, build_path, write_to, append_to)
-
-from mlflow.utils.search_utils import does_run_match_clause
+                                     list_files, build_path, write_to, append_to,
+                                     atomic_write, FileLock, TMP_FILE_PREFIX, YamlCodec,
+                                     get_metadata_codec)
 
 _TRACKING_DIR_ENV_VAR = "MLFLOW_TRACKING_DIR"
+_METRIC_FORMAT_ENV_VAR = "MLFLOW_FILE_STORE_METRIC_FORMAT"
+_LATEST_METRICS_ENV_VAR = "MLFLOW_FILE_STORE_LATEST_METRICS"
+_METADATA_FORMAT_ENV_VAR = "MLFLOW_FILE_STORE_METADATA_FORMAT"
 
 
 def _default_root_dir():
@@ -31,21 +44,88 @@ class FileStore(AbstractStore):
     METRICS_FOLDER_NAME = "metrics"
     PARAMS_FOLDER_NAME = "params"
     META_DATA_FILE_NAME = "meta.yaml"
-
-    def __init__(self, root_directory=None, artifact_root_uri=None):
+    META_DATA_LOCK_FILE_NAME = ".meta.yaml.lock"
+    RUN_INDEX_FILE_NAME = ".run_index"
+    LATEST_METRICS_FILE_NAME = ".latest_metrics"
+    CHANGE_TOKEN_FILE_NAME = ".change_token"
+    RUN_DATA_CHANGE_TOKEN_FILE_NAME = ".run_data_change_token"
+    # Maximum number of metric files read at once by get_metric_history_bulk
+    BULK_READ_CONCURRENCY = 8
+
+    def __init__(self, root_directory=None, artifact_root_uri=None, metric_format=None,
+                 write_latest_metrics=None, metadata_format=None, read_only=False):
         """
         Create a new FileStore with the given root directory and a given default artifact root URI.
+
+        :param metric_format: Format of new metric files, either "text" or "binary" (see
+                              :py:mod:`mlflow.store.metric_files`). Defaults to the value of the
+                              MLFLOW_FILE_STORE_METRIC_FORMAT environment variable, or "text".
+                              Files in either format can always be read, and text files are
+                              converted when values are logged to them in the binary format.
+        :param write_latest_metrics: If True, logging metrics also maintains a summary of the
+                                     latest value of each metric of the run, so that reading a
+                                     run opens a single file rather than one per metric. Defaults
+                                     to whether the MLFLOW_FILE_STORE_LATEST_METRICS environment
+                                     variable is set to "true". Summaries are used whenever they
+                                     exist, and entries that are out of date are ignored.
+        :param metadata_format: Format in which experiment and run metadata is written, either
+                                "yaml" or "json". JSON is much faster to parse when listing runs,
+                                and still valid YAML, so that earlier versions of MLflow can read
+                                it. Defaults to the value of the MLFLOW_FILE_STORE_METADATA_FORMAT
+                                environment variable, or "yaml". Metadata in either format can
+                                always be read.
+        :param read_only: If True, the store never writes to the root directory, which must
+                          exist: the default experiment and the index files that reads maintain
+                          are not created, and logging or creating experiments and runs raises
+                          an exception. Used to read a store, e.g. to export it, without
+                          modifying it.
         """
         super(FileStore, self).__init__()
         self.root_directory = root_directory or _default_root_dir()
         self.artifact_root_uri = artifact_root_uri or self.root_directory
+        self.metric_format = metric_format or get_env(_METRIC_FORMAT_ENV_VAR) or TEXT_FORMAT
+        if self.metric_format not in METRIC_FORMATS:
+            raise Exception("Invalid metric format '%s'. Expected one of %s."
+                            % (self.metric_format, ", ".join(METRIC_FORMATS)))
+        self.metadata_format = (metadata_format or get_env(_METADATA_FORMAT_ENV_VAR)
+                                or YamlCodec.name)
+        self._metadata_codec = get_metadata_codec(self.metadata_format)
+        if write_latest_metrics is None:
+            write_latest_metrics = (get_env(_LATEST_METRICS_ENV_VAR) or "").lower() == "true"
+        self.write_latest_metrics = write_latest_metrics
+        self.read_only = read_only
+        # Map from run directory --> latest metrics summary last written by this store
+        self._latest_metrics = {}
+        # In-memory view of the on-disk run index, mapping run UUID -> experiment ID, along with
+        # the number of bytes of the index file consumed so far.
+        self._run_index = {}
+        self._run_index_offset = 0
+        # Cache of run UUID -> (meta.yaml stat signature, RunInfo), so that logging calls and
+        # repeated reads do not re-parse run metadata that has not changed on disk.
+        self._run_info_cache = {}
+        # Map from experiment ID --> ExperimentSearchIndex summarizing the experiment's runs
+        self._search_indexes = {}
+        # Index of experiment names and IDs
+        self._experiment_catalog = ExperimentCatalog(self.root_directory, self.list_experiments)
+        if read_only:
+            self._check_root_dir()
+            return
         # Create root directory if needed
         if not exists(self.root_directory):
-            mkdir(self.root_directory)
-        # Create default experiment if needed
+            try:
+                mkdir(self.root_directory)
+            except OSError:
+                # Created concurrently by another process
+                if not is_directory(self.root_directory):
+                    raise
+        # Create default experiment if needed. Other processes may be creating it concurrently,
+        # which the catalog checks again under its lock.
         if not self._has_experiment(experiment_id=Experiment.DEFAULT_EXPERIMENT_ID):
-            self._create_experiment_with_id(name="Default",
-                                            experiment_id=Experiment.DEFAULT_EXPERIMENT_ID)
+            self._experiment_catalog.create_experiment(
+                "Default", self._create_experiment_with_id,
+                experiment_id=Experiment.DEFAULT_EXPERIMENT_ID, exist_ok=True)
+        if not exists(self._get_change_token_path()):
+            self._record_change()
 
     def _check_root_dir(self):
         """
@@ -56,6 +136,10 @@ class FileStore(AbstractStore):
         if not is_directory(self.root_directory):
             raise Exception("'%s' is not a directory." % self.root_directory)
 
+    def _check_writable(self):
+        if self.read_only:
+            raise Exception("Cannot write to the read-only store at '%s'." % self.root_directory)
+
     def _get_experiment_dir(self, experiment_id):
         return build_path(self.root_directory, str(experiment_id))
 
@@ -76,6 +160,42 @@ class FileStore(AbstractStore):
                                    FileStore.ARTIFACTS_FOLDER_NAME)
         return artifacts_dir
 
+    def _get_change_token_path(self, experiment_id=None, run_data=False):
+        directory = self.root_directory if experiment_id is None \
+            else self._get_experiment_dir(experiment_id)
+        return build_path(directory, FileStore.RUN_DATA_CHANGE_TOKEN_FILE_NAME if run_data
+                          else FileStore.CHANGE_TOKEN_FILE_NAME)
+
+    def _record_change(self, experiment_id=None, run_data=False):
+        """
+        Replaces the change token of the experiments, or the one of the runs of `experiment_id`
+        (of their metrics and params if `run_data` is True). Called at the end of every write,
+        after the data is written, so that a reader holding the previous token never misses the
+        write.
+        """
+        write_to(self._get_change_token_path(experiment_id, run_data), uuid.uuid4().hex)
+
+    def get_change_token(self, experiment_ids=None, include_run_data=True):
+        """
+        The token combines the one of the experiments, changed when they are created, and the
+        ones of the runs of each experiment, so that writes to the runs of an experiment do not
+        invalidate results read from other experiments.
+        """
+        try:
+            with open(self._get_change_token_path(), "r") as f:
+                tokens = [f.read()]
+        except (IOError, OSError):
+            return None
+        for experiment_id in experiment_ids or []:
+            for run_data in ([False, True] if include_run_data else [False]):
+                try:
+                    with open(self._get_change_token_path(experiment_id, run_data), "r") as f:
+                        tokens.append(f.read())
+                except (IOError, OSError):
+                    # The runs of the experiment were never written
+                    tokens.append("")
+        return "-".join(tokens)
+
     def list_experiments(self):
         self._check_root_dir()
         return [self.get_experiment(exp_id) for exp_id in list_subdirs(self.root_directory)]
@@ -85,24 +205,22 @@ class FileStore(AbstractStore):
         meta_dir = mkdir(self.root_directory, str(experiment_id))
         artifact_uri = build_path(self.artifact_root_uri, str(experiment_id))
         experiment = Experiment(experiment_id, name, artifact_uri)
-        write_yaml(meta_dir, FileStore.META_DATA_FILE_NAME, dict(experiment))
+        write_yaml(meta_dir, FileStore.META_DATA_FILE_NAME, dict(experiment),
+                   codec=self._metadata_codec)
+        self._record_change()
         return experiment_id
 
     def create_experiment(self, name):
         self._check_root_dir()
+        self._check_writable()
         if name is None or name == "":
             raise Exception("Invalid experiment name '%s'" % name)
-        experiment = self.get_experiment_by_name(name)
-        if experiment is not None:
-            raise Exception("Experiment '%s' already exists." % experiment.name)
-        # Get all existing experiments and find the one with largest ID.
-        # len(list_all(..)) would not work when experiments are deleted.
-        experiments_ids = [e.experiment_id for e in self.list_experiments()]
-        experiment_id = max(experiments_ids) + 1
-        return self._create_experiment_with_id(name, experiment_id)
+        # The catalog allocates the ID and checks that the name is not taken, without reading
+        # the existing experiments
+        return self._experiment_catalog.create_experiment(name, self._create_experiment_with_id)
 
     def _has_experiment(self, experiment_id):
-        return len(find(self.root_directory, str(experiment_id), full_path=True)) > 0
+        return is_directory(self._get_experiment_dir(experiment_id))
 
     @staticmethod
     def _get_experiment(experiment_dir_path):
@@ -111,35 +229,119 @@ class FileStore(AbstractStore):
 
     def get_experiment(self, experiment_id):
         self._check_root_dir()
-        experiment_dirs = find(self.root_directory, str(experiment_id), full_path=True)
-        if len(experiment_dirs) == 0:
+        if not self._has_experiment(experiment_id):
             raise Exception("Could not find experiment with ID %s" % experiment_id)
-        return self._get_experiment(experiment_dirs[0])
+        return self._get_experiment(self._get_experiment_dir(experiment_id))
 
     def get_experiment_by_name(self, name):
         self._check_root_dir()
-        all_experiments = list_subdirs(self.root_directory, full_path=True)
-        for experiment_dir in all_experiments:
-            experiment = self._get_experiment(experiment_dir)
-            if experiment.name == name:
-                return experiment
-        return None
+        if self.read_only:
+            # A missing catalog would be built and written, so read every experiment instead
+            for experiment in self.list_experiments():
+                if experiment.name == name:
+                    return experiment
+            return None
+        experiment_id = self._experiment_catalog.get_experiment_id(name)
+        if experiment_id is None or not self._has_experiment(experiment_id):
+            return None
+        return self.get_experiment(experiment_id)
+
+    def _get_run_index_path(self):
+        return build_path(self.root_directory, FileStore.RUN_INDEX_FILE_NAME)
+
+    def _load_run_index(self):
+        """
+        Reads entries appended to the on-disk run index since it was last read, including those
+        written by other processes sharing the same root directory.
+        """
+        index_path = self._get_run_index_path()
+        if not exists(index_path):
+            return
+        size = os.path.getsize(index_path)
+        if size < self._run_index_offset:
+            # The index was rebuilt from scratch, so re-read it in full.
+            self._run_index = {}
+            self._run_index_offset = 0
+        if size == self._run_index_offset:
+            return
+        with open(index_path, 'rb') as f:
+            f.seek(self._run_index_offset)
+            data = f.read(size - self._run_index_offset)
+        # Only consume complete lines; a partially written trailing line is picked up next time.
+        consumed = data.rfind(b"\n") + 1
+        for line in data[:consumed].decode("utf-8").splitlines():
+            entry = line.split(" ")
+            if len(entry) == 2:
+                self._run_index[entry[0]] = entry[1]
+        self._run_index_offset += consumed
+
+    def _add_to_run_index(self, run_locations):
+        """
+        Records the given run UUID -> experiment ID mappings in the run index.
+        """
+        if not self.read_only:
+            lines = "".join(["%s %s\n" % (run_uuid, experiment_id)
+                             for run_uuid, experiment_id in run_locations.items()])
+            append_to(self._get_run_index_path(), lines)
+        for run_uuid, experiment_id in run_locations.items():
+            self._run_index[run_uuid] = str(experiment_id)
+
+    def _find_indexed_run_root(self, run_uuid):
+        experiment_id = self._run_index.get(run_uuid)
+        if experiment_id is None:
+            return None
+        run_dir = self._get_run_dir(experiment_id, run_uuid)
+        if not is_directory(run_dir):
+            # Stale entry, e.g. the run directory was moved or removed by hand.
+            del self._run_index[run_uuid]
+            return None
+        return run_dir
+
+    def _scan_for_run_root(self, run_uuid):
+        """
+        Looks for the run by listing every experiment directory. Runs found along the way that
+        are missing from the run index (e.g. runs written before the index existed) are added
+        to it, so the index is rebuilt on demand.
+        """
+        run_dir = None
+        missing_run_locations = {}
+        for experiment_id in list_subdirs(self.root_directory):
+            for existing_run_uuid in list_subdirs(self._get_experiment_dir(experiment_id)):
+                if existing_run_uuid == run_uuid:
+                    run_dir = self._get_run_dir(experiment_id, run_uuid)
+                if existing_run_uuid not in self._run_index:
+                    missing_run_locations[existing_run_uuid] = experiment_id
+        if len(missing_run_locations) > 0:
+            self._add_to_run_index(missing_run_locations)
+        return run_dir
 
     def _find_run_root(self, run_uuid):
         self._check_root_dir()
-        all_experiments = list_subdirs(self.root_directory, full_path=True)
-        for experiment_dir in all_experiments:
-            runs = find(experiment_dir, run_uuid, full_path=True)
-            if len(runs) == 0:
-                continue
-            return runs[0]
-        return None
+        run_dir = self._find_indexed_run_root(run_uuid)
+        if run_dir is None:
+            self._load_run_index()
+            run_dir = self._find_indexed_run_root(run_uuid)
+        if run_dir is None:
+            run_dir = self._scan_for_run_root(run_uuid)
+        return run_dir
+
+    def _lock_run_info(self, run_dir):
+        """
+        Returns a lock to hold while reading, modifying and writing back the metadata of the run,
+        so that concurrent updates by other processes are not lost.
+        """
+        return FileLock(build_path(run_dir, FileStore.META_DATA_LOCK_FILE_NAME))
 
     def update_run_info(self, run_uuid, run_status, end_time):
-        run_info = self.get_run(run_uuid).info
-        new_info = run_info.copy_with_overrides(run_status, end_time)
-        run_dir = self._get_run_dir(run_info.experiment_id, run_info.run_uuid)
-        write_yaml(run_dir, FileStore.META_DATA_FILE_NAME, dict(new_info), overwrite=True)
+        self._check_writable()
+        run_dir = self._find_run_root(run_uuid)
+        if run_dir is None:
+            raise Exception("Run '%s' not found" % run_uuid)
+        with self._lock_run_info(run_dir):
+            run_info = self._get_cached_run_info(run_dir, run_uuid)
+            new_info = run_info.copy_with_overrides(run_status, end_time)
+            self._write_run_info(run_dir, new_info, overwrite=True)
+        self._record_change(run_info.experiment_id)
         return new_info
 
     def create_run(self, experiment_id, user_id, run_name, source_type,
@@ -147,6 +349,7 @@ class FileStore(AbstractStore):
         """
         Creates a run with the specified attributes.
         """
+        self._check_writable()
         if self.get_experiment(experiment_id) is None:
             raise Exception("Could not create run under experiment with ID %s - no such experiment "
                             "exists." % experiment_id)
@@ -162,26 +365,66 @@ class FileStore(AbstractStore):
         # Persist run metadata and create directories for logging metrics, parameters, artifacts
         run_dir = self._get_run_dir(run_info.experiment_id, run_info.run_uuid)
         mkdir(run_dir)
-        write_yaml(run_dir, FileStore.META_DATA_FILE_NAME, dict(run_info))
+        self._write_run_info(run_dir, run_info)
         mkdir(run_dir, FileStore.METRICS_FOLDER_NAME)
         mkdir(run_dir, FileStore.PARAMS_FOLDER_NAME)
         mkdir(run_dir, FileStore.ARTIFACTS_FOLDER_NAME)
+        self._get_search_index(experiment_id).register_run(run_uuid)
+        self._add_to_run_index({run_uuid: experiment_id})
+        self._record_change(experiment_id)
         return Run(run_info=run_info, run_data=None)
 
     def get_run(self, run_uuid):
-        run_dir = self._find_run_root(run_uuid)
-        if run_dir is None:
-            raise Exception("Run '%s' not found" % run_uuid)
-        run_info = self.get_run_info(run_dir)
+        run_info = self._get_run_info(run_uuid)
         metrics = self.get_all_metrics(run_uuid)
         params = self.get_all_params(run_uuid)
         return Run(run_info, RunData(metrics, params))
 
+    def get_run_info_by_uuid(self, run_uuid):
+        return self._get_run_info(run_uuid)
+
     @staticmethod
     def get_run_info(run_dir):
         meta = read_yaml(run_dir, FileStore.META_DATA_FILE_NAME)
+        meta["tags"] = [RunTag.from_dictionary(tag) for tag in meta.get("tags") or []]
         return RunInfo.from_dictionary(meta)
 
+    def _write_run_info(self, run_dir, run_info, overwrite=False):
+        run_info_dict = dict(run_info)
+        run_info_dict["tags"] = [dict(tag) for tag in run_info.tags]
+        write_yaml(run_dir, FileStore.META_DATA_FILE_NAME, run_info_dict, overwrite=overwrite,
+                   codec=self._metadata_codec)
+        self._cache_run_info(run_dir, run_info)
+
+    @staticmethod
+    def _get_run_info_signature(run_dir):
+        stat = os.stat(build_path(run_dir, FileStore.META_DATA_FILE_NAME))
+        # meta.yaml is replaced rather than modified in place, so a new inode also means a change
+        return stat.st_ino, stat.st_mtime, stat.st_size
+
+    def _cache_run_info(self, run_dir, run_info):
+        self._run_info_cache[run_info.run_uuid] = (self._get_run_info_signature(run_dir),
+                                                   run_info)
+
+    def _get_run_info(self, run_uuid):
+        run_dir = self._find_run_root(run_uuid)
+        if run_dir is None:
+            raise Exception("Run '%s' not found" % run_uuid)
+        return self._get_cached_run_info(run_dir, run_uuid)
+
+    def _get_cached_run_info(self, run_dir, run_uuid):
+        """
+        Returns the RunInfo of the run stored in `run_dir`, only re-reading its metadata file if it
+        has been modified (e.g. by another process) since it was last read.
+        """
+        signature = self._get_run_info_signature(run_dir)
+        cached = self._run_info_cache.get(run_uuid)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        run_info = self.get_run_info(run_dir)
+        self._run_info_cache[run_uuid] = (signature, run_info)
+        return run_info
+
     def _get_run_files(self, run_uuid, resource_type):
         if resource_type == "metric":
             subfolder_name = FileStore.METRICS_FOLDER_NAME
@@ -195,15 +438,16 @@ class FileStore(AbstractStore):
         source_dirs = find(run_dir, subfolder_name, full_path=True)
         if len(source_dirs) == 0:
             raise Exception("Malformed run '%s'." % run_uuid)
-        return source_dirs[0], list_files(source_dirs[0], full_path=False)
+        # Skip the temporary files of writes in progress
+        return source_dirs[0], [name for name in list_files(source_dirs[0], full_path=False)
+                                if not name.startswith(TMP_FILE_PREFIX)]
 
     @staticmethod
     def _get_metric_from_file(parent_path, metric_name):
-        metric_data = read_file(parent_path, metric_name)
-        if len(metric_data) == 0:
+        latest = read_latest_metric_value(build_path(parent_path, metric_name))
+        if latest is None:
             raise Exception("Metric '%s' is malformed. No data found." % metric_name)
-        last_line = metric_data[-1]
-        timestamp, val = last_line.strip().split(" ")
+        timestamp, val = latest
         return Metric(metric_name, float(val), int(timestamp))
 
     def get_metric(self, run_uuid, metric_key):
@@ -214,21 +458,113 @@ class FileStore(AbstractStore):
 
     def get_all_metrics(self, run_uuid):
         parent_path, metric_files = self._get_run_files(run_uuid, "metric")
+        latest_metrics = self._read_latest_metrics(os.path.dirname(parent_path))
         metrics = []
         for metric_file in metric_files:
-            metrics.append(self._get_metric_from_file(parent_path, metric_file))
+            metric_path = build_path(parent_path, metric_file)
+            # Summary entries record the size of the metric file they were computed from, so an
+            # entry is out of date if values were appended since, e.g. by another process.
+            entry = latest_metrics.get(metric_file)
+            if entry is not None and entry[2] == os.path.getsize(metric_path):
+                metrics.append(Metric(metric_file, float(entry[1]), int(entry[0])))
+                continue
+            latest = read_latest_metric_value(metric_path)
+            if latest is None:
+                # Just created by another process (empty, or holding only the header of the
+                # binary format), which has not appended the first value yet
+                continue
+            metrics.append(Metric(metric_file, float(latest[1]), int(latest[0])))
         return metrics
 
-    def get_metric_history(self, run_uuid, metric_key):
+    @staticmethod
+    def _read_latest_metrics(run_dir):
+        """
+        :return: Map from metric key --> [timestamp, value, size of the metric file] read from the
+                 run's latest metrics summary, or an empty map if it has none.
+        """
+        path = build_path(run_dir, FileStore.LATEST_METRICS_FILE_NAME)
+        if not exists(path):
+            return {}
+        with open(path, "r") as f:
+            return json.load(f)
+
+    def _update_latest_metrics(self, run_dir, metrics):
+        """
+        Records the last of the given metrics for each key in the run's latest metrics summary,
+        which is replaced atomically so that readers never see a partially written one.
+        """
+        latest_metrics = self._latest_metrics.get(run_dir)
+        if latest_metrics is None:
+            latest_metrics = self._read_latest_metrics(run_dir)
+        metrics_dir = build_path(run_dir, FileStore.METRICS_FOLDER_NAME)
+        for metric in metrics:
+            latest_metrics[metric.key] = [metric.timestamp, metric.value,
+                                          os.path.getsize(build_path(metrics_dir, metric.key))]
+        with atomic_write(build_path(run_dir, FileStore.LATEST_METRICS_FILE_NAME)) as f:
+            json.dump(latest_metrics, f)
+        self._latest_metrics[run_dir] = latest_metrics
+
+    @staticmethod
+    def _read_metric_history(metric_path, metric_key, start_ts, end_ts, max_points,
+                             aggregation):
+        timestamps, values = read_metric_history(metric_path, start_ts, end_ts)
+        if max_points is not None:
+            timestamps, values = downsample(timestamps, values, max_points, aggregation)
+        return [Metric(metric_key, val, ts)
+                for ts, val in zip(timestamps.tolist(), values.tolist())]
+
+    def get_metric_history(self, run_uuid, metric_key, start_ts=None, end_ts=None,
+                           max_points=None, aggregation=None):
         parent_path, metric_files = self._get_run_files(run_uuid, "metric")
         if metric_key not in metric_files:
             raise Exception("Metric '%s' not found under run '%s'" % (metric_key, run_uuid))
-        metric_data = read_file(parent_path, metric_key)
-        rsl = []
-        for pair in metric_data:
-            ts, val = pair.strip().split(" ")
-            rsl.append(Metric(metric_key, float(val), int(ts)))
-        return rsl
+        return self._read_metric_history(build_path(parent_path, metric_key), metric_key,
+                                         start_ts, end_ts, max_points, aggregation)
+
+    def get_metric_history_bulk(self, run_uuids, metric_keys, start_ts=None, end_ts=None,
+                                max_points=None, aggregation=None):
+        """
+        Each run directory is resolved and listed once, and the metric files are then read
+        concurrently by up to `FileStore.BULK_READ_CONCURRENCY` threads.
+        """
+        reads = []
+        for run_uuid in run_uuids:
+            parent_path, metric_files = self._get_run_files(run_uuid, "metric")
+            reads.extend((run_uuid, key, build_path(parent_path, key))
+                         for key in metric_keys if key in metric_files)
+        histories = dict((run_uuid, {}) for run_uuid in run_uuids)
+        if len(reads) == 0:
+            return histories
+
+        def read(args):
+            _, key, path = args
+            return self._read_metric_history(path, key, start_ts, end_ts, max_points,
+                                             aggregation)
+
+        # multiprocessing's ThreadPool rather than concurrent.futures, which Python 2 lacks
+        pool = ThreadPool(min(FileStore.BULK_READ_CONCURRENCY, len(reads)))
+        try:
+            results = pool.map(read, reads)
+        finally:
+            pool.close()
+        for (run_uuid, key, _), history in zip(reads, results):
+            histories[run_uuid][key] = history
+        return histories
+
+    def get_metric_history_arrays(self, run_uuid, metric_key, start_ts=None, end_ts=None):
+        """
+        Returns the history of a metric as NumPy arrays rather than `Metric` objects, which is
+        much cheaper for long histories. Histories stored in the binary format are memory-mapped.
+
+        :param start_ts: If specified, only values logged at or after this timestamp are returned.
+        :param end_ts: If specified, only values logged at or before this timestamp are returned.
+        :return: Pair of arrays holding the timestamps and values of the metric, in the order
+                 they were logged.
+        """
+        parent_path, metric_files = self._get_run_files(run_uuid, "metric")
+        if metric_key not in metric_files:
+            raise Exception("Metric '%s' not found under run '%s'" % (metric_key, run_uuid))
+        return read_metric_history(build_path(parent_path, metric_key), start_ts, end_ts)
 
     @staticmethod
     def _get_param_from_file(parent_path, param_name):
@@ -258,31 +594,103 @@ class FileStore(AbstractStore):
         experiment_dir = find(self.root_directory, str(experiment_id), full_path=True)[0]
         return list_subdirs(experiment_dir, full_path=False)
 
-    def search_runs(self, experiment_ids, search_expressions):
-        run_uuids = []
-        if len(search_expressions) == 0:
-            for experiment_id in experiment_ids:
-                run_uuids.extend(self._list_run_uuids(experiment_id))
-        else:
-            for experiment_id in experiment_ids:
-                for run_uuid in self._list_run_uuids(experiment_id):
-                    run = self.get_run(run_uuid)
-                    if all([does_run_match_clause(run, s) for s in search_expressions]):
-                        run_uuids.append(run_uuid)
-        return [self.get_run(run_uuid) for run_uuid in run_uuids]
-
-    def list_run_infos(self, experiment_id):
+    def _get_search_index(self, experiment_id):
+        experiment_id = str(experiment_id)
+        if experiment_id not in self._search_indexes:
+            self._search_indexes[experiment_id] = ExperimentSearchIndex(
+                self._get_experiment_dir(experiment_id))
+        return self._search_indexes[experiment_id]
+
+    def _get_refreshed_search_index(self, experiment_id, run_uuids):
+        """
+        Returns the search index of the experiment, up to date with all writes so far and
+        covering every run in `run_uuids`. Runs that are missing from the index (e.g. runs
+        written before the index existed) are read in full once and registered.
+        """
+        search_index = self._get_search_index(experiment_id)
+        search_index.refresh()
+        indexed_runs = search_index.get_indexed_runs()
+        missing_run_uuids = [run_uuid for run_uuid in run_uuids if run_uuid not in indexed_runs]
+        for run_uuid in missing_run_uuids:
+            search_index.register_run(run_uuid, self.get_all_metrics(run_uuid),
+                                      self.get_all_params(run_uuid))
+        if len(missing_run_uuids) > 0:
+            search_index.refresh()
+        return search_index
+
+    def search_runs(self, experiment_ids, search_expressions, max_results=None, page_token=None,
+                    order_by=None):
         run_infos = []
-        for run_uuid in self._list_run_uuids(experiment_id):
-            run_infos.append(self.get_run_info(self._get_run_dir(experiment_id, run_uuid)))
-        return run_infos
+        for experiment_id in experiment_ids:
+            run_uuids = self._list_run_uuids(experiment_id)
+            if len(search_expressions) > 0:
+                # Evaluate the expressions against the experiment's search index, and only read
+                # the runs that match.
+                search_index = self._get_refreshed_search_index(experiment_id, run_uuids)
+                matching_run_uuids = set(run_uuids)
+                for search_expression in search_expressions:
+                    matching_run_uuids &= search_index.get_matching_runs(search_expression)
+                run_uuids = [run_uuid for run_uuid in run_uuids if run_uuid in matching_run_uuids]
+            run_infos.extend(self._get_cached_run_info(self._get_run_dir(experiment_id, run_uuid),
+                                                       run_uuid)
+                             for run_uuid in run_uuids)
+        page = paginate_run_infos(run_infos, max_results, page_token, order_by)
+        return PagedList([self.get_run(run_info.run_uuid) for run_info in page], page.token)
+
+    def list_run_infos(self, experiment_id, max_results=None, page_token=None, order_by=None):
+        run_infos = [self._get_cached_run_info(self._get_run_dir(experiment_id, run_uuid),
+                                               run_uuid)
+                     for run_uuid in self._list_run_uuids(experiment_id)]
+        return paginate_run_infos(run_infos, max_results, page_token, order_by)
 
     def log_metric(self, run_uuid, metric):
-        run = self.get_run(run_uuid)
-        metric_path = self._get_metric_path(run.info.experiment_id, run_uuid, metric.key)
-        append_to(metric_path, "%s %s\n" % (metric.timestamp, metric.value))
+        self._check_writable()
+        run_info = self._get_run_info(run_uuid)
+        metric_path = self._get_metric_path(run_info.experiment_id, run_uuid, metric.key)
+        append_metric_values(metric_path, [(metric.timestamp, metric.value)], self.metric_format)
+        if self.write_latest_metrics:
+            self._update_latest_metrics(self._get_run_dir(run_info.experiment_id, run_uuid),
+                                        [metric])
+        self._get_search_index(run_info.experiment_id).log_metrics(run_uuid, [metric])
+        self._record_change(run_info.experiment_id, run_data=True)
 
     def log_param(self, run_uuid, param):
-        run = self.get_run(run_uuid)
-        param_path = self._get_param_path(run.info.experiment_id, run_uuid, param.key)
+        self._check_writable()
+        run_info = self._get_run_info(run_uuid)
+        param_path = self._get_param_path(run_info.experiment_id, run_uuid, param.key)
         write_to(param_path, "%s\n" % param.value)
+        self._get_search_index(run_info.experiment_id).log_params(run_uuid, [param])
+        self._record_change(run_info.experiment_id, run_data=True)
+
+    def log_batch(self, run_uuid, metrics, params, tags):
+        self._check_writable()
+        run_info = self._get_run_info(run_uuid)
+        # Group metric values by key so that each metric file is opened only once
+        metric_values = {}
+        for metric in metrics:
+            metric_values.setdefault(metric.key, []).append((metric.timestamp, metric.value))
+        for key, values in metric_values.items():
+            append_metric_values(self._get_metric_path(run_info.experiment_id, run_uuid, key),
+                                 values, self.metric_format)
+        if self.write_latest_metrics and len(metrics) > 0:
+            self._update_latest_metrics(self._get_run_dir(run_info.experiment_id, run_uuid),
+                                        metrics)
+        for param in params:
+            write_to(self._get_param_path(run_info.experiment_id, run_uuid, param.key),
+                     "%s\n" % param.value)
+        search_index = self._get_search_index(run_info.experiment_id)
+        search_index.log_metrics(run_uuid, metrics)
+        search_index.log_params(run_uuid, params)
+        if len(tags) > 0:
+            run_dir = self._get_run_dir(run_info.experiment_id, run_uuid)
+            with self._lock_run_info(run_dir):
+                run_info = self._get_cached_run_info(run_dir, run_uuid)
+                tags_by_key = dict((tag.key, tag) for tag in run_info.tags)
+                tags_by_key.update((tag.key, tag) for tag in tags)
+                run_info_dict = dict(run_info)
+                run_info_dict["tags"] = list(tags_by_key.values())
+                new_info = RunInfo.from_dictionary(run_info_dict)
+                self._write_run_info(run_dir, new_info, overwrite=True)
+            self._record_change(run_info.experiment_id)
+        if len(metrics) > 0 or len(params) > 0:
+            self._record_change(run_info.experiment_id, run_data=True)
@@ -0,0 +1,191 @@
+"""
+Reading and writing of the files holding the history of a metric in a `FileStore` run.
+
+Two formats are supported, and every reader detects the format of each file on its own:
+
+* text: one ``"<timestamp> <value>\\n"`` line per logged value. This is the original format.
+* binary: a 16-byte header followed by fixed-width 16-byte records, each made of a little-endian
+  int64 timestamp and a float64 value. The latest value can be read by seeking to the last
+  record, and the history can be memory-mapped into NumPy arrays without parsing.
+
+The binary header starts with a byte that cannot begin a text line, so the two are never confused.
+"""
+import errno
+import os
+import struct
+import uuid
+
+import numpy as np
+
+from mlflow.utils.file_utils import TMP_FILE_PREFIX, atomic_write, locked_append, \
+    read_last_line
+
+
+TEXT_FORMAT = "text"
+BINARY_FORMAT = "binary"
+METRIC_FORMATS = [TEXT_FORMAT, BINARY_FORMAT]
+
+_MAGIC = b"\x93MLFLOW_METRIC"
+_VERSION = 1
+_HEADER = _MAGIC + struct.pack("<H", _VERSION)
+_HEADER_SIZE = len(_HEADER)
+_RECORD = struct.Struct("<qd")
+_RECORD_DTYPE = np.dtype([("timestamp", "<i8"), ("value", "<f8")])
+
+
+def is_binary_metric_file(path):
+    with open(path, "rb") as f:
+        return f.read(len(_MAGIC)) == _MAGIC
+
+
+def _check_header(path, header):
+    if header[:len(_MAGIC)] != _MAGIC:
+        raise Exception("Metric file '%s' is not in the binary format." % path)
+    version = struct.unpack("<H", header[len(_MAGIC):_HEADER_SIZE])[0]
+    if version != _VERSION:
+        raise Exception("Metric file '%s' has unsupported binary format version %s."
+                        % (path, version))
+
+
+def _get_num_records(path):
+    # A trailing partial record, from a write in progress, is not counted
+    return max(0, (os.path.getsize(path) - _HEADER_SIZE) // _RECORD.size)
+
+
+def _create_binary_file(path):
+    """
+    Creates an empty binary metric file unless the file exists. The file is written under a
+    temporary name and then linked into place, which fails if the file was created concurrently,
+    so other writers never see a file without its header.
+    """
+    directory, name = os.path.split(path)
+    tmp_path = os.path.join(directory, "%s%s-%s" % (TMP_FILE_PREFIX, name, uuid.uuid4().hex))
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER)
+    try:
+        os.link(tmp_path, path)
+    except OSError as e:
+        if e.errno != errno.EEXIST:
+            raise
+    finally:
+        os.remove(tmp_path)
+
+
+def _migrate_to_binary(path):
+    """
+    Rewrites a text metric file in the binary format, replacing it atomically. The file is locked
+    throughout, so that values appended concurrently are written to the new file.
+    """
+    with locked_append(path) as src:
+        src.seek(0)
+        data = src.read()
+        if data[:len(_MAGIC)] == _MAGIC:
+            # Migrated concurrently by another writer
+            return
+        records = b"".join(_RECORD.pack(int(ts), float(value))
+                           for ts, value in (line.split() for line in data.splitlines()
+                                             if line.strip()))
+        with atomic_write(path, "wb") as dst:
+            dst.write(_HEADER + records)
+
+
+def append_metric_values(path, values, metric_format):
+    """
+    Appends (timestamp, value) pairs to a metric file, creating the file if needed.
+
+    New files are written in `metric_format`. Existing binary files are always appended to in the
+    binary format, while existing text files are converted to the binary format first if
+    `metric_format` is binary, and appended to as text otherwise.
+    """
+    if len(values) == 0:
+        return
+    if metric_format == BINARY_FORMAT:
+        if not os.path.exists(path):
+            _create_binary_file(path)
+        elif not is_binary_metric_file(path):
+            _migrate_to_binary(path)
+    # The file is locked so that values written concurrently by other writers are not
+    # interleaved, and its format is checked under the lock in case it was just migrated
+    with locked_append(path) as f:
+        f.seek(0)
+        if f.read(len(_MAGIC)) == _MAGIC:
+            data = b"".join(_RECORD.pack(int(timestamp), float(value))
+                            for timestamp, value in values)
+        else:
+            data = "".join("%s %s\n" % (timestamp, value) for timestamp, value in values) \
+                .encode("utf-8")
+        f.write(data)
+
+
+def read_latest_metric_value(path):
+    """
+    :return: The last (timestamp, value) pair of a metric file, or None if the file is empty.
+    """
+    if not is_binary_metric_file(path):
+        last_line = read_last_line(os.path.dirname(path), os.path.basename(path))
+        if last_line is None:
+            return None
+        timestamp, value = last_line.split(" ")
+        return int(timestamp), float(value)
+    num_records = _get_num_records(path)
+    with open(path, "rb") as f:
+        _check_header(path, f.read(_HEADER_SIZE))
+        if num_records == 0:
+            return None
+        f.seek(_HEADER_SIZE + (num_records - 1) * _RECORD.size)
+        return _RECORD.unpack(f.read(_RECORD.size))
+
+
+def _in_window(timestamp, start_ts, end_ts):
+    return (start_ts is None or timestamp >= start_ts) and (end_ts is None or timestamp <= end_ts)
+
+
+def _read_text_metric_history(path, start_ts, end_ts, chunk_size=1024 * 1024):
+    # Parse the file in chunks rather than reading it at once, so that only the values within
+    # the window are held in memory.
+    timestamps, values = [], []
+    with open(path, "rb") as f:
+        pending = b""
+        while True:
+            chunk = f.read(chunk_size)
+            data = pending + chunk
+            consumed = len(data) if not chunk else data.rfind(b"\n") + 1
+            for line in data[:consumed].splitlines():
+                if not line.strip():
+                    continue
+                timestamp, value = line.split()
+                timestamp = int(timestamp)
+                if _in_window(timestamp, start_ts, end_ts):
+                    timestamps.append(timestamp)
+                    values.append(float(value))
+            pending = data[consumed:]
+            if not chunk:
+                break
+    return np.array(timestamps, dtype=np.int64), np.array(values, dtype=np.float64)
+
+
+def read_metric_history(path, start_ts=None, end_ts=None):
+    """
+    :param start_ts: If specified, only values logged at or after this timestamp are returned.
+    :param end_ts: If specified, only values logged at or before this timestamp are returned.
+    :return: Pair of NumPy arrays holding the timestamps (int64) and values (float64) of a metric
+             file, in the order they were logged. Binary files are memory-mapped rather than read.
+    """
+    if not is_binary_metric_file(path):
+        return _read_text_metric_history(path, start_ts, end_ts)
+    with open(path, "rb") as f:
+        _check_header(path, f.read(_HEADER_SIZE))
+    num_records = _get_num_records(path)
+    if num_records == 0:
+        return np.array([], dtype=np.int64), np.array([], dtype=np.float64)
+    records = np.memmap(path, dtype=_RECORD_DTYPE, mode="r", offset=_HEADER_SIZE,
+                        shape=(num_records,))
+    timestamps, values = records["timestamp"], records["value"]
+    if start_ts is None and end_ts is None:
+        return timestamps, values
+    in_window = np.ones(num_records, dtype=bool)
+    if start_ts is not None:
+        in_window &= timestamps >= start_ts
+    if end_ts is not None:
+        in_window &= timestamps <= end_ts
+    return timestamps[in_window], values[in_window]
@@ -0,0 +1,9 @@
+class PagedList(list):
+    """
+    List of results returned by a paginated store API, along with a `token` to pass back to the
+    same API to fetch the next page. `token` is None when there are no more results.
+    """
+
+    def __init__(self, items, token):
+        super(PagedList, self).__init__(items)
+        self.token = token
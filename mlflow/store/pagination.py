@@ -0,0 +1,83 @@
+"""
+Keyset pagination of runs, shared by the tracking stores.
+
+A page token encodes the values of the ordering attributes (and the run UUID, which breaks ties)
+of the last run of the previous page, so the next page starts right after that run even if runs
+were created or deleted in between, rather than at a fixed position that such changes shift.
+"""
+import base64
+import json
+
+from mlflow.store.paged_list import PagedList
+from mlflow.utils.search_utils import DEFAULT_ORDER_BY, _parse_order_by, sort_run_infos
+
+
+def get_order_by_clauses(order_by=None):
+    """
+    :return: List of (attribute, ascending) pairs ordering runs according to `order_by` (or
+             `DEFAULT_ORDER_BY` if unset), ending with the run UUID that breaks ties.
+    """
+    clauses = [_parse_order_by(clause) for clause in (order_by or DEFAULT_ORDER_BY)]
+    return clauses + [("run_uuid", True)]
+
+
+def encode_page_token(run_info, clauses):
+    """
+    :return: Token of the page following `run_info` in the order given by `clauses`.
+    """
+    key = [getattr(run_info, attribute) for attribute, _ in clauses]
+    return base64.urlsafe_b64encode(json.dumps({"key": key}).encode("utf-8")).decode("utf-8")
+
+
+def decode_page_token(page_token, clauses):
+    """
+    :return: Values of the ordering attributes of the last run of the previous page.
+    """
+    try:
+        key = json.loads(base64.urlsafe_b64decode(page_token.encode("utf-8"))
+                         .decode("utf-8"))["key"]
+    except Exception:  # pylint: disable=broad-except
+        raise Exception("Invalid page token '%s'" % page_token)
+    if not isinstance(key, list) or len(key) != len(clauses):
+        raise Exception("Invalid page token '%s' for the requested order" % page_token)
+    return key
+
+
+def _is_after(run_info, clauses, key):
+    for (attribute, ascending), key_value in zip(clauses, key):
+        value = getattr(run_info, attribute)
+        if value == key_value:
+            continue
+        # Unset values compare greater than any set value, like in `sort_run_infos`
+        if value is None:
+            greater = True
+        elif key_value is None:
+            greater = False
+        else:
+            greater = value > key_value
+        return greater == ascending
+    return False
+
+
+def paginate_run_infos(run_infos, max_results=None, page_token=None, order_by=None):
+    """
+    Sorts `run_infos` according to `order_by` and returns the page following the one `page_token`
+    was returned with (or the first page if unset), with at most `max_results` elements (or all
+    remaining ones if unset).
+
+    :return: PagedList whose token can be passed as `page_token` to get the next page, or None if
+             there are no more runs.
+    """
+    clauses = get_order_by_clauses(order_by)
+    sorted_infos = sort_run_infos(run_infos, order_by)
+    if page_token:
+        key = decode_page_token(page_token, clauses)
+        sorted_infos = [run_info for run_info in sorted_infos
+                        if _is_after(run_info, clauses, key)]
+    if max_results is None:
+        return PagedList(sorted_infos, None)
+    if max_results <= 0:
+        raise Exception("Invalid value for max_results: %s. It must be positive." % max_results)
+    page = sorted_infos[:max_results]
+    next_token = encode_page_token(page[-1], clauses) if len(sorted_infos) > max_results else None
+    return PagedList(page, next_token)
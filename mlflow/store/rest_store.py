@@ -1,3 +1,5 @@
+import json
+
 from google.protobuf.json_format import MessageToJson, ParseDict
 
 
@@ -10,11 +12,13 @@ from mlflow.entities.param import Param
 
 from mlflow.entities.metric import Metric
 
-from mlflow.utils.rest_utils import http_request
+from mlflow.store.paged_list import PagedList
+from mlflow.utils.env import get_env
+from mlflow.utils.rest_utils import RestException, http_request_raw
 
 from mlflow.protos.service_pb2 import CreateExperiment, MlflowService, GetExperiment, \
     GetRun, SearchRuns, ListExperiments, GetMetricHistory, LogMetric, LogParam, UpdateRun,\
-    CreateRun, GetMetric, GetParam
+    CreateRun, GetMetric, GetParam, LogBatch, GetMetricHistoryBulk
 
 from mlflow.protos import databricks_pb2
 
@@ -37,13 +41,40 @@ def _api_method_to_info():
 
 _METHOD_TO_INFO = _api_method_to_info()
 
+_USE_PROTOBUF_ENV_VAR = "MLFLOW_REST_STORE_USE_PROTOBUF"
+
+_PROTOBUF_CONTENT_TYPE = "application/x-protobuf"
+
+# Statuses of servers that cannot read a request body in the protobuf format: 400 when they fail
+# to parse it as JSON, 415 when they reject its content type
+_UNSUPPORTED_PROTOBUF_STATUS_CODES = [400, 415]
 
-class RestStore(AbstractStore):
-    """ Client for a remote tracking server accessed via REST API calls """
 
-    def __init__(self, hostname):
+class RestStore(AbstractStore):
+    """
+    Client for a remote tracking server accessed via REST API calls
+
+    :param hostname: URL of the tracking server
+    :param use_protobuf: Whether to exchange request and response bodies with the server in the
+                         binary protobuf wire format rather than JSON, which is much cheaper to
+                         serialize and parse for large responses. Defaults to the value of the
+                         MLFLOW_REST_STORE_USE_PROTOBUF environment variable, or False if unset.
+                         Servers that do not support the binary format answer in JSON, which is
+                         parsed as before, or reject protobuf request bodies with a 400 or 415
+                         status, in which case the request is sent again in JSON and JSON is used
+                         from then on. Other failures, e.g. timeouts, are raised and never
+                         re-sent, since the server may have applied the request.
+    """
+
+    def __init__(self, hostname, use_protobuf=None):
         super(RestStore, self).__init__()
         self.hostname = hostname
+        if use_protobuf is None:
+            use_protobuf = (get_env(_USE_PROTOBUF_ENV_VAR) or "false").lower() == "true"
+        self.use_protobuf = use_protobuf
+        # Whether the server answered a request in protobuf, after which its errors are never
+        # mistaken for a lack of protobuf support
+        self._server_supports_protobuf = False
 
     def _get_headers(self):  # noqa
         """ Returns header for REST API requests. Can be overridden in subclasses """
@@ -53,13 +84,42 @@ class RestStore(AbstractStore):
         """ Returns auth for REST API requests. Can be overridden in subclasses """
         return None
 
-    def _call_endpoint(self, api, json_body):
+    def _send_protobuf_request(self, endpoint, method, request_message):
+        headers = dict(self._get_headers() or {})
+        headers["Content-Type"] = _PROTOBUF_CONTENT_TYPE
+        headers["Accept"] = _PROTOBUF_CONTENT_TYPE
+        data = request_message.SerializeToString() if request_message is not None else None
+        return http_request_raw(hostname=self.hostname, endpoint=endpoint, method=method,
+                                auth=self._get_auth(), headers=headers, req_body_json=None,
+                                params=None, data=data)
+
+    def _send_json_request(self, endpoint, method, request_message):
+        json_body = MessageToJson(request_message) if request_message is not None else None
+        return http_request_raw(hostname=self.hostname, endpoint=endpoint, method=method,
+                                auth=self._get_auth(), headers=self._get_headers(),
+                                req_body_json=json_body, params=None)
+
+    def _call_endpoint(self, api, request_message):
         endpoint, method = _METHOD_TO_INFO[api]
         response_proto = api.Response()
-        js_dict = http_request(hostname=self.hostname, endpoint=endpoint, method=method,
-                               auth=self._get_auth(), headers=self._get_headers(),
-                               req_body_json=json_body, params=None)
-        ParseDict(js_dict=js_dict, message=response_proto)
+        if self.use_protobuf:
+            try:
+                response = self._send_protobuf_request(endpoint, method, request_message)
+            except RestException as e:
+                if self._server_supports_protobuf or \
+                        e.status_code not in _UNSUPPORTED_PROTOBUF_STATUS_CODES:
+                    raise
+                # The server could not read the request, so it was not applied
+                response = self._send_json_request(endpoint, method, request_message)
+                self.use_protobuf = False
+        else:
+            response = self._send_json_request(endpoint, method, request_message)
+        content_type = response.headers.get("Content-Type", "").split(";")[0].strip()
+        if content_type == _PROTOBUF_CONTENT_TYPE:
+            self._server_supports_protobuf = True
+            response_proto.ParseFromString(response.content)
+        else:
+            ParseDict(js_dict=json.loads(response.text), message=response_proto)
         return response_proto
 
     def list_experiments(self):
@@ -78,7 +138,7 @@ class RestStore(AbstractStore):
         :param name: Desired name for an experiment
         :return: experiment_id (integer) for the newly created experiment if successful, else None
         """
-        req_body = MessageToJson(CreateExperiment(name=name))
+        req_body = CreateExperiment(name=name)
         response_proto = self._call_endpoint(CreateExperiment, req_body)
         return response_proto.experiment_id
 
@@ -89,7 +149,7 @@ class RestStore(AbstractStore):
         :param experiment_id: Integer id for the experiment
         :return: A single Experiment object if it exists, otherwise raises an Exception.
         """
-        req_body = MessageToJson(GetExperiment(experiment_id=experiment_id))
+        req_body = GetExperiment(experiment_id=experiment_id)
         response_proto = self._call_endpoint(GetExperiment, req_body)
         return Experiment.from_proto(response_proto.experiment)
 
@@ -100,14 +160,14 @@ class RestStore(AbstractStore):
         :param run_uuid: Unique identifier for the run
         :return: A single Run object if it exists, otherwise raises an Exception
         """
-        req_body = MessageToJson(GetRun(run_uuid=run_uuid))
+        req_body = GetRun(run_uuid=run_uuid)
         response_proto = self._call_endpoint(GetRun, req_body)
         return Run.from_proto(response_proto.run)
 
     def update_run_info(self, run_uuid, run_status, end_time):
         """ Updates the metadata of the specified run. """
-        req_body = MessageToJson(UpdateRun(run_uuid=run_uuid, status=run_status,
-                                           end_time=end_time))
+        req_body = UpdateRun(run_uuid=run_uuid, status=run_status,
+                             end_time=end_time)
         response_proto = self._call_endpoint(UpdateRun, req_body)
         return RunInfo.from_proto(response_proto.run_info)
 
@@ -123,10 +183,10 @@ class RestStore(AbstractStore):
         :return: The created Run object
         """
         tag_protos = [tag.to_proto() for tag in tags]
-        req_body = MessageToJson(CreateRun(
+        req_body = CreateRun(
             experiment_id=experiment_id, user_id=user_id, run_name=run_name,
             source_type=source_type, source_name=source_name, entry_point_name=entry_point_name,
-            start_time=start_time, source_version=source_version, tags=tag_protos))
+            start_time=start_time, source_version=source_version, tags=tag_protos)
         response_proto = self._call_endpoint(CreateRun, req_body)
         return Run.from_proto(response_proto.run)
 
@@ -136,7 +196,7 @@ class RestStore(AbstractStore):
         :param run_uuid: String id for the run
         :param metric: Metric instance to log
         """
-        req_body = MessageToJson(LogMetric(run_uuid=run_uuid, key=metric.key, value=metric.value))
+        req_body = LogMetric(run_uuid=run_uuid, key=metric.key, value=metric.value)
         self._call_endpoint(LogMetric, req_body)
 
     def log_param(self, run_uuid, param):
@@ -145,9 +205,23 @@ class RestStore(AbstractStore):
         :param run_uuid: String id for the run
         :param param: Param instance to log
         """
-        req_body = MessageToJson(LogParam(run_uuid=run_uuid, key=param.key, value=param.value))
+        req_body = LogParam(run_uuid=run_uuid, key=param.key, value=param.value)
         self._call_endpoint(LogParam, req_body)
 
+    def log_batch(self, run_uuid, metrics, params, tags):
+        """
+        Logs multiple metrics, params and tags for the specified run in a single request
+        :param run_uuid: String id for the run
+        :param metrics: List of Metric instances to log
+        :param params: List of Param instances to log
+        :param tags: List of RunTag instances to set on the run
+        """
+        req_body = LogBatch(run_uuid=run_uuid,
+                            metrics=[metric.to_proto() for metric in metrics],
+                            params=[param.to_proto() for param in params],
+                            tags=[tag.to_proto() for tag in tags])
+        self._call_endpoint(LogBatch, req_body)
+
     def get_metric(self, run_uuid, metric_key):
         """
         Returns the last logged value for a given metric.
@@ -157,7 +231,7 @@ class RestStore(AbstractStore):
 
         :return: A single float value for the give metric if logged, else None
         """
-        req_body = MessageToJson(GetMetric(run_uuid=run_uuid, metric_key=metric_key))
+        req_body = GetMetric(run_uuid=run_uuid, metric_key=metric_key)
         response_proto = self._call_endpoint(GetMetric, req_body)
         return Metric.from_proto(response_proto.metric)
 
@@ -170,46 +244,94 @@ class RestStore(AbstractStore):
 
         :return: Value of the given parameter if logged, else None
         """
-        req_body = MessageToJson(GetParam(run_uuid=run_uuid, param_name=param_name))
+        req_body = GetParam(run_uuid=run_uuid, param_name=param_name)
         response_proto = self._call_endpoint(GetParam, req_body)
         return Param.from_proto(response_proto.parameter)
 
-    def get_metric_history(self, run_uuid, metric_key):
+    def get_metric_history(self, run_uuid, metric_key, start_ts=None, end_ts=None,
+                           max_points=None, aggregation=None):
         """
         Returns all logged value for a given metric.
 
         :param run_uuid: Unique identifier for run
         :param metric_key: Metric name within the run
+        :param start_ts: If specified, only values logged at or after this timestamp are returned
+        :param end_ts: If specified, only values logged at or before this timestamp are returned
+        :param max_points: If specified, the history is downsampled to at most this many values
+        :param aggregation: How values are aggregated when downsampling, one of "mean" (the
+                            default), "min", "max" or "lttb"
 
         :return: A list of float values logged for the give metric if logged, else empty list
         """
-        req_body = MessageToJson(GetMetricHistory(run_uuid=run_uuid, metric_key=metric_key))
+        req_body = GetMetricHistory(
+            run_uuid=run_uuid, metric_key=metric_key, start_ts=start_ts, end_ts=end_ts,
+            max_points=max_points, aggregation=aggregation)
         response_proto = self._call_endpoint(GetMetricHistory, req_body)
         return [Metric.from_proto(metric).value for metric in response_proto.metrics]
 
-    def search_runs(self, experiment_ids, search_expressions):
+    def get_metric_history_bulk(self, run_uuids, metric_keys, start_ts=None, end_ts=None,
+                                max_points=None, aggregation=None):
+        """
+        Returns the histories of several metrics of several runs in a single request.
+
+        :param run_uuids: List of unique identifiers of runs
+        :param metric_keys: List of metric names
+        :param start_ts: If specified, only values logged at or after this timestamp are returned
+        :param end_ts: If specified, only values logged at or before this timestamp are returned
+        :param max_points: If specified, each history is downsampled to at most this many values
+        :param aggregation: How values are aggregated when downsampling
+
+        :return: Dictionary mapping each run UUID to a dictionary mapping each metric name logged
+                 by the run to the list of its logged `Metric` values
+        """
+        req_body = GetMetricHistoryBulk(
+            run_uuids=run_uuids, metric_keys=metric_keys, start_ts=start_ts, end_ts=end_ts,
+            max_points=max_points, aggregation=aggregation)
+        response_proto = self._call_endpoint(GetMetricHistoryBulk, req_body)
+        histories = dict((run_uuid, {}) for run_uuid in run_uuids)
+        for history in response_proto.histories:
+            histories.setdefault(history.run_uuid, {})[history.metric_key] = \
+                [Metric.from_proto(metric) for metric in history.metrics]
+        return histories
+
+    def search_runs(self, experiment_ids, search_expressions, max_results=None, page_token=None,
+                    order_by=None):
         """
         Returns runs that match the given list of search expressions within the experiments.
         Given multiple search expressions, all these expressions are ANDed together for search.
 
         :param experiment_ids: List of experiment ids to scope the search
         :param search_expression: list of search expressions
+        :param max_results: Maximum number of runs to return. If None, all matching runs are
+                            returned.
+        :param page_token: Token returned with a previous page of results, to get the next page.
+        :param order_by: List of RunInfo attributes to order runs by, each optionally followed by
+                         "ASC" or "DESC".
 
-        :return: A list of Run objects that satisfy the search expressions
+        :return: A PagedList of Run objects that satisfy the search expressions
         """
         search_expressions_protos = [expr.to_proto() for expr in search_expressions]
-        req_body = MessageToJson(SearchRuns(experiment_ids=experiment_ids,
-                                            search_expressions=search_expressions_protos))
+        req_body = SearchRuns(experiment_ids=experiment_ids,
+                              anded_expressions=search_expressions_protos,
+                              max_results=max_results, page_token=page_token,
+                              order_by=order_by)
         response_proto = self._call_endpoint(SearchRuns, req_body)
-        return [Run.from_proto(proto_run) for proto_run in response_proto.runs]
+        return PagedList([Run.from_proto(proto_run) for proto_run in response_proto.runs],
+                         response_proto.next_page_token or None)
 
-    def list_run_infos(self, experiment_id):
+    def list_run_infos(self, experiment_id, max_results=None, page_token=None, order_by=None):
         """
         Returns run information for runs which belong to the experiment_id
 
         :param experiment_id: The experiment id which to search.
+        :param max_results: Maximum number of runs to return. If None, all runs are returned.
+        :param page_token: Token returned with a previous page of results, to get the next page.
+        :param order_by: List of RunInfo attributes to order runs by, each optionally followed by
+                         "ASC" or "DESC".
 
-        :return: A list of RunInfo objects that satisfy the search expressions
+        :return: A PagedList of RunInfo objects
         """
-        runs = self.search_runs(experiment_ids=[experiment_id], search_expressions=[])
-        return [run.info for run in runs]
+        runs = self.search_runs(experiment_ids=[experiment_id], search_expressions=[],
+                                max_results=max_results, page_token=page_token,
+                                order_by=order_by)
+        return PagedList([run.info for run in runs], runs.token)
@@ -0,0 +1,219 @@
+import json
+import os
+import uuid
+
+from mlflow.utils.file_utils import atomic_write, build_path, exists, locked_append
+from mlflow.utils.search_utils import does_metric_value_match, does_param_value_match
+
+
+class ExperimentSearchIndex(object):
+    """
+    Columnar summary of the latest value of every metric and param of the runs in an experiment,
+    used by `FileStore.search_runs` to evaluate search expressions without opening per-run files.
+
+    Writers append one JSON-encoded entry per logged value to a log file in the experiment
+    directory, which keeps updates O(1) and safe for concurrent appenders. Readers fold the log
+    into per-key columns (key -> {run UUID -> value}), reading only the bytes appended since
+    their previous read. Once the log grows past a threshold, the writer that crossed it folds the
+    whole log into a snapshot file and replaces the log with an empty one, all while holding the
+    append lock, so that neither the log nor the cost of a cold read grows without bound.
+
+    Each log starts with a line holding a random generation ID, which the snapshot covering the
+    previous logs records; a reader finding a log of another generation than the one it last read
+    reloads its state from the snapshot.
+
+    Runs are only known to the index once registered; runs written before the index existed are
+    registered lazily by the store, together with their current metric and param values.
+    """
+
+    LOG_FILE_NAME = ".search_index"
+    SNAPSHOT_FILE_NAME = ".search_index_snapshot"
+    # Size of the log above which it is folded into the snapshot and replaced with an empty log
+    SNAPSHOT_THRESHOLD_BYTES = 1024 * 1024
+
+    def __init__(self, experiment_dir):
+        self.experiment_dir = experiment_dir
+        self._log_path = build_path(experiment_dir, ExperimentSearchIndex.LOG_FILE_NAME)
+        self._snapshot_path = build_path(experiment_dir, ExperimentSearchIndex.SNAPSHOT_FILE_NAME)
+        self._runs = set()
+        self._metrics = {}
+        self._params = {}
+        # Generation of the log read so far, and offset up to which it was read (None if unread)
+        self._generation = None
+        self._offset = None
+
+    def register_run(self, run_uuid, metrics=None, params=None):
+        """
+        Marks the run as indexed, optionally along with the current values of its metrics and
+        params.
+        """
+        entries = [["r", run_uuid]]
+        # Unlike logged values, these only apply to metrics without a value in the index, since
+        # they may have been read before values logged concurrently by another process
+        entries.extend(["i"] + entry[1:] for entry in self._metric_entries(run_uuid,
+                                                                          metrics or []))
+        entries.extend(self._param_entries(run_uuid, params or []))
+        self._append(entries)
+
+    def log_metrics(self, run_uuid, metrics):
+        self._append(self._metric_entries(run_uuid, metrics))
+
+    def log_params(self, run_uuid, params):
+        self._append(self._param_entries(run_uuid, params))
+
+    @staticmethod
+    def _metric_entries(run_uuid, metrics):
+        return [["m", run_uuid, metric.key, metric.timestamp, metric.value] for metric in metrics]
+
+    @staticmethod
+    def _param_entries(run_uuid, params):
+        # Param files are read back stripped of surrounding whitespace, so index them that way
+        return [["p", run_uuid, param.key, str(param.value).strip()] for param in params]
+
+    @staticmethod
+    def _encode(entries):
+        return "".join([json.dumps(entry) + "\n" for entry in entries]).encode("utf-8")
+
+    def _append(self, entries):
+        if len(entries) == 0:
+            return
+        with locked_append(self._log_path) as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() == 0:
+                f.write(self._encode([["g", uuid.uuid4().hex]]))
+            f.write(self._encode(entries))
+            if f.tell() > ExperimentSearchIndex.SNAPSHOT_THRESHOLD_BYTES:
+                self._compact(f)
+
+    def _compact(self, f):
+        """
+        Folds the whole log, opened and locked as `f`, into the snapshot, then replaces the log
+        with an empty one of a new generation.
+        """
+        self._read_log(f, locked=True)
+        generation = uuid.uuid4().hex
+        header = self._encode([["g", generation]])
+        with atomic_write(self._log_path, "wb") as new_log:
+            new_log.write(header)
+            # The snapshot is written before the new log replaces the old one, whose lock is
+            # still held, so that readers of the new log always find its snapshot
+            snapshot = {"generation": generation, "offset": len(header), "runs": list(self._runs),
+                        "metrics": self._metrics, "params": self._params}
+            with atomic_write(self._snapshot_path) as snapshot_file:
+                json.dump(snapshot, snapshot_file)
+        self._generation = generation
+        self._offset = len(header)
+
+    def _apply(self, entry):
+        if entry[0] == "r":
+            self._runs.add(entry[1])
+        elif entry[0] == "m":
+            # The last logged value wins, like in the metric files, whatever its timestamp
+            _, run_uuid, key, timestamp, value = entry
+            self._metrics.setdefault(key, {})[run_uuid] = (timestamp, value)
+        elif entry[0] == "i":
+            _, run_uuid, key, timestamp, value = entry
+            self._metrics.setdefault(key, {}).setdefault(run_uuid, (timestamp, value))
+        elif entry[0] == "p":
+            _, run_uuid, key, value = entry
+            self._params.setdefault(key, {})[run_uuid] = value
+
+    @staticmethod
+    def _read_generation(f):
+        """
+        :return: Generation ID of the log opened as `f`, None for a log without one (e.g. an empty
+                 log), or False if its first line is only partially written.
+        """
+        f.seek(0)
+        line = f.readline()
+        if len(line) == 0:
+            return None
+        if not line.endswith(b"\n"):
+            return False
+        entry = json.loads(line.decode("utf-8"))
+        return entry[1] if entry[0] == "g" else None
+
+    def _load_snapshot(self, generation):
+        """ Resets the columns to the snapshot covering the log of the given generation, if any. """
+        self._runs, self._metrics, self._params = set(), {}, {}
+        self._generation = generation
+        self._offset = 0
+        if not exists(self._snapshot_path):
+            return
+        with open(self._snapshot_path, "r") as f:
+            snapshot = json.load(f)
+        if snapshot.get("generation") != generation:
+            # Covers another log, e.g. one that was deleted: the store re-registers runs
+            return
+        self._runs = set(snapshot["runs"])
+        self._metrics = dict((key, dict((run_uuid, tuple(metric))
+                                        for run_uuid, metric in column.items()))
+                             for key, column in snapshot["metrics"].items())
+        self._params = snapshot["params"]
+        self._offset = snapshot["offset"]
+
+    def _read_log(self, f, locked):
+        """
+        Folds the entries of the log opened as `f` that were not read yet into the columns.
+
+        :return: False if the log is of another generation than the one read so far and `f` is
+                 not locked, in which case the log must be read again while holding its lock.
+        """
+        generation = self._read_generation(f)
+        if self._offset is None or generation is False or generation != self._generation:
+            if not locked:
+                return False
+            self._load_snapshot(generation)
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        if size <= self._offset:
+            return True
+        f.seek(self._offset)
+        data = f.read(size - self._offset)
+        # Only consume complete lines; a partially written trailing entry is read next time.
+        consumed = data.rfind(b"\n") + 1
+        for line in data[:consumed].decode("utf-8").splitlines():
+            self._apply(json.loads(line))
+        self._offset += consumed
+        return True
+
+    def refresh(self):
+        """
+        Folds entries appended to the log since the last refresh, including entries written by
+        other processes, into the in-memory columns.
+        """
+        if not exists(self._log_path):
+            # The log was removed, or never written: start over, letting the store re-register runs
+            self._runs, self._metrics, self._params = set(), {}, {}
+            self._generation = self._offset = None
+            return
+        with open(self._log_path, "rb") as f:
+            if self._read_log(f, locked=False):
+                return
+        # The log was replaced since the last refresh: wait for any compaction to complete
+        with locked_append(self._log_path) as f:
+            self._read_log(f, locked=True)
+
+    def get_indexed_runs(self):
+        """ :return: Set of UUIDs of the runs registered in the index, as of the last refresh. """
+        return self._runs
+
+    def get_matching_runs(self, search_expression):
+        """
+        :return: Set of UUIDs of indexed runs satisfying `search_expression`, as of the last
+                 refresh.
+        """
+        key_type = search_expression.WhichOneof('expression')
+        if key_type == 'metric':
+            comparator = search_expression.metric.float.comparator
+            value = search_expression.metric.float.value
+            column = self._metrics.get(search_expression.metric.key, {})
+            return set(run_uuid for run_uuid, (_, metric_value) in column.items()
+                       if does_metric_value_match(metric_value, comparator, value))
+        if key_type == 'parameter':
+            comparator = search_expression.parameter.string.comparator
+            value = search_expression.parameter.string.value
+            column = self._params.get(search_expression.parameter.key, {})
+            return set(run_uuid for run_uuid, param_value in column.items()
+                       if does_param_value_match(param_value, comparator, value))
+        return set()
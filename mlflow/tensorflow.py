@@ -21,14 +21,24 @@ import tensorflow as tf
 from mlflow import pyfunc
 from mlflow.models import Model
 import mlflow.tracking
+from mlflow.utils.env import get_env
+
+
+_INTRA_OP_THREADS_ENV_VAR = "MLFLOW_TF_INTRA_OP_PARALLELISM_THREADS"
+_INTER_OP_THREADS_ENV_VAR = "MLFLOW_TF_INTER_OP_PARALLELISM_THREADS"
 
 
 class _TFWrapper(object):
     """
     Wrapper class that creates a predict function such that 
     predict(data: pandas.DataFrame) -> pandas.DataFrame
+
+    The SavedModel is loaded into a session once, when the wrapper is created, along with the
+    tensors of its signature, so that each prediction only runs the graph. `tf.Session.run` is
+    thread-safe, so `predict` can be called concurrently from several threads.
     """
-    def __init__(self, saved_model_dir):
+    def __init__(self, saved_model_dir, intra_op_parallelism_threads=None,
+                 inter_op_parallelism_threads=None):
         model = Model.load(os.path.join(saved_model_dir, "MLmodel"))
         assert "tensorflow" in model.flavors
         if not "signature_def_key" in model.flavors["tensorflow"]:
@@ -37,39 +47,35 @@ class _TFWrapper(object):
             self._signature_def_key = model.flavors["tensorflow"]["signature_def_key"]
         self._saved_model_dir = model.flavors["tensorflow"]["saved_model_dir"]
 
+        # 0 lets TensorFlow pick the number of threads
+        if intra_op_parallelism_threads is None:
+            intra_op_parallelism_threads = int(get_env(_INTRA_OP_THREADS_ENV_VAR) or 0)
+        if inter_op_parallelism_threads is None:
+            inter_op_parallelism_threads = int(get_env(_INTER_OP_THREADS_ENV_VAR) or 0)
+        config = tf.ConfigProto(intra_op_parallelism_threads=intra_op_parallelism_threads,
+                                inter_op_parallelism_threads=inter_op_parallelism_threads)
+        self._graph = tf.Graph()
+        self._session = tf.Session(graph=self._graph, config=config)
+        meta_graph_def = tf.saved_model.loader.load(self._session,
+                                                    [tf.saved_model.tag_constants.SERVING],
+                                                    self._saved_model_dir)
+        sig_def = tf.contrib.saved_model.get_signature_def_by_key(meta_graph_def,
+                                                                  self._signature_def_key)
+        # Map from input column --> input tensor
+        self._feeds = dict((sigdef_key, self._graph.get_tensor_by_name(tnsr_info.name))
+                           for sigdef_key, tnsr_info in sig_def.inputs.items())
+        # Output tensors, in the order of the signature's outputs
+        self._fetches = [self._graph.get_tensor_by_name(tnsr_info.name)
+                         for tnsr_info in sig_def.outputs.values()]
+
     def predict(self, df):
-        graph = tf.Graph()
-        with tf.Session(graph=graph) as sess:
-            meta_graph_def = tf.saved_model.loader.load(sess, 
-                                                        [tf.saved_model.tag_constants.SERVING], 
-                                                        self._saved_model_dir)
-            sig_def = tf.contrib.saved_model.get_signature_def_by_key(meta_graph_def, 
-                                                                      self._signature_def_key)
-
-            # Determining input tensors.
-            feed_mapping = {}
-            feed_names = []
-            for sigdef_key, tnsr_info in sig_def.inputs.items():
-                tnsr_name = tnsr_info.name
-                feed_mapping[sigdef_key] = tnsr_name
-                feed_names.append(tnsr_name)
-
-            # Determining output tensors.
-            fetch_mapping = {}
-            fetch_names = []
-            for sigdef_key, tnsr_info in sig_def.outputs.items():
-                tnsr_name = tnsr_info.name
-                fetch_mapping[sigdef_key] = tnsr_name
-                fetch_names.append(tnsr_name)
-
-            fetches = [graph.get_tensor_by_name(t_name) for t_name in fetch_names]
-
-            feed_dict = {}
-            for col in feed_mapping:
-                tnsr_name = feed_mapping[col]
-                feed_dict[graph.get_tensor_by_name(tnsr_name)] = df[col].values
-            data = sess.run(fetches, feed_dict=feed_dict)
-            return pandas.DataFrame(data=data[0])
+        feed_dict = dict((tensor, df[col].values) for col, tensor in self._feeds.items())
+        data = self._session.run(self._fetches, feed_dict=feed_dict)
+        return pandas.DataFrame(data=data[0])
+
+    def close(self):
+        """ Releases the resources of the session holding the model. """
+        self._session.close()
 
 
 def log_saved_model(saved_model_dir, signature_def_key, artifact_path):
@@ -89,13 +95,26 @@ def log_saved_model(saved_model_dir, signature_def_key, artifact_path):
     mlflow.tracking.log_artifacts(saved_model_dir, artifact_path)
 
 
-def load_pyfunc(saved_model_dir):
+def load_pyfunc(saved_model_dir, intra_op_parallelism_threads=None,
+                inter_op_parallelism_threads=None):
     """Load model stored in python-function format.
     The loaded model object exposes a ``predict(pandas DataFrame)`` method that returns a Pandas DataFrame 
     containing the model's inference output on an input DataFrame.
+
+    The model is loaded into a TensorFlow session once, and kept in memory until the model object
+    is closed or garbage collected, so that calls to ``predict`` do not reload it.
     
     :param saved_model_dir: Directory where the model is saved.
+    :param intra_op_parallelism_threads: Number of threads used to run a single operation of the
+                                         graph. Defaults to the value of the
+                                         MLFLOW_TF_INTRA_OP_PARALLELISM_THREADS environment
+                                         variable, or 0 to let TensorFlow choose.
+    :param inter_op_parallelism_threads: Number of threads used to run independent operations of
+                                         the graph. Defaults to the value of the
+                                         MLFLOW_TF_INTER_OP_PARALLELISM_THREADS environment
+                                         variable, or 0 to let TensorFlow choose.
     :rtype: Pyfunc format model with function `model.predict(pandas DataFrame) -> pandas DataFrame)`.
 
     """
-    return _TFWrapper(saved_model_dir)
+    return _TFWrapper(saved_model_dir, intra_op_parallelism_threads=intra_op_parallelism_threads,
+                      inter_op_parallelism_threads=inter_op_parallelism_threads)
@@ -16,6 +16,7 @@ from mlflow.entities.source_type import SourceType
 from mlflow.store.file_store import FileStore
 from mlflow.store.rest_store import RestStore
 from mlflow.store.artifact_repo import ArtifactRepository
+from mlflow.tracking.logging_queue import AsyncLoggingQueue
 from mlflow.utils import env
 
 
@@ -23,6 +24,8 @@ _RUN_NAME_ENV_VAR = "MLFLOW_RUN_NAME"
 _DEFAULT_USER_ID = "unknown"
 _LOCAL_FS_URI_PREFIX = "file:///"
 _REMOTE_URI_PREFIX = "http://"
+# Schemes of the database URIs of SqlAlchemyStore, e.g. sqlite:///mlflow.db
+_DATABASE_ENGINES = ["sqlite", "postgresql"]
 _TRACKING_URI_ENV_VAR = "MLFLOW_TRACKING_URI"
 _EXPERIMENT_ID_ENV_VAR = "MLFLOW_EXPERIMENT_ID"
 _active_run = None
@@ -81,6 +84,16 @@ def _get_rest_store(store_uri):
     return RestStore(store_uri)
 
 
+def _is_database_uri(uri):
+    scheme = urllib.parse.urlparse(uri).scheme
+    return scheme.split("+", 1)[0] in _DATABASE_ENGINES
+
+
+def _get_sqlalchemy_store(store_uri):
+    from mlflow.store.sqlalchemy_store import SqlAlchemyStore
+    return SqlAlchemyStore(store_uri)
+
+
 def _get_store():
     store_uri = get_tracking_uri()
     # Default: if URI hasn't been set, return a FileStore
@@ -91,10 +104,13 @@ def _get_store():
         return _get_file_store(store_uri)
     if _is_http_uri(store_uri):
         return _get_rest_store(store_uri)
+    if _is_database_uri(store_uri):
+        return _get_sqlalchemy_store(store_uri)
 
-    raise Exception("Tracking URI must be a local filesystem URI of the form '%s...' or a "
-                    "remote URI of the form '%s...'. Please update the tracking URI via "
-                    "mlflow.set_tracking_uri" % (_LOCAL_FS_URI_PREFIX, _REMOTE_URI_PREFIX))
+    raise Exception("Tracking URI must be a local filesystem URI of the form '%s...', a "
+                    "remote URI of the form '%s...' or a database URI of the form "
+                    "'<%s>://...'. Please update the tracking URI via mlflow.set_tracking_uri"
+                    % (_LOCAL_FS_URI_PREFIX, _REMOTE_URI_PREFIX, "|".join(_DATABASE_ENGINES)))
 
 
 class ActiveRun(object):
@@ -107,10 +123,15 @@ class ActiveRun(object):
     :param run_info: RunInfo describing the active run. A corresponding `Run` object is assumed to
                      already be persisted with state "running" in `store`.
     :param store: Backend store to which the current run should persist state updates.
+    :param async_logging: If True, metrics and params are enqueued and written to `store` in
+                          batches by a background thread instead of blocking the caller. Pending
+                          values are flushed when the run is terminated.
     """
-    def __init__(self, run_info, store):
+    def __init__(self, run_info, store, async_logging=False):
         self.store = store
         self.run_info = run_info
+        self._logging_queue = AsyncLoggingQueue(store, run_info.run_uuid) \
+            if async_logging else None
         if run_info.artifact_uri:
             self.artifact_repo = ArtifactRepository.from_artifact_uri(run_info.artifact_uri)
         else:
@@ -119,15 +140,36 @@ class ActiveRun(object):
         _active_run = self
 
     def set_terminated(self, status):
-        self.run_info = self.store.update_run_info(
-            self.run_info.run_uuid, run_status=RunStatus.from_string(status),
-            end_time=_get_unix_timestamp())
+        try:
+            if self._logging_queue is not None:
+                self._logging_queue.close()
+        finally:
+            self.run_info = self.store.update_run_info(
+                self.run_info.run_uuid, run_status=RunStatus.from_string(status),
+                end_time=_get_unix_timestamp())
 
     def log_metric(self, metric):
-        self.store.log_metric(self.run_info.run_uuid, metric)
+        if self._logging_queue is not None:
+            self._logging_queue.log_metric(metric)
+        else:
+            self.store.log_metric(self.run_info.run_uuid, metric)
 
     def log_param(self, param):
-        self.store.log_param(self.run_info.run_uuid, param)
+        if self._logging_queue is not None:
+            self._logging_queue.log_param(param)
+        else:
+            self.store.log_param(self.run_info.run_uuid, param)
+
+    def log_batch(self, metrics, params):
+        if self._logging_queue is not None:
+            self._logging_queue.log_batch(metrics, params)
+        else:
+            self.store.log_batch(self.run_info.run_uuid, metrics, params, tags=[])
+
+    def flush(self):
+        """ Blocks until all metrics and params logged asynchronously have been persisted. """
+        if self._logging_queue is not None:
+            self._logging_queue.flush()
 
     def log_artifact(self, local_path, artifact_path=None):
         self.artifact_repo.log_artifact(local_path, artifact_path)
@@ -139,6 +181,7 @@ class ActiveRun(object):
         return self.artifact_repo.artifact_uri
 
     def get_run(self):
+        self.flush()
         return self.store.get_run(self.run_info.run_uuid)
 
     def __enter__(self):
@@ -201,7 +244,7 @@ def _get_unix_timestamp():
 
 
 def _do_start_run(run_uuid=None, experiment_id=None, source_name=None, source_version=None,
-                  entry_point_name=None, source_type=None):
+                  entry_point_name=None, source_type=None, async_logging=False):
     store = _get_store()
 
     if run_uuid is not None:
@@ -210,7 +253,7 @@ def _do_start_run(run_uuid=None, experiment_id=None, source_name=None, source_ve
             raise Exception("Could not start run with UUID %s - no such run found." % run_uuid)
         updated_info = store.update_run_info(
             run_uuid=run_uuid, run_status=RunStatus.RUNNING, end_time=None)
-        return ActiveRun(updated_info, store)
+        return ActiveRun(updated_info, store, async_logging)
 
     # Get experiment ID for run
     exp_id_for_run = experiment_id or _get_experiment_id()
@@ -220,11 +263,11 @@ def _do_start_run(run_uuid=None, experiment_id=None, source_name=None, source_ve
                            entry_point_name=entry_point_name,
                            start_time=_get_unix_timestamp(),
                            source_version=(source_version or _get_source_version()), tags=[])
-    return ActiveRun(run.info, store)
+    return ActiveRun(run.info, store, async_logging)
 
 
 def start_run(run_uuid=None, experiment_id=None, source_name=None, source_version=None,
-              entry_point_name=None, source_type=None):
+              entry_point_name=None, source_type=None, async_logging=False):
     """
     Start a new MLflow run, setting it as the active run under which metrics and params
     will be logged. The return value can be used as a context manager within a `with` block;
@@ -247,6 +290,10 @@ def start_run(run_uuid=None, experiment_id=None, source_name=None, source_versio
     :param entry_point_name: Optional name of the entry point for to the current run.
     :param source_type: Integer enum value describing the type of the run ("local", "project", etc).
                         Defaults to mlflow.entities.source_type.SourceType.LOCAL.
+    :param async_logging: If True, metrics and params logged under the run are written to the
+                          tracking store in batches by a background thread, so logging calls do
+                          not block on the store. Pending values are flushed by `end_run`, when
+                          exiting the run's `with` block, and when the process exits.
     :return: A :class:`ActiveRun` object that acts as a context manager wrapping the run's state
     """
     global _active_run
@@ -254,7 +301,7 @@ def start_run(run_uuid=None, experiment_id=None, source_name=None, source_versio
         return _active_run
     if _RUN_NAME_ENV_VAR not in os.environ:
         return _do_start_run(run_uuid, experiment_id, source_name, source_version,
-                             entry_point_name, source_type)
+                             entry_point_name, source_type, async_logging)
 
     # Load an existing run ID from the environment
     existing_run_uuid = os.environ[_RUN_NAME_ENV_VAR]
@@ -264,7 +311,7 @@ def start_run(run_uuid=None, experiment_id=None, source_name=None, source_versio
     # that ID and update the global _active_run
     # TODO: This doesn't play well with the atexit.register(end_run) call; specifically each
     # time a process with the current run ID exits, the run will be marked as terminated.
-    _active_run = ActiveRun(run.info, store)
+    _active_run = ActiveRun(run.info, store, async_logging)
     return _active_run
 
 
@@ -311,6 +358,33 @@ def log_metric(key, value):
     _get_or_start_run().log_metric(Metric(key, value, int(time.time())))
 
 
+def log_params(params):
+    """
+    Logs multiple parameters under the current run in a single store call, creating a run if
+    necessary.
+    :param params: Dictionary of parameter name (string) -> value (string)
+    """
+    _get_or_start_run().log_batch(metrics=[],
+                                  params=[Param(key, str(value)) for key, value in params.items()])
+
+
+def log_metrics(metrics):
+    """
+    Logs multiple metrics under the current run in a single store call, creating a run if
+    necessary. All metrics are logged with the same timestamp.
+    :param metrics: Dictionary of metric name (string) -> value (float)
+    """
+    timestamp = int(time.time())
+    metric_objs = []
+    for key, value in metrics.items():
+        if not isinstance(value, numbers.Number):
+            print("WARNING: The metric {}={} was not logged because the value is not a "
+                  "number.".format(key, value), file=sys.stderr)
+            continue
+        metric_objs.append(Metric(key, value, timestamp))
+    _get_or_start_run().log_batch(metrics=metric_objs, params=[])
+
+
 def log_artifact(local_path, artifact_path=None):
     """Log a local file or directory as an artifact of the currently active run."""
     _get_or_start_run().log_artifact(local_path, artifact_path)
@@ -0,0 +1,117 @@
+import threading
+
+from six.moves import queue
+
+from mlflow.entities.metric import Metric
+from mlflow.entities.param import Param
+from mlflow.utils.logging_utils import eprint
+
+
+# Marker enqueued by `close()` to stop the background thread once all prior items are written.
+_STOP = object()
+
+
+class AsyncLoggingQueue(object):
+    """
+    In-process queue of metrics and params for a single run, drained by a background thread.
+
+    Logging calls return as soon as the value is enqueued. The background thread coalesces all
+    values pending at the time it wakes up into a single `log_batch` call against the store, so
+    that logging from a tight training loop costs one store write (e.g. one HTTP request) per
+    batch instead of one per value.
+
+    :param store: Backend store implementing `log_batch`.
+    :param run_uuid: Run under which values are logged.
+    :param max_queue_size: Maximum number of values that can be pending at any point in time.
+    :param block_when_full: Backpressure policy applied when the queue is full. If True, logging
+                            calls block until the background thread catches up; otherwise the
+                            value is dropped and a warning is printed.
+    :param max_batch_size: Maximum number of values written in a single store call.
+    """
+
+    def __init__(self, store, run_uuid, max_queue_size=10000, block_when_full=True,
+                 max_batch_size=1000):
+        self.store = store
+        self.run_uuid = run_uuid
+        self._block_when_full = block_when_full
+        self._max_batch_size = max_batch_size
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._error = None
+        self._closed = False
+        self.num_dropped = 0
+        self._thread = threading.Thread(target=self._drain, name="mlflow-logging-%s" % run_uuid)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def log_metric(self, metric):
+        self._put(metric)
+
+    def log_param(self, param):
+        self._put(param)
+
+    def log_batch(self, metrics, params):
+        for metric in metrics:
+            self._put(metric)
+        for param in params:
+            self._put(param)
+
+    def _put(self, item):
+        if self._closed:
+            raise Exception("Cannot log to run %s: its logging queue is closed." % self.run_uuid)
+        try:
+            self._queue.put(item, block=self._block_when_full)
+        except queue.Full:
+            if self.num_dropped == 0:
+                eprint("WARNING: The logging queue for run %s is full, dropping values. Consider "
+                       "increasing the queue size or blocking when it is full." % self.run_uuid)
+            self.num_dropped += 1
+
+    def _drain(self):
+        while True:
+            items = [self._queue.get()]
+            while items[-1] is not _STOP and len(items) < self._max_batch_size:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._write([item for item in items if item is not _STOP])
+            finally:
+                for _ in items:
+                    self._queue.task_done()
+            if items[-1] is _STOP:
+                return
+
+    def _write(self, items):
+        metrics = [item for item in items if isinstance(item, Metric)]
+        params = [item for item in items if isinstance(item, Param)]
+        if len(metrics) == 0 and len(params) == 0:
+            return
+        try:
+            self.store.log_batch(self.run_uuid, metrics, params, [])
+        except Exception as e:  # pylint: disable=broad-except
+            # Surface the failure to the logging thread on the next flush
+            if self._error is None:
+                self._error = e
+
+    def flush(self):
+        """
+        Blocks until every value enqueued so far has been written to the store. Raises an
+        exception if any background write failed since the last flush.
+        """
+        self._queue.join()
+        error, self._error = self._error, None
+        if error is not None:
+            raise Exception("Asynchronous logging for run %s failed: %s" % (self.run_uuid, error))
+
+    def close(self):
+        """
+        Flushes all pending values and stops the background thread. No values can be logged
+        after the queue has been closed.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join()
+        self.flush()
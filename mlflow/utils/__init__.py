@@ -1,6 +1,13 @@
+import json
+
 import numpy as np
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def ndarray2list(ndarray):
     """
@@ -9,23 +16,92 @@ def ndarray2list(ndarray):
     :param ndarray: numpy array
     :return: list representation of the numpy array with element types convereted to native python
     """
+    if ndarray.dtype != np.object_:
+        # Converts the whole array at once, elements included
+        return ndarray.tolist()
     if len(ndarray.shape) <= 1:
-        return [x.item() for x in ndarray]
+        return [x.item() if isinstance(x, np.generic) else x for x in ndarray]
     return [ndarray2list(ndarray[i, :]) for i in range(0, ndarray.shape[0])]
 
 
-def get_jsonable_obj(data):
+def _series2list(series):
+    values = series.values
+    if isinstance(values, np.ndarray) and (np.issubdtype(values.dtype, np.number) or
+                                           values.dtype == np.bool_):
+        return values.tolist()
+    # Boxes other types (e.g. datetimes) the same way as DataFrame.to_dict
+    return series.tolist()
+
+
+def _dataframe2records(df):
+    """
+    Equivalent of `df.to_dict(orient='records')`, converting the values column by column rather
+    than row by row.
+    """
+    columns = list(df.columns)
+    values = [_series2list(df.iloc[:, i]) for i in range(len(columns))]
+    return [dict(zip(columns, row)) for row in zip(*values)]
+
+
+def get_jsonable_obj(data, pandas_orient="records"):
     """Attempt to make the data json-able via standard library.
     Look for some commonly used types that are not jsonable and convert them into json-able ones.
     Unknown data types are returned as is.
 
     :param data: data to be converted, works with padnas and numpy, rest will be returned as is.
+    :param pandas_orient: Layout of pandas DataFrames and Series: "records" for a list of
+                          {column: value} rows, or "list" for a {column: [values]} dictionary,
+                          which is much faster to build for many rows.
     """
     if isinstance(data, np.ndarray):
         return ndarray2list(data)
-    if isinstance(data, pd.DataFrame):
-        return data.to_dict(orient='records')
     if isinstance(data, pd.Series):
-        return pd.DataFrame(data).to_dict(orient='records')
+        data = pd.DataFrame(data)
+    if isinstance(data, pd.DataFrame):
+        if not data.columns.is_unique:
+            return data.to_dict(orient=pandas_orient)
+        if pandas_orient == "list":
+            return dict((column, _series2list(data.iloc[:, i]))
+                        for i, column in enumerate(data.columns))
+        return _dataframe2records(data)
     else:  # by default just return whatever this is and hope for the best
         return data
+
+
+def _replace_non_finite(data):
+    """ :return: Copy of the lists and dicts of `data` with NaN and infinite floats as None. """
+    if isinstance(data, float):
+        return data if np.isfinite(data) else None
+    if isinstance(data, (list, tuple)):
+        return [_replace_non_finite(x) for x in data]
+    if isinstance(data, dict):
+        return dict((key, _replace_non_finite(value)) for key, value in data.items())
+    return data
+
+
+def dumps_jsonable_obj(data, pandas_orient="records"):
+    """
+    Serialize data to a JSON string, converting numpy and pandas objects with `get_jsonable_obj`.
+    Uses the much faster orjson encoder when it is installed. Either way, NaN and infinite floats
+    are encoded as null rather than as the non-standard NaN and Infinity.
+
+    :param data: data to be serialized.
+    :param pandas_orient: Layout of pandas DataFrames and Series, see `get_jsonable_obj`.
+    :return: JSON string.
+    """
+    if orjson is not None:
+        if isinstance(data, np.ndarray) and data.dtype != np.object_:
+            # Serialized directly, without converting the elements to Python objects
+            try:
+                return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY).decode("utf-8")
+            except TypeError:
+                # e.g. non-contiguous arrays or unsupported element types
+                pass
+        return orjson.dumps(get_jsonable_obj(data, pandas_orient),
+                            option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    data = get_jsonable_obj(data, pandas_orient)
+    try:
+        return json.dumps(data, allow_nan=False)
+    except ValueError:
+        # Only data holding non-finite floats is copied
+        return json.dumps(_replace_non_finite(data))
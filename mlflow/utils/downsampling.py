@@ -0,0 +1,83 @@
+import numpy as np
+
+
+MEAN = "mean"
+MIN = "min"
+MAX = "max"
+LTTB = "lttb"
+AGGREGATIONS = [MEAN, MIN, MAX, LTTB]
+
+
+def _get_bucket_bounds(num_values, num_buckets):
+    """ Splits `num_values` consecutive values into `num_buckets` buckets of near-equal sizes. """
+    return np.linspace(0, num_values, num_buckets + 1).astype(np.int64)
+
+
+def _downsample_buckets(timestamps, values, max_points, aggregation):
+    bounds = _get_bucket_bounds(len(values), max_points)
+    starts = bounds[:-1]
+    if aggregation == MEAN:
+        sums = np.add.reduceat(values, starts)
+        return timestamps[starts], sums / np.diff(bounds)
+    select = np.argmin if aggregation == MIN else np.argmax
+    indices = np.array([start + select(values[start:end])
+                        for start, end in zip(starts, bounds[1:])], dtype=np.int64)
+    return timestamps[indices], values[indices]
+
+
+def _downsample_lttb(timestamps, values, max_points):
+    """
+    Largest-Triangle-Three-Buckets (Steinarsson, 2013): keeps the first and last values, and from
+    each bucket in between the value forming the largest triangle with the value kept from the
+    previous bucket and the average of the next bucket.
+    """
+    num_values = len(values)
+    x = timestamps.astype(np.float64)
+    bounds = _get_bucket_bounds(num_values - 2, max_points - 2) + 1
+    indices = np.empty(max_points, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = num_values - 1
+    for bucket in range(max_points - 2):
+        start, end = bounds[bucket], bounds[bucket + 1]
+        if bucket + 2 < len(bounds):
+            next_start, next_end = end, bounds[bucket + 2]
+        else:
+            next_start, next_end = num_values - 1, num_values
+        next_x = x[next_start:next_end].mean()
+        next_y = values[next_start:next_end].mean()
+        prev_x, prev_y = x[indices[bucket]], values[indices[bucket]]
+        areas = np.abs((prev_x - next_x) * (values[start:end] - prev_y) -
+                       (prev_x - x[start:end]) * (next_y - prev_y))
+        indices[bucket + 1] = start + np.argmax(areas)
+    return timestamps[indices], values[indices]
+
+
+def downsample(timestamps, values, max_points, aggregation=None):
+    """
+    Reduces a metric history to at most `max_points` values, e.g. so that a long training curve
+    can be charted without transferring every value.
+
+    :param timestamps: NumPy array of the timestamps of the values, in the order they were logged.
+    :param values: NumPy array of the values.
+    :param max_points: Maximum number of values to return. Histories with at most this many
+                       values are returned unchanged.
+    :param aggregation: One of "mean" (the default), "min", "max" or "lttb". The first three
+                        split the history into `max_points` consecutive buckets of near-equal
+                        sizes and return the mean value of each bucket at its first timestamp,
+                        or its minimum or maximum value at its own timestamp. "lttb" selects the
+                        values that best preserve the visual shape of the curve.
+    :return: Pair of NumPy arrays holding the timestamps and values of the downsampled history.
+    """
+    aggregation = aggregation or MEAN
+    if aggregation not in AGGREGATIONS:
+        raise Exception("Invalid aggregation '%s'. Expected one of %s."
+                        % (aggregation, ", ".join(AGGREGATIONS)))
+    if max_points <= 0:
+        raise Exception("Invalid value for max_points: %s. It must be positive." % max_points)
+    if len(values) <= max_points:
+        return timestamps, values
+    if aggregation == LTTB:
+        if max_points < 3:
+            raise Exception("LTTB downsampling requires max_points to be at least 3.")
+        return _downsample_lttb(timestamps, values, max_points)
+    return _downsample_buckets(timestamps, values, max_points, aggregation)
@@ -1,12 +1,31 @@
+import json
 import os
 import shutil
 import tempfile
+import uuid
+from contextlib import contextmanager
 
 import yaml
 
+try:
+    import fcntl
+except ImportError:
+    # Not available on Windows
+    fcntl = None
+
+try:
+    # Use the much faster libyaml bindings when PyYAML was built with them
+    from yaml import CSafeLoader as YamlSafeLoader, CSafeDumper as YamlSafeDumper
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader, SafeDumper as YamlSafeDumper
+
 from mlflow.entities.file_info import FileInfo
 
 
+# Prefix of the temporary files written by `atomic_write`, which directory listings should skip
+TMP_FILE_PREFIX = ".mlflow-tmp-"
+
+
 def is_directory(name):
     return os.path.isdir(name)
 
@@ -99,7 +118,52 @@ def mkdir(root, name=None):  # noqa
         raise e
 
 
-def write_yaml(root, file_name, data, overwrite=False):
+class YamlCodec(object):
+    """ Block-style YAML, the default and most human-readable metadata format. """
+    name = "yaml"
+
+    @staticmethod
+    def dump(data, stream):
+        yaml.dump(data, stream, Dumper=YamlSafeDumper, default_flow_style=False,
+                  allow_unicode=True)
+
+    @staticmethod
+    def loads(content):
+        return yaml.load(content, Loader=YamlSafeLoader)
+
+
+class JsonCodec(object):
+    """
+    Compact JSON, which is much faster to parse than YAML. JSON being a subset of YAML, files
+    written in this format remain readable by any YAML parser, e.g. by earlier versions of MLflow.
+    """
+    name = "json"
+
+    @staticmethod
+    def dump(data, stream):
+        json.dump(data, stream, separators=(",", ":"))
+
+    @staticmethod
+    def loads(content):
+        return json.loads(content)
+
+
+METADATA_CODECS = dict((codec.name, codec) for codec in [YamlCodec, JsonCodec])
+
+
+def get_metadata_codec(name):
+    """
+    :param name: Name of a metadata format, one of the keys of `METADATA_CODECS`.
+    :return: Codec writing metadata in this format, with `dump(data, stream)` and
+             `loads(content)` static methods.
+    """
+    if name not in METADATA_CODECS:
+        raise Exception("Invalid metadata format '%s'. Expected one of %s."
+                        % (name, ", ".join(sorted(METADATA_CODECS.keys()))))
+    return METADATA_CODECS[name]
+
+
+def write_yaml(root, file_name, data, overwrite=False, codec=YamlCodec):
     """
     Write dictionary data in yaml format.
 
@@ -107,6 +171,8 @@ def write_yaml(root, file_name, data, overwrite=False):
     :param file_name: Desired file name. Will automatically add .yaml extension if not given
     :param data: data to be dumped as yaml format
     :param overwrite: If True, will overwrite existing files
+    :param codec: Codec serializing the data, `YamlCodec` or `JsonCodec` (which writes YAML in
+                  JSON syntax)
     """
     if not exists(root):
         raise Exception("Parent directory '%s' does not exist." % root)
@@ -118,15 +184,16 @@ def write_yaml(root, file_name, data, overwrite=False):
         raise Exception("Yaml file '%s' exists as '%s" % (file_path, yaml_file_name))
 
     try:
-        with open(yaml_file_name, 'w') as yaml_file:
-            yaml.safe_dump(data, yaml_file, default_flow_style=False, allow_unicode=True)
+        with atomic_write(yaml_file_name) as yaml_file:
+            codec.dump(data, yaml_file)
     except Exception as e:
         raise e
 
 
 def read_yaml(root, file_name):
     """
-    Read data from yaml file and return as dictionary
+    Read data from yaml file and return as dictionary. Files written in JSON syntax, e.g. by
+    `JsonCodec`, are parsed by `JsonCodec`, whose JSON parser is much faster than the YAML one.
 
     :param root: Directory name
     :param file_name: File name. Expects to have '.yaml' extension
@@ -142,7 +209,14 @@ def read_yaml(root, file_name):
 
     try:
         with open(file_path, 'r') as yaml_file:
-            return yaml.safe_load(yaml_file)
+            content = yaml_file.read()
+        if content.startswith("{"):
+            try:
+                return JsonCodec.loads(content)
+            except ValueError:
+                # A YAML flow mapping that is not valid JSON
+                pass
+        return YamlCodec.loads(content)
     except Exception as e:
         raise e
 
@@ -190,6 +264,66 @@ def read_file(parent_path, file_name):
         return f.readlines()
 
 
+def read_last_line(parent_path, file_name, block_size=4096):
+    """
+    Return the last non-empty line of the file, reading it backwards from its end in blocks so
+    that the cost does not depend on the size of the file.
+
+    :param parent_path: Full path to the directory that contains the file
+    :param file_name: Leaf file name
+    :param block_size: Number of bytes read at a time
+
+    :return: Last non-empty line of the file without its line terminator, or None if the file has
+             no non-empty line
+    """
+    file_path = os.path.join(parent_path, file_name)
+    with open(file_path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        data = b""
+        while position > 0:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            data = f.read(read_size) + data
+            stripped = data.rstrip()
+            # The last line is complete once a line break precedes its first character
+            start = max(stripped.rfind(b"\n"), stripped.rfind(b"\r"))
+            if start >= 0 or (position == 0 and len(stripped) > 0):
+                return stripped[start + 1:].decode("utf-8")
+        return None
+
+
+class FileLock(object):
+    """
+    Exclusive advisory lock on a file, held across processes and threads for the duration of a
+    `with` block. The file is created if needed. Locking relies on `fcntl`, so on platforms
+    without it (i.e. Windows) the lock is a no-op.
+
+    :param path: Path of the lock file
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+
+    def __enter__(self):
+        # Each lock opens the file anew: locks held through distinct open files exclude each
+        # other even within a process
+        self._file = open(self.path, "a")
+        if fcntl is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, tp, val, traceback):
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        finally:
+            self._file.close()
+            self._file = None
+
+
 def get_file_info(path, rel_path):
     """
     Returns file meta data : location, size, ... etc
@@ -219,14 +353,77 @@ def get_relative_path(root_path, target_path):
     return os.path.relpath(target_path, common_prefix)
 
 
+def _replace_file(src, dst):
+    """
+    Renames `src` to `dst`, replacing `dst` if it exists. Unlike `os.rename`, this also works on
+    Windows, where `os.replace` is atomic but is only available on Python 3; on Python 2 the
+    existing file is removed first there.
+    """
+    if hasattr(os, "replace"):
+        os.replace(src, dst)
+        return
+    if os.name == "nt" and os.path.exists(dst):
+        os.remove(dst)
+    os.rename(src, dst)
+
+
+@contextmanager
+def atomic_write(filename, mode="w"):
+    """
+    Yields a temporary file, created in the same directory as `filename`, which atomically
+    replaces `filename` once the `with` block completes. Concurrent readers thus see either the
+    previous or the new content of the file, never a partially written one. The temporary file is
+    deleted if the block raises.
+
+    :param filename: Path of the file to write
+    :param mode: Mode in which the temporary file is opened, "w" or "wb"
+    """
+    directory, name = os.path.split(filename)
+    tmp_path = os.path.join(directory, "%s%s-%s" % (TMP_FILE_PREFIX, name, uuid.uuid4().hex))
+    # Unlike tempfile.mkstemp, honour the umask so the file gets the usual permissions
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, mode) as handle:
+            yield handle
+        _replace_file(tmp_path, filename)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+@contextmanager
+def locked_append(filename):
+    """
+    Yields `filename` opened in "a+b" mode, creating it if needed, while holding an exclusive lock
+    on it, so that appends made concurrently by other processes or threads are never interleaved.
+    If the file is replaced (see `atomic_write`) while waiting for the lock, the new file is
+    locked instead, so that nothing is appended to a file that is no longer reachable.
+    Locking relies on `fcntl`, so on platforms without it (i.e. Windows) only the atomicity of
+    each write protects concurrent appends.
+    """
+    while True:
+        handle = open(filename, "a+b")
+        try:
+            if fcntl is not None:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+                if os.fstat(handle.fileno()).st_ino != os.stat(filename).st_ino:
+                    continue
+            yield handle
+            return
+        finally:
+            # Also releases the lock
+            handle.close()
+
+
 def write_to(filename, data):
-    with open(filename, "w") as handle:
+    with atomic_write(filename) as handle:
         handle.write(data)
 
 
 def append_to(filename, data):
-    with open(filename, "a") as handle:
-        handle.write(data)
+    with locked_append(filename) as handle:
+        handle.write(data.encode("utf-8"))
 
 
 def _copy_project(src_path, dst_path=""):
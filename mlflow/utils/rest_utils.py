@@ -1,7 +1,40 @@
 import base64
 import json
+import threading
 
 import requests
+from requests.adapters import HTTPAdapter
+from requests.packages.urllib3.util.retry import Retry  # pylint: disable=import-error
+
+from mlflow.utils.env import get_env
+
+
+_POOL_SIZE_ENV_VAR = "MLFLOW_HTTP_POOL_SIZE"
+_MAX_RETRIES_ENV_VAR = "MLFLOW_HTTP_REQUEST_MAX_RETRIES"
+_BACKOFF_FACTOR_ENV_VAR = "MLFLOW_HTTP_REQUEST_BACKOFF_FACTOR"
+_TIMEOUT_ENV_VAR = "MLFLOW_HTTP_REQUEST_TIMEOUT"
+
+_DEFAULT_POOL_SIZE = 10
+_DEFAULT_MAX_RETRIES = 3
+_DEFAULT_BACKOFF_FACTOR = 0.5
+_DEFAULT_TIMEOUT = 120
+
+# Responses with these status codes are retried for idempotent requests. 500 is not among them, as
+# the tracking server answers deterministic errors (e.g. a missing run) with it.
+_RETRY_STATUS_CODES = [502, 503, 504]
+
+# Map from hostname --> requests.Session used for all requests to that host.
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+class RestException(Exception):
+    """ Raised by `http_request_raw` for responses with another status than 200. """
+
+    def __init__(self, message, status_code, text):
+        super(RestException, self).__init__(message)
+        self.status_code = status_code
+        self.text = text
 
 
 def databricks_api_request(hostname, endpoint, method, token=None, auth=None, req_body_json=None,
@@ -19,11 +52,55 @@ def databricks_api_request(hostname, endpoint, method, token=None, auth=None, re
                         headers=headers, req_body_json=req_body_json, params=params)
 
 
-def http_request(hostname, endpoint, method, auth, headers, req_body_json, params):
+def _get_request_session(hostname):
+    """
+    Returns the `requests.Session` shared by all requests to `hostname`, creating it if needed.
+
+    Reusing a session keeps connections to the host alive in a pool, so consecutive requests do
+    not each pay for a new TCP (and TLS) handshake. Sessions are never mutated after creation,
+    which makes them safe to share across threads. Failed connection attempts, and idempotent
+    requests answered with a 502, 503 or 504 status, are retried with exponential backoff.
+    """
+    session = _sessions.get(hostname)
+    if session is not None:
+        return session
+    with _sessions_lock:
+        if hostname not in _sessions:
+            pool_size = int(get_env(_POOL_SIZE_ENV_VAR) or _DEFAULT_POOL_SIZE)
+            max_retries = int(get_env(_MAX_RETRIES_ENV_VAR) or _DEFAULT_MAX_RETRIES)
+            backoff_factor = float(get_env(_BACKOFF_FACTOR_ENV_VAR) or _DEFAULT_BACKOFF_FACTOR)
+            retry = Retry(total=max_retries, backoff_factor=backoff_factor,
+                          status_forcelist=_RETRY_STATUS_CODES, raise_on_status=False)
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+            session = requests.Session()
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _sessions[hostname] = session
+        return _sessions[hostname]
+
+
+def http_request_raw(hostname, endpoint, method, auth, headers, req_body_json, params,
+                     timeout=None, data=None):
+    """
+    Sends a request to `hostname` and returns the `requests.Response` if its status is 200.
+
+    :param data: Raw request body, sent instead of `req_body_json` when specified.
+    """
     url = "%s%s" % (hostname, endpoint)
-    response = requests.request(method=method, url=url, headers=headers, verify=False,
-                                params=params, json=req_body_json, auth=auth)
+    if timeout is None:
+        timeout = float(get_env(_TIMEOUT_ENV_VAR) or _DEFAULT_TIMEOUT)
+    response = _get_request_session(hostname).request(
+        method=method, url=url, headers=headers, verify=False, params=params,
+        json=req_body_json if data is None else None, data=data, auth=auth, timeout=timeout)
     if response.status_code != 200:
-        raise Exception("Databricks API request to %s failed with code %s != 200. API "
-                        "response: %s" % (url, response.status_code, response.text))
+        raise RestException("Databricks API request to %s failed with code %s != 200. API "
+                            "response: %s" % (url, response.status_code, response.text),
+                            response.status_code, response.text)
+    return response
+
+
+def http_request(hostname, endpoint, method, auth, headers, req_body_json, params, timeout=None):
+    response = http_request_raw(hostname=hostname, endpoint=endpoint, method=method, auth=auth,
+                                headers=headers, req_body_json=req_body_json, params=params,
+                                timeout=timeout)
     return json.loads(response.text)
@@ -1,3 +1,30 @@
+def does_metric_value_match(metric_value, comparator, value):
+    if comparator == '>':
+        return metric_value > value
+    elif comparator == '>=':
+        return metric_value >= value
+    elif comparator == '=':
+        return metric_value == value
+    elif comparator == '!=':
+        return metric_value != value
+    elif comparator == '<=':
+        return metric_value <= value
+    elif comparator == '<':
+        return metric_value < value
+    else:
+        raise Exception("Invalid comparator '%s' not one of '>, >=, =, !=, <=, <"
+                        % comparator)
+
+
+def does_param_value_match(param_value, comparator, value):
+    if comparator == '=':
+        return param_value == value
+    elif comparator == '!=':
+        return param_value != value
+    else:
+        raise Exception("Invalid comparator '%s' not one of '=, !=" % comparator)
+
+
 def does_run_match_clause(run, search_expression):
     key_type = search_expression.WhichOneof('expression')
     if key_type == 'metric':
@@ -7,21 +34,7 @@ def does_run_match_clause(run, search_expression):
         metric = next((m for m in run.data.metrics if m.key == key), None)
         if metric is None:
             return False
-        if comparator == '>':
-            return metric.value > value
-        elif comparator == '>=':
-            return metric.value >= value
-        elif comparator == '=':
-            return metric.value == value
-        elif comparator == '!=':
-            return metric.value != value
-        elif comparator == '<=':
-            return metric.value <= value
-        elif comparator == '<':
-            return metric.value < value
-        else:
-            raise Exception("Invalid comparator '%s' not one of '>, >=, =, !=, <=, <"
-                            % comparator)
+        return does_metric_value_match(metric.value, comparator, value)
     if key_type == 'parameter':
         key = search_expression.parameter.key
         comparator = search_expression.parameter.string.comparator
@@ -29,10 +42,45 @@ def does_run_match_clause(run, search_expression):
         param = next((p for p in run.data.params if p.key == key), None)
         if param is None:
             return False
-        if comparator == '=':
-            return param.value == value
-        elif comparator == '!=':
-            return param.value != value
-        else:
-            raise Exception("Invalid comparator '%s' not one of '=, !=" % comparator)
+        return does_param_value_match(param.value, comparator, value)
     return False
+
+
+# RunInfo attributes that runs can be ordered by
+_ORDER_BY_ATTRIBUTES = ["run_uuid", "experiment_id", "name", "source_type", "source_name",
+                        "entry_point_name", "user_id", "status", "start_time", "end_time",
+                        "source_version", "artifact_uri"]
+
+DEFAULT_ORDER_BY = ["start_time DESC"]
+
+
+def _parse_order_by(order_by_clause):
+    tokens = order_by_clause.split()
+    if len(tokens) == 0 or len(tokens) > 2 or tokens[0] not in _ORDER_BY_ATTRIBUTES or \
+            (len(tokens) == 2 and tokens[1].upper() not in ["ASC", "DESC"]):
+        raise Exception("Invalid order_by clause '%s'. Expected a RunInfo attribute, one of %s, "
+                        "optionally followed by 'ASC' or 'DESC'."
+                        % (order_by_clause, ", ".join(_ORDER_BY_ATTRIBUTES)))
+    return tokens[0], len(tokens) == 1 or tokens[1].upper() == "ASC"
+
+
+def sort_run_infos(run_infos, order_by=None):
+    """
+    Sorts RunInfo objects according to a list of clauses of the form "<attribute> [ASC|DESC]",
+    defaulting to `DEFAULT_ORDER_BY`. Ties are broken by run UUID, so the order is deterministic.
+    """
+    def sort_key(attribute):
+        # Unset values (e.g. the end time of an active run) compare greater than any set value.
+        def key(run_info):
+            value = getattr(run_info, attribute)
+            return (True, 0) if value is None else (False, value)
+        return key
+
+    clauses = [_parse_order_by(clause) for clause in (order_by or DEFAULT_ORDER_BY)]
+    sorted_infos = sorted(run_infos, key=lambda run_info: run_info.run_uuid)
+    # Python's sort is stable, so sorting by each clause from the least to the most significant
+    # one yields the combined order.
+    for attribute, ascending in reversed(clauses):
+        sorted_infos.sort(key=sort_key(attribute), reverse=not ascending)
+    return sorted_infos
+
@@ -45,6 +45,8 @@ setup(
         'pyyaml',
         'boto3',
         'querystring_parser',
+        'sqlalchemy',
+        'futures; python_version < "3"',
     ],
     entry_points='''
         [console_scripts]
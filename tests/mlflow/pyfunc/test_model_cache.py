@@ -0,0 +1,123 @@
+from __future__ import print_function
+
+import os
+import pickle
+import sys
+import time
+
+import mock
+import pytest
+
+from mlflow import pyfunc
+from mlflow import tracking
+from mlflow.pyfunc.model_cache import ModelCache
+from mlflow.utils.file_utils import TempDir
+
+
+def load_pyfunc(path):
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+def _save_model(tmp, name, data):
+    data_path = tmp.path("%s.pkl" % name)
+    with open(data_path, "wb") as f:
+        pickle.dump(data, f)
+    path = tmp.path(name)
+    pyfunc.save_model(dst_path=path, data_path=data_path,
+                      loader_module=os.path.basename(__file__)[:-3], code_path=[__file__])
+    return path
+
+
+@pytest.fixture
+def model_cache():
+    cache = ModelCache(max_models=2, max_size_bytes=1024 * 1024)
+    with mock.patch("mlflow.pyfunc.model_cache._model_cache", cache):
+        yield cache
+
+
+def test_load_pyfunc_uses_cache(model_cache):
+    with TempDir() as tmp:
+        path = _save_model(tmp, "model", {"value": 1})
+        model = pyfunc.load_pyfunc(path, use_cache=True)
+        assert model == {"value": 1}
+        assert pyfunc.load_pyfunc(path, use_cache=True) is model
+        assert pyfunc.load_pyfunc(path) is not model
+        stats = model_cache.stats
+        assert (stats.hits, stats.misses, stats.evictions, stats.num_models) == (1, 1, 0, 1)
+        assert stats.size_bytes > 0
+
+
+def test_load_pyfunc_does_not_grow_sys_path():
+    with TempDir() as tmp:
+        path = _save_model(tmp, "model", 1)
+        pyfunc.load_pyfunc(path)
+        sys_path_length = len(sys.path)
+        pyfunc.load_pyfunc(path)
+        assert len(sys.path) == sys_path_length
+
+
+def test_model_cache_reloads_modified_models(model_cache):
+    with TempDir() as tmp:
+        path = _save_model(tmp, "model", 1)
+        model_cache.load(path)
+        # Saving the model again changes the modification time of its MLmodel file
+        mtime = time.time() + 10
+        os.utime(os.path.join(path, "MLmodel"), (mtime, mtime))
+        with open(os.path.join(path, "data", "model.pkl"), "wb") as f:
+            pickle.dump(2, f)
+        assert model_cache.load(path) == 2
+        assert (model_cache.stats.misses, model_cache.stats.num_models) == (2, 1)
+
+
+def test_model_cache_evicts_least_recently_used_models(model_cache):
+    with TempDir() as tmp:
+        paths = [_save_model(tmp, "model_%d" % i, i) for i in range(3)]
+        for path in paths[:2]:
+            model_cache.load(path)
+        # Marks the first model as recently used, so that the second one is evicted
+        model_cache.load(paths[0])
+        model_cache.load(paths[2])
+        assert (model_cache.stats.evictions, model_cache.stats.num_models) == (1, 2)
+        with mock.patch("mlflow.pyfunc._load_pyfunc", wraps=pyfunc._load_pyfunc) as load_mock:
+            model_cache.load(paths[0])
+            load_mock.assert_not_called()
+            model_cache.load(paths[1])
+            load_mock.assert_called_once()
+        # Models larger than the cache are not cached
+        large_path = _save_model(tmp, "large", "x" * 2 * 1024 * 1024)
+        model_cache.load(large_path)
+        assert model_cache.stats.num_models == 2
+
+
+def test_model_cache_memoizes_run_model_directories(model_cache):
+    with TempDir(chdr=True, remove_on_exit=True) as tmp:
+        data_path = tmp.path("model.pkl")
+        with open(data_path, "wb") as f:
+            pickle.dump(3, f)
+        tracking.set_tracking_uri("file://%s" % os.path.abspath(tmp.path("mlruns")))
+        tracking.start_run()
+        try:
+            pyfunc.log_model(artifact_path="model", data_path=data_path,
+                             loader_module=os.path.basename(__file__)[:-3],
+                             code_path=[__file__])
+            run_id = tracking.active_run().info.run_uuid
+            with mock.patch("mlflow.tracking._get_model_log_dir",
+                            wraps=tracking._get_model_log_dir) as get_dir_mock:
+                assert pyfunc.load_pyfunc("model", run_id=run_id, use_cache=True) == 3
+                assert pyfunc.load_pyfunc("model", run_id=run_id, use_cache=True) == 3
+                get_dir_mock.assert_called_once()
+        finally:
+            tracking.end_run()
+            tracking.set_tracking_uri(None)
+
+
+def test_model_cache_releases_load_locks_of_failed_loads(model_cache):
+    with TempDir() as tmp:
+        path = _save_model(tmp, "model", 1)
+        with mock.patch("mlflow.pyfunc._load_pyfunc", side_effect=IOError("corrupted")):
+            with pytest.raises(IOError):
+                model_cache.load(path)
+        assert model_cache._load_locks == {}
+        assert model_cache.load(path) == 1
+        assert model_cache._load_locks == {}
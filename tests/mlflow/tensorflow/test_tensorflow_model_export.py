@@ -5,6 +5,7 @@ import os
 import pandas
 import unittest
 
+import mock
 import numpy as np
 import tensorflow as tf
 import sklearn.datasets as datasets
@@ -12,6 +13,7 @@ import shutil
 
 from mlflow import tensorflow, pyfunc
 from mlflow import tracking
+from mlflow.models import Model
 from mlflow.utils.file_utils import TempDir
 
 
@@ -38,6 +40,72 @@ class TestModelExport(unittest.TestCase):
         xpred = x.predict(df)
         return [row for _, row in xpred.iterrows()]
 
+    @staticmethod
+    def save_doubling_model(saved_model_dir):
+        """
+        Saves a SavedModel multiplying its input column "x" by two, along with the MLmodel file
+        that `log_saved_model` would write.
+        """
+        with tf.Graph().as_default(), tf.Session() as sess:
+            x = tf.placeholder(tf.float32, shape=[None], name="x")
+            y = tf.multiply(x, 2.0, name="y")
+            builder = tf.saved_model.builder.SavedModelBuilder(saved_model_dir)
+            signature = tf.saved_model.signature_def_utils.predict_signature_def(
+                inputs={"x": x}, outputs={"y": y})
+            builder.add_meta_graph_and_variables(sess, [tf.saved_model.tag_constants.SERVING],
+                                                 signature_def_map={"predict": signature})
+            builder.save()
+        model = Model()
+        pyfunc.add_to_model(model, loader_module="mlflow.tensorflow")
+        model.add_flavor("tensorflow", saved_model_dir=saved_model_dir,
+                         signature_def_key="predict")
+        model.save(os.path.join(saved_model_dir, "MLmodel"))
+
+    def test_predict_reuses_session(self):
+        with TempDir(chdr=False, remove_on_exit=True) as tmp:
+            saved_model_dir = tmp.path("model")
+            self.save_doubling_model(saved_model_dir)
+            with mock.patch("tensorflow.Session", wraps=tf.Session) as session_mock, \
+                    mock.patch("tensorflow.saved_model.loader.load",
+                               wraps=tf.saved_model.loader.load) as load_mock:
+                model = pyfunc.load_pyfunc(saved_model_dir)
+                for i in range(3):
+                    df = pandas.DataFrame({"x": np.arange(i + 1, dtype=np.float32)})
+                    np.testing.assert_array_equal(model.predict(df)[0].values, df["x"] * 2)
+                # The model is loaded once, when the pyfunc is loaded
+                self.assertEqual(session_mock.call_count, 1)
+                self.assertEqual(load_mock.call_count, 1)
+            model.close()
+
+    def test_thread_settings_reach_session_config(self):
+        with TempDir(chdr=False, remove_on_exit=True) as tmp:
+            saved_model_dir = tmp.path("model")
+            self.save_doubling_model(saved_model_dir)
+            with mock.patch("tensorflow.Session", wraps=tf.Session) as session_mock:
+                tensorflow.load_pyfunc(saved_model_dir, intra_op_parallelism_threads=2,
+                                       inter_op_parallelism_threads=3).close()
+                config = session_mock.call_args[1]["config"]
+                self.assertEqual(config.intra_op_parallelism_threads, 2)
+                self.assertEqual(config.inter_op_parallelism_threads, 3)
+                with mock.patch.dict(os.environ,
+                                     {"MLFLOW_TF_INTRA_OP_PARALLELISM_THREADS": "4",
+                                      "MLFLOW_TF_INTER_OP_PARALLELISM_THREADS": "5"}):
+                    tensorflow.load_pyfunc(saved_model_dir).close()
+                config = session_mock.call_args[1]["config"]
+                self.assertEqual(config.intra_op_parallelism_threads, 4)
+                self.assertEqual(config.inter_op_parallelism_threads, 5)
+
+    def test_close(self):
+        with TempDir(chdr=False, remove_on_exit=True) as tmp:
+            saved_model_dir = tmp.path("model")
+            self.save_doubling_model(saved_model_dir)
+            model = tensorflow.load_pyfunc(saved_model_dir)
+            df = pandas.DataFrame({"x": np.ones(2, dtype=np.float32)})
+            model.predict(df)
+            model.close()
+            with self.assertRaises(RuntimeError):
+                model.predict(df)
+
     def test_log_saved_model(self):
         # This tests model logging capabilities on the sklearn.iris dataset.
         with TempDir(chdr=False, remove_on_exit=True) as tmp:
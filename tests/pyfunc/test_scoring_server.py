@@ -0,0 +1,215 @@
+from __future__ import print_function
+
+import json
+import threading
+import time
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from mlflow.pyfunc import scoring_server
+
+
+class _VectorizedModel(object):
+    """ Model with a fixed cost per call to `predict`, like most vectorized models. """
+
+    def __init__(self, call_cost_seconds=0.0):
+        self.call_cost_seconds = call_cost_seconds
+        self.batch_sizes = []
+        self._lock = threading.Lock()
+
+    def predict(self, df):
+        with self._lock:
+            self.batch_sizes.append(len(df))
+            time.sleep(self.call_cost_seconds)
+        if "fail" in df.columns and df["fail"].any():
+            raise Exception("Invalid input")
+        return df["x"].values * 2
+
+
+def _score(client, data):
+    response = client.post("/invocations", data=pd.DataFrame(data).to_json(orient="records"),
+                           headers={"Content-Type": "application/json"})
+    return response.status_code, response.data
+
+
+def _score_concurrently(app, requests, num_threads):
+    results = [None] * len(requests)
+
+    def run(thread_index):
+        client = app.test_client()
+        for i in range(thread_index, len(requests), num_threads):
+            results[i] = _score(client, requests[i])
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(num_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_split_predictions():
+    parts = scoring_server._split_predictions(np.arange(6), [1, 3, 2])
+    assert [part.tolist() for part in parts] == [[0], [1, 2, 3], [4, 5]]
+    parts = scoring_server._split_predictions(pd.DataFrame({"y": range(3)}), [2, 1])
+    assert [part.to_dict(orient="records") for part in parts] == [[{"y": 0}, {"y": 1}],
+                                                                   [{"y": 2}]]
+    with pytest.raises(Exception):
+        scoring_server._split_predictions(np.arange(3), [2, 2])
+
+
+def test_scoring_server_batches_concurrent_requests():
+    model = _VectorizedModel(call_cost_seconds=0.01)
+    app = scoring_server.init(model, max_batch_size=100, max_batch_wait_ms=20)
+    requests = [{"x": [i, i + 1]} for i in range(40)]
+    results = _score_concurrently(app, requests, num_threads=8)
+    for request, (status, data) in zip(requests, results):
+        assert status == 200
+        assert json.loads(data) == [2 * x for x in request["x"]]
+    assert sum(model.batch_sizes) == 80
+    assert len(model.batch_sizes) < 40
+
+
+def test_scoring_server_batches_do_not_exceed_max_batch_size():
+    model = _VectorizedModel(call_cost_seconds=0.01)
+    app = scoring_server.init(model, max_batch_size=10, max_batch_wait_ms=20)
+    requests = [{"x": list(range(i % 4 + 3))} for i in range(40)] + [{"x": list(range(15))}]
+    results = _score_concurrently(app, requests, num_threads=8)
+    assert all(status == 200 for status, _ in results)
+    assert sum(model.batch_sizes) == sum(len(request["x"]) for request in requests)
+    # Only the request larger than the maximum is predicted on in a batch of its own that exceeds it
+    assert [size for size in model.batch_sizes if size > 10] == [15]
+
+
+def test_scoring_server_batching_isolates_failures():
+    model = _VectorizedModel()
+    predictor = scoring_server._BatchingPredictor(model, max_batch_size=100,
+                                                  max_batch_wait_ms=50)
+    requests = [pd.DataFrame({"x": [1, 2], "fail": [False, False]}),
+                pd.DataFrame({"x": [3], "fail": [True]}),
+                pd.DataFrame({"x": [4]})]
+    results = [None] * len(requests)
+
+    def run(i):
+        try:
+            results[i] = predictor.predict(requests[i]).tolist()
+        except Exception as e:  # pylint: disable=broad-except
+            results[i] = str(e)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(len(requests))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [[2, 4], "Invalid input", [8]]
+
+
+class _IdentityModel(object):
+    def predict(self, df):
+        return df
+
+
+def _serialize(df, content_type):
+    if content_type == scoring_server.CONTENT_TYPE_CSV:
+        return df.to_csv(index=False)
+    if content_type == scoring_server.CONTENT_TYPE_JSON:
+        return df.to_json(orient="records")
+    if content_type == scoring_server.CONTENT_TYPE_JSON_SPLIT_ORIENTED:
+        return df.to_json(orient="split")
+    if content_type == scoring_server.CONTENT_TYPE_JSON_COLUMNS_ORIENTED:
+        return df.to_json(orient="columns")
+    if content_type == scoring_server.CONTENT_TYPE_ARROW:
+        return scoring_server._serialize_arrow(df)
+    if content_type == scoring_server.CONTENT_TYPE_PARQUET:
+        return scoring_server._serialize_parquet(df)
+    return scoring_server._serialize_npy(df)
+
+
+def _parse(data, content_type):
+    mimetype, _, params = content_type.partition("; ")
+    return scoring_server._parse_request(data, mimetype, dict([params.split("=")]) if params
+                                         else {})
+
+
+@pytest.mark.parametrize("content_type", scoring_server.CONTENT_TYPES)
+def test_scoring_server_content_types(content_type):
+    pytest.importorskip("pyarrow")
+    client = scoring_server.init(_IdentityModel()).test_client()
+    df = pd.DataFrame({"a": [1.5, 2.5, 3.5], "b": [4.0, 5.0, 6.0]})
+    if content_type == scoring_server.CONTENT_TYPE_NPY:
+        # Arrays have no column names
+        df.columns = ["0", "1"]
+    body = _serialize(df, content_type)
+    # Predictions are returned in the requested format
+    response = client.post("/invocations", data=body,
+                           headers={"Content-Type": content_type, "Accept": content_type})
+    assert response.status_code == 200
+    assert response.headers["Content-Type"] == content_type
+    pd.testing.assert_frame_equal(_parse(response.data, content_type).rename(columns=str), df,
+                                  check_dtype=False)
+    # Or as JSON records by default
+    response = client.post("/invocations", data=body, headers={"Content-Type": content_type})
+    assert response.headers["Content-Type"] == scoring_server.CONTENT_TYPE_JSON
+    assert json.loads(response.data) == df.to_dict(orient="records")
+
+
+def test_scoring_server_rejects_invalid_input():
+    client = scoring_server.init(_IdentityModel()).test_client()
+    response = client.post("/invocations", data="a,b\n1,2",
+                           headers={"Content-Type": "application/xml"})
+    assert response.status_code == 415
+    response = client.post("/invocations", data="[]",
+                           headers={"Content-Type": "application/json; format=unknown"})
+    assert response.status_code == 415
+    stream = BytesIO()
+    np.save(stream, np.array([{"a": 1}], dtype=object))
+    response = client.post("/invocations", data=stream.getvalue(),
+                           headers={"Content-Type": scoring_server.CONTENT_TYPE_NPY})
+    assert response.status_code == 400
+
+
+def test_parse_npy_does_not_copy():
+    data = scoring_server._serialize_npy(np.arange(12, dtype=np.float64).reshape(4, 3))
+    df = scoring_server._parse_npy(data, None)
+    assert df.shape == (4, 3)
+    assert df[2].tolist() == [2.0, 5.0, 8.0, 11.0]
+    assert np.shares_memory(df.values, np.frombuffer(data, dtype=np.uint8))
+    fortran = np.asfortranarray(np.arange(6).reshape(2, 3))
+    df = scoring_server._parse_npy(scoring_server._serialize_npy(fortran), None)
+    assert df.values.tolist() == [[0, 1, 2], [3, 4, 5]]
+
+
+@pytest.mark.large
+def test_parse_wide_input_benchmark():
+    pytest.importorskip("pyarrow")
+    df = pd.DataFrame(np.random.rand(100, 2000)).rename(columns=str)
+    for content_type in scoring_server.CONTENT_TYPES:
+        data = _serialize(df, content_type)
+        if not isinstance(data, bytes):
+            data = data.encode("utf-8")
+        start = time.time()
+        for _ in range(5):
+            _parse(data, content_type)
+        print("Parsing 100 rows x 2000 columns: %.1f ms as %s"
+              % ((time.time() - start) / 5 * 1000, content_type))
+
+
+@pytest.mark.large
+def test_scoring_server_batching_benchmark():
+    requests = [{"x": [i]} for i in range(300)]
+    throughputs = {}
+    for max_batch_size in [None, 64]:
+        # The cost of each call to the model dominates the overhead of serving a request, so that
+        # batching clearly pays off
+        model = _VectorizedModel(call_cost_seconds=0.02)
+        app = scoring_server.init(model, max_batch_size=max_batch_size, max_batch_wait_ms=5)
+        start = time.time()
+        results = _score_concurrently(app, requests, num_threads=32)
+        throughputs[max_batch_size] = len(requests) / (time.time() - start)
+        assert all(status == 200 for status, _ in results)
+    print("Scoring throughput with 32 concurrent clients: %.0f requests/s without batching, "
+          "%.0f requests/s with batching" % (throughputs[None], throughputs[64]))
+    assert throughputs[64] > throughputs[None] * 1.5
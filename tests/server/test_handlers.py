@@ -1,7 +1,220 @@
+import json
+import os
+import time
+
+import mock
+
+from mlflow.entities.run_status import RunStatus
+from mlflow.entities.source_type import SourceType
+from mlflow.server import handlers
 from mlflow.server.handlers import get_endpoints, _create_experiment
+from mlflow.store.file_store import FileStore
 
 
 def test_get_endpoints():
     endpoints = get_endpoints()
     create_experiment_endpoint = [e for e in endpoints if e[1] == _create_experiment]
     assert len(create_experiment_endpoint) == 2
+
+
+def test_get_artifact_streams_byte_ranges(tmpdir):
+    from mlflow.server import app
+    store = FileStore(str(tmpdir.join("mlruns")))
+    run = store.create_run(0, "user", "run", SourceType.LOCAL, "source", "entry", 0, "version",
+                           [])
+    with open(os.path.join(run.info.artifact_uri, "model.bin"), "wb") as f:
+        f.write(b"0123456789")
+    endpoint = "/ajax-api/2.0/preview/mlflow/artifacts/get?run_uuid=%s&path=model.bin" \
+        % run.info.run_uuid
+    with mock.patch("mlflow.server.handlers._get_store", return_value=store), \
+            mock.patch("mlflow.server.handlers._ARTIFACT_CHUNK_SIZE", 3):
+        client = app.test_client()
+
+        response = client.get(endpoint)
+        assert response.status_code == 200
+        assert response.data == b"0123456789"
+        assert response.headers["Content-Length"] == "10"
+        assert response.headers["Accept-Ranges"] == "bytes"
+
+        response = client.get(endpoint, headers={"Range": "bytes=2-6"})
+        assert response.status_code == 206
+        assert response.data == b"23456"
+        assert response.headers["Content-Range"] == "bytes 2-6/10"
+
+        response = client.get(endpoint, headers={"Range": "bytes=-3"})
+        assert response.status_code == 206
+        assert response.data == b"789"
+
+        response = client.get(endpoint, headers={"Range": "bytes=20-"})
+        assert response.status_code == 416
+        assert response.headers["Content-Range"] == "bytes */10"
+
+
+def test_protobuf_content_negotiation(tmpdir):
+    from mlflow.server import app
+    from mlflow.protos.service_pb2 import GetRun
+    store = FileStore(str(tmpdir.join("mlruns")))
+    run = store.create_run(0, "user", "run", SourceType.LOCAL, "source", "entry", 0, "version",
+                           [])
+    endpoint = "/api/2.0/preview/mlflow/runs/get"
+    with mock.patch("mlflow.server.handlers._get_store", return_value=store):
+        client = app.test_client()
+
+        response = client.get(endpoint, query_string={"run_uuid": run.info.run_uuid})
+        assert response.mimetype == "application/json"
+        assert json.loads(response.data)["run"]["info"]["run_uuid"] == run.info.run_uuid
+
+        response = client.get(endpoint, data=GetRun(run_uuid=run.info.run_uuid).SerializeToString(),
+                              headers={"Content-Type": "application/x-protobuf",
+                                       "Accept": "application/x-protobuf"})
+        assert response.mimetype == "application/x-protobuf"
+        response_message = GetRun.Response()
+        response_message.ParseFromString(response.data)
+        assert response_message.run.info.run_uuid == run.info.run_uuid
+
+
+def test_read_only_responses_are_cached_until_the_store_changes(tmpdir):
+    from mlflow.server import app
+    store = FileStore(str(tmpdir.join("mlruns")))
+    endpoint = "/ajax-api/2.0/preview/mlflow/experiments/list"
+    with mock.patch("mlflow.server.handlers._get_store", return_value=store), \
+            mock.patch("mlflow.server.handlers._response_cache", None):
+        client = app.test_client()
+        response = client.get(endpoint)
+        assert response.status_code == 200
+        assert response.headers["Cache-Control"] == "no-cache"
+        etag = response.headers["ETag"]
+
+        with mock.patch.object(store, "list_experiments") as list_mock:
+            response = client.get(endpoint)
+            assert response.headers["ETag"] == etag
+            response = client.get(endpoint, headers={"If-None-Match": etag})
+            assert response.status_code == 304
+            assert response.data == b""
+            assert list_mock.call_count == 0
+
+        store.create_experiment("new")
+        response = client.get(endpoint, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert [e["name"] for e in json.loads(response.data)["experiments"]] == ["Default", "new"]
+
+
+def test_responses_vary_with_accept(tmpdir):
+    from mlflow.server import app
+    store = FileStore(str(tmpdir.join("mlruns")))
+    with mock.patch("mlflow.server.handlers._get_store", return_value=store), \
+            mock.patch("mlflow.server.handlers._response_cache", None):
+        client = app.test_client()
+        json_response = client.get("/api/2.0/preview/mlflow/experiments/list")
+        protobuf_response = client.get("/api/2.0/preview/mlflow/experiments/list",
+                                       headers={"Accept": "application/x-protobuf"})
+        assert json_response.headers["Vary"] == "Accept"
+        assert protobuf_response.headers["Vary"] == "Accept"
+        assert json_response.headers["ETag"] != protobuf_response.headers["ETag"]
+
+
+def test_cached_responses_are_scoped_to_their_experiments(tmpdir):
+    from mlflow.entities.metric import Metric
+    from mlflow.server import app
+    store = FileStore(str(tmpdir.join("mlruns")))
+    other_experiment_id = store.create_experiment("other")
+    run = store.create_run(0, "user", "run", SourceType.LOCAL, "source", "entry", 0, "version",
+                           [])
+    experiment_endpoint = "/ajax-api/2.0/preview/mlflow/experiments/get?experiment_id=%s"
+    search_endpoint = "/ajax-api/2.0/preview/mlflow/runs/search"
+    with mock.patch("mlflow.server.handlers._get_store", return_value=store), \
+            mock.patch("mlflow.server.handlers._response_cache", None):
+        client = app.test_client()
+        etags = {
+            "experiment": client.get(experiment_endpoint % 0).headers["ETag"],
+            "other experiment": client.get(experiment_endpoint % other_experiment_id)
+            .headers["ETag"],
+            "search": client.get(search_endpoint, query_string="experiment_ids%5B%5D=0")
+            .headers["ETag"],
+        }
+        with mock.patch.object(store, "list_run_infos") as list_mock, \
+                mock.patch.object(store, "search_runs", wraps=store.search_runs) as search_mock:
+            store.log_metric(run.info.run_uuid, Metric("acc", 1, 0))
+            # Metrics are not part of the experiment's response, and other experiments are not
+            # affected at all
+            assert client.get(experiment_endpoint % 0).headers["ETag"] == etags["experiment"]
+            assert client.get(experiment_endpoint % other_experiment_id).headers["ETag"] == \
+                etags["other experiment"]
+            assert list_mock.call_count == 0
+            response = client.get(search_endpoint, query_string="experiment_ids%5B%5D=0")
+            assert response.headers["ETag"] != etags["search"]
+            assert search_mock.call_count == 1
+        store.update_run_info(run.info.run_uuid, RunStatus.FINISHED, 1)
+        assert client.get(experiment_endpoint % 0).headers["ETag"] != etags["experiment"]
+
+
+def test_artifact_listings_of_finished_runs_are_cached_briefly(tmpdir):
+    from mlflow.server import app
+    store = FileStore(str(tmpdir.join("mlruns")))
+    run = store.create_run(0, "user", "run", SourceType.LOCAL, "source", "entry", 0, "version",
+                           [])
+    endpoint = "/ajax-api/2.0/preview/mlflow/artifacts/list?run_uuid=%s" % run.info.run_uuid
+    with mock.patch("mlflow.server.handlers._get_store", return_value=store), \
+            mock.patch("mlflow.server.handlers._response_cache", None), \
+            mock.patch("mlflow.server.handlers._get_artifact_repo",
+                       wraps=handlers._get_artifact_repo) as repo_mock:
+        client = app.test_client()
+        client.get(endpoint)
+        response = client.get(endpoint)
+        assert repo_mock.call_count == 4
+        assert response.cache_control.max_age is None
+
+        store.update_run_info(run.info.run_uuid, RunStatus.FINISHED, 1)
+        client.get(endpoint)
+        # Checking whether the cached listing is still valid only reads the run information
+        with mock.patch.object(store, "get_run") as get_run_mock:
+            response = client.get(endpoint)
+        assert get_run_mock.call_count == 0
+        assert repo_mock.call_count == 6
+        assert response.cache_control.max_age == 60
+
+        # Resuming the run invalidates its listing
+        store.update_run_info(run.info.run_uuid, RunStatus.RUNNING, 1)
+        response = client.get(endpoint)
+        assert repo_mock.call_count == 8
+        assert response.cache_control.max_age is None
+
+        store.update_run_info(run.info.run_uuid, RunStatus.FINISHED, 2)
+        client.get(endpoint)
+        with mock.patch("time.time", return_value=time.time() + 60):
+            client.get(endpoint)
+        assert repo_mock.call_count == 12
+
+
+def test_log_batch(tmpdir):
+    from google.protobuf.json_format import MessageToJson
+    from mlflow.entities.metric import Metric
+    from mlflow.entities.param import Param
+    from mlflow.entities.run_tag import RunTag
+    from mlflow.protos.service_pb2 import LogBatch
+    from mlflow.server import app
+    store = FileStore(str(tmpdir.join("mlruns")))
+    run = store.create_run(0, "user", "run", SourceType.LOCAL, "source", "entry", 0, "version",
+                           [])
+    request_message = LogBatch(run_uuid=run.info.run_uuid,
+                               metrics=[Metric("m", 1.5, 1).to_proto(),
+                                        Metric("m", 2.5, 2).to_proto()],
+                               params=[Param("p", "v").to_proto()],
+                               tags=[RunTag("t", "w").to_proto()])
+    with mock.patch("mlflow.server.handlers._get_store", return_value=store):
+        client = app.test_client()
+        response = client.post("/api/2.0/preview/mlflow/runs/log-batch",
+                               data=json.dumps(MessageToJson(request_message)),
+                               content_type="application/json")
+        assert response.status_code == 200
+        response = client.post("/api/2.0/preview/mlflow/runs/log-batch",
+                               data=request_message.SerializeToString(),
+                               content_type="application/x-protobuf")
+        assert response.status_code == 200
+    logged = store.get_run(run.info.run_uuid)
+    assert [(m.key, m.value) for m in logged.data.metrics] == [("m", 2.5)]
+    assert [(p.key, p.value) for p in logged.data.params] == [("p", "v")]
+    assert [(t.key, t.value) for t in logged.info.tags] == [("t", "w")]
+    assert [m.value for m in store.get_metric_history(run.info.run_uuid, "m")] == \
+        [1.5, 2.5, 1.5, 2.5]
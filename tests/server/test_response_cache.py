@@ -0,0 +1,25 @@
+from mlflow.server.response_cache import CachedResponse, ResponseCache
+
+
+def _entry(data, version="v1"):
+    return CachedResponse(version=version, etag="etag", mimetype="application/json", data=data,
+                          cache_control=None)
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = ResponseCache(max_size_bytes=10)
+    cache.put("a", _entry(b"aaaa"))
+    cache.put("b", _entry(b"bbbb"))
+    assert cache.get("a").data == b"aaaa"
+    cache.put("c", _entry(b"cccc"))
+    assert cache.get("b") is None
+    assert cache.get("a").data == b"aaaa"
+    assert cache.get("c").data == b"cccc"
+    # Replacing an entry does not count its previous size
+    cache.put("c", _entry(b"cc"))
+    cache.put("d", _entry(b"dddd"))
+    assert [cache.get(key) is not None for key in "acd"] == [True, True, True]
+    # Entries larger than the cache are not stored
+    cache.put("e", _entry(b"e" * 11))
+    assert cache.get("e") is None
+    assert cache.get("a") is not None
@@ -0,0 +1,45 @@
+import mock
+import pytest
+
+from mlflow.entities.metric import Metric
+from mlflow.entities.param import Param
+from mlflow.entities.run_tag import RunTag
+from mlflow.store.abstract_store import AbstractStore
+
+
+def test_log_batch_defaults_to_logging_each_value():
+    store = mock.Mock(spec=AbstractStore)
+    metrics = [Metric("m", 1, 0), Metric("m", 2, 1)]
+    params = [Param("p", "v")]
+    AbstractStore.log_batch(store, "abc", metrics, params, [])
+    assert store.log_metric.call_args_list == [mock.call("abc", metric) for metric in metrics]
+    assert store.log_param.call_args_list == [mock.call("abc", params[0])]
+    with pytest.raises(Exception):
+        AbstractStore.log_batch(store, "abc", [], [], [RunTag("t", "v")])
+
+
+def test_get_run_info_by_uuid_defaults_to_reading_the_run():
+    store = mock.Mock(spec=AbstractStore)
+    assert AbstractStore.get_run_info_by_uuid(store, "abc") == store.get_run.return_value.info
+    store.get_run.assert_called_once_with("abc")
+
+
+def test_get_metric_history_bulk_defaults_to_reading_each_history():
+    store = mock.Mock(spec=AbstractStore)
+    store.get_run.side_effect = lambda run_uuid: mock.Mock(data=mock.Mock(
+        metrics=[Metric("m", 1, 0)] if run_uuid == "abc" else []))
+    history = [Metric("m", 1, 0)]
+    store.get_metric_history.return_value = history
+    histories = AbstractStore.get_metric_history_bulk(store, ["abc", "def"], ["m", "n"],
+                                                      max_points=10)
+    assert histories == {"abc": {"m": history}, "def": {}}
+    store.get_metric_history.assert_called_once_with("abc", "m", None, None, 10, None)
+
+
+class _MinimalStore(AbstractStore):
+    list_experiments = create_experiment = get_experiment = get_run = get_metric = \
+        get_param = get_metric_history = search_runs = list_run_infos = None
+
+
+def test_stores_need_not_implement_optional_methods():
+    _MinimalStore()
@@ -0,0 +1,117 @@
+import os
+import stat
+
+import mock
+import pytest
+
+from mlflow.store.artifact_cache import ArtifactCache, get_artifact_cache
+
+
+def _writer(content, calls):
+    def download(dest_dir):
+        calls.append(dest_dir)
+        with open(os.path.join(dest_dir, "model.bin"), "w") as f:
+            f.write(content)
+    return download
+
+
+def test_get_or_download_caches_by_manifest(tmpdir):
+    cache = ArtifactCache(str(tmpdir), 1024)
+    calls = []
+    path = cache.get_or_download("model.bin", [("", 5, "etag1")], _writer("hello", calls))
+    assert os.path.basename(path) == "model.bin"
+    assert open(path).read() == "hello"
+    assert cache.get_or_download("model.bin", [("", 5, "etag1")], _writer("hello", calls)) == path
+    assert len(calls) == 1
+    # A different ETag means the remote artifact changed: it is downloaded again
+    new_path = cache.get_or_download("model.bin", [("", 5, "etag2")], _writer("world", calls))
+    assert new_path != path
+    assert open(new_path).read() == "world"
+    assert len(calls) == 2
+    # No temporary directories are left behind
+    assert len([name for name in os.listdir(str(tmpdir)) if name.startswith(".")]) == 0
+
+
+def test_get_or_download_replaces_corrupted_entries(tmpdir):
+    cache = ArtifactCache(str(tmpdir), 1024)
+    calls = []
+    path = cache.get_or_download("model.bin", [("", 5, "etag")], _writer("hello", calls))
+    with open(path, "w") as f:
+        f.write("hel")
+    assert cache.get_or_download("model.bin", [("", 5, "etag")], _writer("hello", calls)) == path
+    assert open(path).read() == "hello"
+    assert len(calls) == 2
+
+
+def test_get_or_download_uses_entry_populated_concurrently(tmpdir):
+    cache = ArtifactCache(str(tmpdir), 1024)
+    manifest = [("", 5, "etag")]
+
+    def racing_download(dest_dir):
+        # Another process populates the same entry while this one is downloading
+        other_path = cache.get_or_download("model.bin", manifest, _writer("hello", []))
+        assert open(other_path).read() == "hello"
+        _writer("hello", [])(dest_dir)
+
+    path = cache.get_or_download("model.bin", manifest, racing_download)
+    assert open(path).read() == "hello"
+    assert len(os.listdir(str(tmpdir))) == 1
+
+
+def test_eviction_removes_least_recently_used_entries(tmpdir):
+    cache = ArtifactCache(str(tmpdir), 10)
+    first = cache.get_or_download("model.bin", [("", 5, "a")], _writer("aaaaa", []))
+    second = cache.get_or_download("model.bin", [("", 5, "b")], _writer("bbbbb", []))
+    # Make the first entry the most recently used one
+    os.utime(os.path.dirname(second), (0, 0))
+    assert cache.get_or_download("model.bin", [("", 5, "a")], _writer("aaaaa", [])) == first
+    cache.get_or_download("model.bin", [("", 5, "c")], _writer("ccccc", []))
+    assert os.path.exists(first)
+    assert not os.path.exists(second)
+
+
+def test_eviction_keeps_recently_used_entries(tmpdir):
+    cache = ArtifactCache(str(tmpdir), 5)
+    first = cache.get_or_download("model.bin", [("", 5, "a")], _writer("aaaaa", []))
+    # The first entry may still be read by another process, so it is not evicted yet
+    cache.get_or_download("model.bin", [("", 5, "b")], _writer("bbbbb", []))
+    assert os.path.exists(first)
+    os.utime(os.path.dirname(first), (0, 0))
+    cache.get_or_download("model.bin", [("", 5, "c")], _writer("ccccc", []))
+    assert not os.path.exists(first)
+
+
+def test_cache_dir_is_private(tmpdir):
+    cache_dir = os.path.join(str(tmpdir), "cache", "artifacts")
+    ArtifactCache(cache_dir, 1024).get_or_download("model.bin", [("", 5, "a")],
+                                                   _writer("aaaaa", []))
+    assert stat.S_IMODE(os.stat(cache_dir).st_mode) & 0o077 == 0
+
+
+def test_cache_dir_owned_by_another_user_is_refused(tmpdir):
+    cache = ArtifactCache(str(tmpdir), 1024)
+    with mock.patch("os.getuid", return_value=os.getuid() + 1), \
+            pytest.raises(Exception) as exc:
+        cache.get_or_download("model.bin", [("", 5, "a")], _writer("aaaaa", []))
+    assert "owned by another user" in str(exc.value)
+
+
+def test_world_writable_cache_dir_is_refused(tmpdir):
+    os.chmod(str(tmpdir), 0o777)
+    with pytest.raises(Exception) as exc:
+        ArtifactCache(str(tmpdir), 1024).get_or_download("model.bin", [("", 5, "a")],
+                                                         _writer("aaaaa", []))
+    assert "writable by all users" in str(exc.value)
+
+
+def test_get_artifact_cache_configuration(tmpdir):
+    with mock.patch.dict(os.environ, {"MLFLOW_ARTIFACT_CACHE_DIR": str(tmpdir),
+                                      "MLFLOW_ARTIFACT_CACHE_MAX_SIZE": "100"}):
+        cache = get_artifact_cache()
+        assert cache.cache_dir == str(tmpdir)
+        assert cache.max_size_bytes == 100
+    with mock.patch.dict(os.environ, {"MLFLOW_ARTIFACT_CACHE_MAX_SIZE": "0"}):
+        assert get_artifact_cache() is None
+    with mock.patch.dict(os.environ, {"XDG_CACHE_HOME": str(tmpdir)}):
+        os.environ.pop("MLFLOW_ARTIFACT_CACHE_DIR", None)
+        assert get_artifact_cache().cache_dir == os.path.join(str(tmpdir), "mlflow", "artifacts")
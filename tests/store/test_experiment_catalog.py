@@ -0,0 +1,55 @@
+import multiprocessing
+import os
+
+import mock
+
+from mlflow.store.experiment_catalog import ExperimentCatalog
+from mlflow.store.file_store import FileStore
+
+
+def _create_experiments(args):
+    root, worker = args
+    store = FileStore(root)
+    return [store.create_experiment("worker %s experiment %s" % (worker, i)) for i in range(10)]
+
+
+def test_concurrent_creations_get_distinct_ids(tmpdir):
+    root = str(tmpdir.join("mlruns"))
+    FileStore(root)
+    pool = multiprocessing.Pool(4)
+    try:
+        ids = sum(pool.map(_create_experiments, [(root, worker) for worker in range(4)]), [])
+    finally:
+        pool.close()
+        pool.join()
+    assert sorted(ids) == list(range(1, 41))
+    store = FileStore(root)
+    for worker in range(4):
+        for i in range(10):
+            name = "worker %s experiment %s" % (worker, i)
+            assert store.get_experiment_by_name(name).name == name
+
+
+def test_lookups_do_not_read_experiments(tmpdir):
+    store = FileStore(str(tmpdir))
+    experiment_id = store.create_experiment("a")
+    with mock.patch.object(FileStore, "_get_experiment", wraps=FileStore._get_experiment) \
+            as get_experiment_mock:
+        assert store.get_experiment_by_name("a").experiment_id == experiment_id
+        assert store.get_experiment_by_name("b") is None
+        store.create_experiment("b")
+        # Only the experiment looked up is read
+        assert get_experiment_mock.call_count == 1
+
+
+def test_catalog_is_rebuilt_when_missing_or_stale(tmpdir):
+    store = FileStore(str(tmpdir))
+    store.create_experiment("a")
+    os.remove(str(tmpdir.join(ExperimentCatalog.CATALOG_FILE_NAME)))
+    store = FileStore(str(tmpdir))
+    assert store.get_experiment_by_name("a").experiment_id == 1
+    # Experiment created by an earlier version of MLflow, without updating the catalog
+    store._create_experiment_with_id("b", 2)
+    assert store.create_experiment("c") == 3
+    assert store.get_experiment_by_name("b").experiment_id == 2
+    assert store.get_experiment_by_name("c").experiment_id == 3
@@ -4,9 +4,22 @@ import time
 import unittest
 import uuid
 
+import mock
+import pytest
+import yaml
+
 from mlflow.entities.experiment import Experiment
+from mlflow.entities.metric import Metric
+from mlflow.entities.param import Param
+from mlflow.entities.run_info import RunInfo
+from mlflow.entities.run_status import RunStatus
+from mlflow.entities.run_tag import RunTag
+from mlflow.protos.service_pb2 import SearchExpression, MetricSearchExpression, FloatClause, \
+    ParameterSearchExpression, StringClause
 from mlflow.store.file_store import FileStore
-from mlflow.utils.file_utils import write_yaml
+from mlflow.store.search_index import ExperimentSearchIndex
+from mlflow.utils import file_utils
+from mlflow.utils.file_utils import read_last_line, write_yaml
 from tests.helper_functions import random_int, random_str
 
 
@@ -181,6 +194,7 @@ class TestFileStore(unittest.TestCase):
                 run_info.pop("metrics")
                 run_info.pop("params")
                 self.assertEqual(run_info, dict(run.info))
+                self.assertEqual(run_info, dict(fs.get_run_info_by_uuid(run_uuid)))
 
     def test_list_run_infos(self):
         fs = FileStore(self.test_root)
@@ -238,6 +252,45 @@ class TestFileStore(unittest.TestCase):
                         self.assertEqual(metric.key, metric_name)
                         self.assertEqual(metric.value, metric_value)
 
+    def test_get_metric_history_window_and_downsampling(self):
+        fs = FileStore(self.test_root)
+        run_uuid = self.exp_data[self.experiments[0]]["runs"][0]
+        fs.log_batch(run_uuid, [Metric("loss", 100 - i, i) for i in range(100)], [], [])
+        history = fs.get_metric_history(run_uuid, "loss", start_ts=10, end_ts=19)
+        self.assertEqual([(m.timestamp, m.value) for m in history],
+                         [(i, 100 - i) for i in range(10, 20)])
+        history = fs.get_metric_history(run_uuid, "loss", start_ts=10, end_ts=19, max_points=2,
+                                        aggregation="min")
+        self.assertEqual([(m.timestamp, m.value) for m in history], [(14, 86), (19, 81)])
+        self.assertEqual(len(fs.get_metric_history(run_uuid, "loss", max_points=7)), 7)
+
+    def test_get_metric_history_bulk(self):
+        fs = FileStore(self.test_root)
+        run_uuids = self.exp_data[self.experiments[0]]["runs"][:2]
+        for i, run_uuid in enumerate(run_uuids):
+            fs.log_batch(run_uuid, [Metric("loss", j * (i + 1), j) for j in range(10)], [], [])
+        fs.log_metric(run_uuids[0], Metric("accuracy", 0.5, 3))
+        with mock.patch.object(fs, "_find_run_root", wraps=fs._find_run_root) as find_mock:
+            histories = fs.get_metric_history_bulk(run_uuids, ["loss", "accuracy", "missing"],
+                                                   start_ts=5, max_points=2, aggregation="max")
+            # Each run is resolved once, whatever the number of metrics
+            self.assertEqual(find_mock.call_count, 2)
+        self.assertEqual(set(histories.keys()), set(run_uuids))
+        self.assertEqual(sorted(histories[run_uuids[0]].keys()), ["accuracy", "loss"])
+        self.assertEqual(list(histories[run_uuids[1]].keys()), ["loss"])
+        for i, run_uuid in enumerate(run_uuids):
+            loss = histories[run_uuid]["loss"]
+            self.assertEqual([(m.timestamp, m.value) for m in loss],
+                             [(6, 6 * (i + 1)), (9, 9 * (i + 1))])
+            single = fs.get_metric_history(run_uuid, "loss", start_ts=5, max_points=2,
+                                           aggregation="max")
+            self.assertEqual([(m.timestamp, m.value) for m in single],
+                             [(m.timestamp, m.value) for m in loss])
+        # Logged, but outside of the requested time window
+        self.assertEqual(histories[run_uuids[0]]["accuracy"], [])
+        with self.assertRaises(Exception):
+            fs.get_metric_history_bulk([uuid.uuid4().hex], ["loss"])
+
     def test_get_param(self):
         fs = FileStore(self.test_root)
         for exp_id in self.experiments:
@@ -255,3 +308,463 @@ class TestFileStore(unittest.TestCase):
         fs = FileStore(self.test_root)
         # Expect 2 runs for each experiment
         assert len(fs.search_runs([self.experiments[0]], [])) == 2
+
+    def test_run_index_avoids_experiment_scan(self):
+        fs = FileStore(self.test_root)
+        run_uuid = self.exp_data[self.experiments[0]]["runs"][0]
+        # First lookup falls back to scanning experiments and indexes every run found.
+        self.assertEqual(fs.get_run(run_uuid).info.run_uuid, run_uuid)
+        self.assertTrue(os.path.exists(os.path.join(self.test_root,
+                                                    FileStore.RUN_INDEX_FILE_NAME)))
+        # Subsequent lookups, including from a fresh store, are served from the index.
+        for store in [fs, FileStore(self.test_root)]:
+            with mock.patch("mlflow.store.file_store.list_subdirs") as list_subdirs_mock:
+                for exp_id in self.experiments:
+                    for uuid_ in self.exp_data[exp_id]["runs"]:
+                        self.assertEqual(store._find_run_root(uuid_),
+                                         os.path.join(self.test_root, str(exp_id), uuid_))
+                list_subdirs_mock.assert_not_called()
+
+    def test_run_index_updated_on_create_run(self):
+        fs = FileStore(self.test_root)
+        run = fs.create_run(self.experiments[0], "user", "name", 1, "source", "entry", 0, None,
+                            [])
+        with mock.patch("mlflow.store.file_store.list_subdirs") as list_subdirs_mock:
+            self.assertEqual(FileStore(self.test_root).get_run(run.info.run_uuid).info,
+                             run.info)
+            list_subdirs_mock.assert_not_called()
+
+    def test_run_index_stale_entry(self):
+        fs = FileStore(self.test_root)
+        exp_id = self.experiments[0]
+        run_uuid = self.exp_data[exp_id]["runs"][0]
+        fs.get_run(run_uuid)
+        # Move the run to another experiment behind the store's back
+        other_exp_id = self.experiments[1]
+        shutil.move(os.path.join(self.test_root, str(exp_id), run_uuid),
+                    os.path.join(self.test_root, str(other_exp_id), run_uuid))
+        self.assertEqual(fs._find_run_root(run_uuid),
+                         os.path.join(self.test_root, str(other_exp_id), run_uuid))
+        self.assertIsNone(fs._find_run_root(uuid.uuid4().hex))
+
+    def test_log_metric_does_not_read_run(self):
+        fs = FileStore(self.test_root)
+        run_uuid = self.exp_data[self.experiments[0]]["runs"][0]
+        fs.log_param(run_uuid, Param("new_param", "value"))
+        with mock.patch("mlflow.store.file_store.read_file") as read_file_mock, \
+                mock.patch("mlflow.store.file_store.read_yaml") as read_yaml_mock:
+            for i in range(10):
+                fs.log_metric(run_uuid, Metric("new_metric", i, i))
+            fs.log_param(run_uuid, Param("other_param", "value"))
+            read_file_mock.assert_not_called()
+            read_yaml_mock.assert_not_called()
+        self.assertEqual(len(fs.get_metric_history(run_uuid, "new_metric")), 10)
+        self.assertEqual(fs.get_param(run_uuid, "other_param").value, "value")
+
+    def test_run_info_cache_invalidation(self):
+        fs = FileStore(self.test_root)
+        run_uuid = self.exp_data[self.experiments[0]]["runs"][0]
+        other_fs = FileStore(self.test_root)
+        self.assertEqual(other_fs.get_run(run_uuid).info, fs.get_run(run_uuid).info)
+        new_info = fs.update_run_info(run_uuid, RunStatus.FINISHED, 12345)
+        self.assertEqual(fs.get_run(run_uuid).info, new_info)
+        # Stores sharing the root directory notice that the run metadata changed on disk.
+        self.assertEqual(other_fs.get_run(run_uuid).info, new_info)
+
+    @pytest.mark.large
+    def test_log_metric_cost_independent_of_history(self):
+        fs = FileStore(self.test_root)
+        run_uuid = fs.create_run(self.experiments[0], "user", "name", 1, "source", "entry", 0,
+                                 None, []).info.run_uuid
+
+        def time_log_metrics(num_calls=200):
+            start = time.time()
+            for i in range(num_calls):
+                fs.log_metric(run_uuid, Metric("metric_%d" % (i % 50), i, i))
+            return (time.time() - start) / num_calls
+
+        short_history_cost = time_log_metrics()
+        for _ in range(50):
+            time_log_metrics()
+        long_history_cost = time_log_metrics()
+        print("log_metric: %.1f us/call with short history, %.1f us/call with long history"
+              % (short_history_cost * 1e6, long_history_cost * 1e6))
+        self.assertLess(long_history_cost, short_history_cost * 3)
+
+    def test_latest_metrics_summary(self):
+        fs = FileStore(self.test_root, write_latest_metrics=True)
+        run_uuid = self.exp_data[self.experiments[0]]["runs"][0]
+        metric_name = list(self.run_data[run_uuid]["metrics"].keys())[0]
+        fs.log_metric(run_uuid, Metric(metric_name, 1.5, 100))
+        fs.log_batch(run_uuid, [Metric("new_metric", i, i) for i in range(3)], [], [])
+        reader = FileStore(self.test_root)
+        with mock.patch("mlflow.store.metric_files.read_last_line",
+                        wraps=read_last_line) as read_last_line_mock:
+            metrics = dict((m.key, m) for m in reader.get_all_metrics(run_uuid))
+            # Only metrics missing from the summary are read from their files
+            self.assertEqual(read_last_line_mock.call_count,
+                             len(self.run_data[run_uuid]["metrics"]) - 1)
+        self.assertEqual((metrics[metric_name].timestamp, metrics[metric_name].value), (100, 1.5))
+        self.assertEqual((metrics["new_metric"].timestamp, metrics["new_metric"].value), (2, 2))
+        # Values logged by a store that does not update the summary make its entry out of date
+        reader.log_metric(run_uuid, Metric(metric_name, 2.5, 200))
+        metrics = dict((m.key, m) for m in fs.get_all_metrics(run_uuid))
+        self.assertEqual((metrics[metric_name].timestamp, metrics[metric_name].value), (200, 2.5))
+
+    @pytest.mark.large
+    def test_get_run_cost_independent_of_history(self):
+        fs = FileStore(self.test_root)
+        exp_id = self.experiments[0]
+        short_run_uuid, long_run_uuid = [
+            fs.create_run(exp_id, "user", "name", 1, "source", "entry", 0, None, []).info.run_uuid
+            for _ in range(2)]
+        for run_uuid, history_length in [(short_run_uuid, 10), (long_run_uuid, 1000000)]:
+            for i in range(20):
+                metric_path = fs._get_metric_path(exp_id, run_uuid, "metric_%d" % i)
+                with open(metric_path, "w") as f:
+                    f.write("".join("%d %d\n" % (j, j) for j in range(history_length)))
+
+        def time_get_run(run_uuid, num_calls=20):
+            start = time.time()
+            for _ in range(num_calls):
+                fs.get_run(run_uuid)
+            return (time.time() - start) / num_calls
+
+        short_history_cost = time_get_run(short_run_uuid)
+        long_history_cost = time_get_run(long_run_uuid)
+        print("get_run: %.1f us/call with 10 values per metric, %.1f us/call with 1M values"
+              % (short_history_cost * 1e6, long_history_cost * 1e6))
+        self.assertLess(long_history_cost, short_history_cost * 3)
+
+    def test_log_batch(self):
+        fs = FileStore(self.test_root)
+        run_uuid = self.exp_data[self.experiments[0]]["runs"][0]
+        metrics = [Metric("batch_metric", i, i) for i in range(5)] + [Metric("other", 1.5, 3)]
+        params = [Param("batch_param", "a"), Param("other_param", "b")]
+        tags = [RunTag("tag", "1"), RunTag("other_tag", "2")]
+        fs.get_run(run_uuid)
+        with mock.patch("mlflow.store.file_store.append_metric_values") as append_mock:
+            fs.log_batch(run_uuid, metrics, params, [])
+            # One append per metric file, not per logged value
+            self.assertEqual(append_mock.call_count, 2)
+        fs.log_batch(run_uuid, metrics, params, tags)
+        fs.log_batch(run_uuid, [], [], [RunTag("tag", "3")])
+        history = fs.get_metric_history(run_uuid, "batch_metric")
+        self.assertEqual([(m.timestamp, m.value) for m in history], [(i, i) for i in range(5)])
+        self.assertEqual(fs.get_metric(run_uuid, "other").value, 1.5)
+        self.assertEqual(fs.get_param(run_uuid, "batch_param").value, "a")
+        run_tags = FileStore(self.test_root).get_run(run_uuid).info.tags
+        self.assertEqual(sorted((tag.key, tag.value) for tag in run_tags),
+                         [("other_tag", "2"), ("tag", "3")])
+
+    def test_binary_metric_format(self):
+        fs = FileStore(self.test_root, metric_format="binary")
+        run_uuid = self.exp_data[self.experiments[0]]["runs"][0]
+        # Existing text histories are converted when values are logged to them
+        metric_name, values = list(self.run_data[run_uuid]["metrics"].items())[0]
+        fs.log_metric(run_uuid, Metric(metric_name, 0.125, 5))
+        fs.log_metric(run_uuid, Metric("new_metric", 2.5, 7))
+        expected = values + [(5, 0.125)]
+        for store in [fs, FileStore(self.test_root)]:
+            timestamps, metric_values = store.get_metric_history_arrays(run_uuid, metric_name)
+            self.assertEqual(list(zip(timestamps.tolist(), metric_values.tolist())), expected)
+            history = store.get_metric_history(run_uuid, metric_name)
+            self.assertEqual([(m.timestamp, m.value) for m in history], expected)
+            self.assertEqual(store.get_metric(run_uuid, "new_metric").value, 2.5)
+        with self.assertRaises(Exception):
+            FileStore(self.test_root, metric_format="csv")
+
+    def test_json_metadata_format(self):
+        fs = FileStore(self.test_root, metadata_format="json")
+        experiment_id = fs.create_experiment("json")
+        run_uuid = fs.create_run(experiment_id, "user", "name", 1, "source", "entry", 0, None,
+                                 [RunTag("tag", u"中文")]).info.run_uuid
+        fs.update_run_info(run_uuid, RunStatus.FINISHED, 10)
+        run_dir = fs._get_run_dir(experiment_id, run_uuid)
+        with open(os.path.join(run_dir, FileStore.META_DATA_FILE_NAME)) as f:
+            content = f.read()
+        self.assertTrue(content.startswith("{"))
+        # JSON metadata remains valid YAML
+        self.assertEqual(yaml.safe_load(content)["end_time"], 10)
+        # Stores writing either format read both
+        for store in [fs, FileStore(self.test_root)]:
+            self.assertEqual(store.get_experiment(experiment_id).name, "json")
+            run_info = store.get_run(run_uuid).info
+            self.assertEqual((run_info.status, run_info.end_time), (RunStatus.FINISHED, 10))
+            self.assertEqual([(tag.key, tag.value) for tag in run_info.tags],
+                             [("tag", u"中文")])
+            yaml_run_uuid = self.exp_data[self.experiments[0]]["runs"][0]
+            self.assertEqual(store.get_run(yaml_run_uuid).info.name,
+                             self.run_data[yaml_run_uuid]["name"])
+        with self.assertRaises(Exception):
+            FileStore(self.test_root, metadata_format="xml")
+
+    @pytest.mark.large
+    def test_list_run_infos_metadata_format_benchmark(self):
+        num_runs = 10000
+        for metadata_format in ["yaml", "json"]:
+            fs = FileStore(self.test_root, metadata_format=metadata_format)
+            experiment_id = fs.create_experiment(metadata_format)
+            run_info = fs.create_run(experiment_id, "user", "name", 1, "source", "entry", 0,
+                                     None, [RunTag("tag", "value")]).info
+            for _ in range(num_runs - 1):
+                run_uuid = uuid.uuid4().hex
+                run_dir = fs._get_run_dir(experiment_id, run_uuid)
+                os.makedirs(run_dir)
+                meta = dict(run_info)
+                meta["run_uuid"] = run_uuid
+                fs._write_run_info(run_dir, RunInfo.from_dictionary(meta))
+            loaders = [("", None)]
+            if metadata_format == "yaml":
+                loaders.append((" (pure Python loader)", yaml.SafeLoader))
+            for description, loader in loaders:
+                with mock.patch("mlflow.utils.file_utils.YamlSafeLoader",
+                                loader or file_utils.YamlSafeLoader):
+                    # A new store has no cached run metadata
+                    start = time.time()
+                    run_infos = FileStore(self.test_root).list_run_infos(experiment_id)
+                    duration = time.time() - start
+                self.assertEqual(len(run_infos), num_runs)
+                print("list_run_infos: %.2f s for %d runs with %s metadata%s"
+                      % (duration, num_runs, metadata_format, description))
+
+    @staticmethod
+    def _metric_expression(key, comparator, value):
+        return SearchExpression(metric=MetricSearchExpression(
+            key=key, float=FloatClause(comparator=comparator, value=value)))
+
+    @staticmethod
+    def _param_expression(key, comparator, value):
+        return SearchExpression(parameter=ParameterSearchExpression(
+            key=key, string=StringClause(comparator=comparator, value=value)))
+
+    def test_search_runs_with_expressions(self):
+        fs = FileStore(self.test_root)
+        exp_id = self.experiments[0]
+        legacy_run_uuid = self.exp_data[exp_id]["runs"][0]
+        metric_name, values = list(self.run_data[legacy_run_uuid]["metrics"].items())[0]
+        param_name, param_value = list(self.run_data[legacy_run_uuid]["params"].items())[0]
+        # Runs written before the search index existed are found
+        runs = fs.search_runs([exp_id], [self._metric_expression(metric_name, "=", values[-1][1]),
+                                         self._param_expression(param_name, "=", param_value)])
+        self.assertEqual([run.info.run_uuid for run in runs], [legacy_run_uuid])
+        # Runs created and logged to through the store are indexed as they are written
+        new_run_uuid = fs.create_run(exp_id, "user", "name", 1, "source", "entry", 0, None,
+                                     []).info.run_uuid
+        fs.log_metric(new_run_uuid, Metric("acc", 0.5, 1))
+        fs.log_metric(new_run_uuid, Metric("acc", 0.9, 2))
+        fs.log_batch(new_run_uuid, [], [Param("model", "cnn")], [])
+        fs.log_metric(legacy_run_uuid, Metric("acc", 0.7, 1))
+        fs.log_param(legacy_run_uuid, Param("model", "rnn"))
+        for store in [fs, FileStore(self.test_root)]:
+            def search(*expressions):
+                return sorted(run.info.run_uuid for run in store.search_runs([exp_id],
+                                                                              expressions))
+            self.assertEqual(search(self._metric_expression("acc", ">", 0.8)), [new_run_uuid])
+            self.assertEqual(search(self._metric_expression("acc", ">=", 0.7)),
+                             sorted([new_run_uuid, legacy_run_uuid]))
+            self.assertEqual(search(self._metric_expression("acc", ">", 0.6),
+                                    self._param_expression("model", "!=", "cnn")),
+                             [legacy_run_uuid])
+            self.assertEqual(search(self._param_expression("missing", "=", "cnn")), [])
+            with mock.patch("mlflow.store.file_store.read_file") as read_file_mock:
+                search(self._metric_expression("acc", "<", 0))
+                read_file_mock.assert_not_called()
+
+    def test_search_index_snapshot(self):
+        fs = FileStore(self.test_root)
+        exp_id = self.experiments[0]
+        run_uuid = self.exp_data[exp_id]["runs"][0]
+        with mock.patch.object(ExperimentSearchIndex, "SNAPSHOT_THRESHOLD_BYTES", 0):
+            fs.log_metric(run_uuid, Metric("acc", 0.5, 1))
+            fs.search_runs([exp_id], [self._metric_expression("acc", ">", 0)])
+        fs.log_metric(run_uuid, Metric("acc", 0.25, 2))
+        self.assertTrue(os.path.exists(os.path.join(
+            self.test_root, str(exp_id), ExperimentSearchIndex.SNAPSHOT_FILE_NAME)))
+        runs = FileStore(self.test_root).search_runs(
+            [exp_id], [self._metric_expression("acc", "=", 0.25)])
+        self.assertEqual([run.info.run_uuid for run in runs], [run_uuid])
+
+    def test_search_index_log_is_compacted(self):
+        exp_id = self.experiments[0]
+        run_uuid = self.exp_data[exp_id]["runs"][0]
+        reader, writer = FileStore(self.test_root), FileStore(self.test_root)
+        writer.log_metric(run_uuid, Metric("acc", 0.5, 1))
+        reader.search_runs([exp_id], [self._metric_expression("acc", ">", 0)])
+        log_path = os.path.join(self.test_root, str(exp_id), ExperimentSearchIndex.LOG_FILE_NAME)
+        with mock.patch.object(ExperimentSearchIndex, "SNAPSHOT_THRESHOLD_BYTES", 1000):
+            for i in range(100):
+                writer.log_metric(run_uuid, Metric("acc", i, i + 2))
+                self.assertLess(os.path.getsize(log_path), 1200)
+        # A reader that last read a replaced log reloads the snapshot
+        for store in [reader, FileStore(self.test_root)]:
+            runs = store.search_runs([exp_id], [self._metric_expression("acc", "=", 99)])
+            self.assertEqual([run.info.run_uuid for run in runs], [run_uuid])
+
+    def test_search_index_keeps_latest_metric_value(self):
+        exp_id = self.experiments[0]
+        run_uuid = self.exp_data[exp_id]["runs"][0]
+        index = ExperimentSearchIndex(os.path.join(self.test_root, str(exp_id)))
+        index.log_metrics(run_uuid, [Metric("acc", 0.9, 5)])
+        # e.g. a lazy registration appending older values after the newer one
+        index.register_run(run_uuid, [Metric("acc", 0.1, 3)], [])
+        index.refresh()
+        self.assertEqual(index.get_matching_runs(self._metric_expression("acc", "=", 0.9)),
+                         set([run_uuid]))
+
+    def test_get_run_skips_metric_files_without_values(self):
+        from mlflow.store.metric_files import _create_binary_file
+        fs = FileStore(self.test_root)
+        exp_id = self.experiments[0]
+        run_uuid = fs.create_run(exp_id, "user", "name", 1, "source", "entry", 0, None,
+                                 []).info.run_uuid
+        fs.log_metric(run_uuid, Metric("acc", 1, 0))
+        metrics_dir = os.path.join(self.test_root, str(exp_id), run_uuid, "metrics")
+        # Files created by other processes that have not appended their first value yet
+        open(os.path.join(metrics_dir, "empty"), "w").close()
+        _create_binary_file(os.path.join(metrics_dir, "loss"))
+        self.assertEqual([metric.key for metric in fs.get_run(run_uuid).data.metrics], ["acc"])
+
+    def test_search_index_keeps_last_logged_metric_value(self):
+        fs = FileStore(self.test_root)
+        exp_id = self.experiments[0]
+        run_uuid = fs.create_run(exp_id, "user", "name", 1, "source", "entry", 0, None,
+                                 []).info.run_uuid
+        fs.log_metric(run_uuid, Metric("m", 5, 10))
+        # Logged last, with an earlier timestamp
+        fs.log_metric(run_uuid, Metric("m", 1, 5))
+        self.assertEqual(fs.get_metric(run_uuid, "m").value, 1)
+        self.assertEqual(fs.search_runs([exp_id], [self._metric_expression("m", ">", 3)]), [])
+        self.assertEqual([run.info.run_uuid for run in fs.search_runs(
+            [exp_id], [self._metric_expression("m", "=", 1)])], [run_uuid])
+
+    def test_list_run_infos_pagination(self):
+        fs = FileStore(self.test_root)
+        exp_id = self.experiments[0]
+        for start_time in range(5):
+            fs.create_run(exp_id, "user", "name", 1, "source", "entry", start_time, None, [])
+        all_infos = fs.list_run_infos(exp_id)
+        self.assertEqual(len(all_infos), 7)
+        self.assertIsNone(all_infos.token)
+        # Default ordering is by start time, latest first
+        start_times = [run_info.start_time for run_info in all_infos]
+        self.assertEqual(start_times, sorted(start_times, reverse=True))
+        for order_by in [None, ["start_time"], ["user_id DESC", "run_uuid ASC"]]:
+            expected = [run_info.run_uuid for run_info in fs.list_run_infos(exp_id,
+                                                                            order_by=order_by)]
+            paged, token = [], None
+            while True:
+                page = fs.list_run_infos(exp_id, max_results=3, page_token=token,
+                                         order_by=order_by)
+                self.assertLessEqual(len(page), 3)
+                paged.extend(run_info.run_uuid for run_info in page)
+                token = page.token
+                if token is None:
+                    break
+            self.assertEqual(paged, expected)
+        with self.assertRaises(Exception):
+            fs.list_run_infos(exp_id, order_by=["not_an_attribute"])
+        with self.assertRaises(Exception):
+            fs.list_run_infos(exp_id, page_token="bad token")
+
+    def test_search_runs_pagination(self):
+        fs = FileStore(self.test_root)
+        exp_id = self.experiments[0]
+        for i in range(5):
+            run_uuid = fs.create_run(exp_id, "user", "name", 1, "source", "entry", i, None,
+                                     []).info.run_uuid
+            fs.log_metric(run_uuid, Metric("acc", i, 0))
+        expression = self._metric_expression("acc", ">=", 1)
+        first_page = fs.search_runs([exp_id], [expression], max_results=3,
+                                    order_by=["start_time ASC"])
+        self.assertEqual([run.info.start_time for run in first_page], [1, 2, 3])
+        second_page = fs.search_runs([exp_id], [expression], max_results=3,
+                                     page_token=first_page.token, order_by=["start_time ASC"])
+        self.assertEqual([run.info.start_time for run in second_page], [4])
+        self.assertIsNone(second_page.token)
+
+    def test_page_token_is_stable_across_new_runs(self):
+        fs = FileStore(self.test_root)
+        exp_id = fs.create_experiment("paged")
+        for start_time in range(4):
+            fs.create_run(exp_id, "user", "name", 1, "source", "entry", start_time, None, [])
+        first_page = fs.list_run_infos(exp_id, max_results=2)
+        self.assertEqual([run_info.start_time for run_info in first_page], [3, 2])
+        # A run created between two requests sorts before the first page, and does not shift the
+        # next one
+        fs.create_run(exp_id, "user", "name", 1, "source", "entry", 10, None, [])
+        second_page = fs.list_run_infos(exp_id, max_results=2, page_token=first_page.token)
+        self.assertEqual([run_info.start_time for run_info in second_page], [1, 0])
+        self.assertIsNone(second_page.token)
+        with self.assertRaises(Exception):
+            fs.list_run_infos(exp_id, page_token=first_page.token, order_by=["user_id", "name"])
+
+    def test_change_token(self):
+        fs = FileStore(self.test_root)
+        other_fs = FileStore(self.test_root)
+        tokens = [fs.get_change_token([self.experiments[0]])]
+        self.assertIsNotNone(tokens[0])
+        run_uuid = fs.create_run(self.experiments[0], "user", "name", 1, "source", "entry", 0,
+                                 None, []).info.run_uuid
+        tokens.append(other_fs.get_change_token([self.experiments[0]]))
+        fs.log_metric(run_uuid, Metric("acc", 1, 0))
+        tokens.append(other_fs.get_change_token([self.experiments[0]]))
+        fs.log_param(run_uuid, Param("p", "v"))
+        tokens.append(other_fs.get_change_token([self.experiments[0]]))
+        fs.log_batch(run_uuid, [], [], [RunTag("t", "v")])
+        tokens.append(other_fs.get_change_token([self.experiments[0]]))
+        fs.update_run_info(run_uuid, RunStatus.FINISHED, 1)
+        tokens.append(other_fs.get_change_token([self.experiments[0]]))
+        fs.create_experiment("new experiment")
+        tokens.append(other_fs.get_change_token([self.experiments[0]]))
+        self.assertEqual(len(set(tokens)), len(tokens))
+        # Reads do not change the token
+        fs.get_run(run_uuid)
+        fs.search_runs([self.experiments[0]], [])
+        self.assertEqual(fs.get_change_token([self.experiments[0]]), tokens[-1])
+
+    def test_read_only(self):
+        root = os.path.join(self.test_root, "read_only")
+        with self.assertRaises(Exception):
+            FileStore(root, read_only=True)
+        os.mkdir(root)
+        fs = FileStore(root, read_only=True)
+        self.assertEqual(fs.list_experiments(), [])
+        self.assertIsNone(fs.get_experiment_by_name("Default"))
+        self.assertIsNone(fs.get_change_token())
+        with self.assertRaises(Exception):
+            fs.create_experiment("new experiment")
+        self.assertEqual(os.listdir(root), [])
+        # Runs are read without writing the run index
+        fs = FileStore(self.test_root, read_only=True)
+        run_uuid = self.exp_data[self.experiments[0]]["runs"][0]
+        self.assertEqual(fs.get_run(run_uuid).info.run_uuid, run_uuid)
+        self.assertFalse(os.path.exists(os.path.join(self.test_root,
+                                                     FileStore.RUN_INDEX_FILE_NAME)))
+        with self.assertRaises(Exception):
+            fs.log_metric(run_uuid, Metric("acc", 1, 0))
+        with self.assertRaises(Exception):
+            fs.update_run_info(run_uuid, RunStatus.FINISHED, 1)
+
+    def test_change_token_scope(self):
+        fs = FileStore(self.test_root)
+        experiment_id, other_experiment_id = self.experiments[:2]
+        run_uuid = fs.create_run(experiment_id, "user", "name", 1, "source", "entry", 0,
+                                 None, []).info.run_uuid
+
+        def get_tokens():
+            return (fs.get_change_token(),
+                    fs.get_change_token([experiment_id], include_run_data=False),
+                    fs.get_change_token([experiment_id]),
+                    fs.get_change_token([other_experiment_id]))
+
+        before = get_tokens()
+        fs.log_metric(run_uuid, Metric("acc", 1, 0))
+        fs.log_param(run_uuid, Param("p", "v"))
+        after = get_tokens()
+        self.assertEqual([a == b for a, b in zip(before, after)], [True, True, False, True])
+        fs.log_batch(run_uuid, [], [], [RunTag("t", "v")])
+        after_tags = get_tokens()
+        self.assertEqual([a == b for a, b in zip(after, after_tags)], [True, False, False, True])
+        fs.create_experiment("new experiment")
+        self.assertTrue(all(a != b for a, b in zip(after_tags, get_tokens())))
@@ -0,0 +1,98 @@
+import multiprocessing
+import time
+
+import pytest
+
+from mlflow.entities.metric import Metric
+from mlflow.entities.param import Param
+from mlflow.entities.run_status import RunStatus
+from mlflow.entities.run_tag import RunTag
+from mlflow.store.file_store import FileStore
+from mlflow.store.metric_files import BINARY_FORMAT, TEXT_FORMAT
+
+
+def _write(args):
+    root, run_uuid, worker, num_iterations, metric_format = args
+    store = FileStore(root, metric_format=metric_format)
+    for i in range(num_iterations):
+        store.log_metric(run_uuid, Metric("shared", worker * num_iterations + i, i))
+        store.log_param(run_uuid, Param("worker_%s_%s" % (worker, i), str(i)))
+        store.log_batch(run_uuid, [Metric("batch", i, i)], [],
+                        [RunTag("worker_%s" % worker, str(i))])
+        store.update_run_info(run_uuid, RunStatus.RUNNING, None)
+
+
+def _read(args):
+    root, run_uuid, deadline = args
+    store = FileStore(root)
+    num_reads = 0
+    while time.time() < deadline:
+        # Raises on torn metadata or malformed metric files
+        run = store.get_run(run_uuid)
+        assert run.info.run_uuid == run_uuid
+        for metric in run.data.metrics:
+            store.get_metric_history(run_uuid, metric.key)
+        num_reads += 1
+    return num_reads
+
+
+def _run_stress_test(root, num_writers, num_readers, num_iterations, metric_format):
+    run_uuid = FileStore(root).create_run(0, "user", "name", 1, "source", "entry", 0, None,
+                                          []).info.run_uuid
+    pool = multiprocessing.Pool(num_writers + num_readers)
+    try:
+        start = time.time()
+        readers = pool.map_async(_read, [(root, run_uuid, start + 2)] * num_readers)
+        pool.map(_write, [(root, run_uuid, worker, num_iterations, metric_format)
+                          for worker in range(num_writers)])
+        duration = time.time() - start
+        num_reads = sum(readers.get())
+    finally:
+        pool.close()
+        pool.join()
+
+    store = FileStore(root)
+    history = store.get_metric_history(run_uuid, "shared")
+    num_values = num_writers * num_iterations
+    # No value is lost or torn
+    assert sorted(metric.value for metric in history) == list(range(num_values))
+    assert len(store.get_metric_history(run_uuid, "batch")) == num_values
+    run = store.get_run(run_uuid)
+    assert len(run.data.params) == num_values
+    # No tag update is lost to a concurrent read-modify-write of the run metadata
+    assert sorted((tag.key, tag.value) for tag in run.info.tags) == \
+        sorted(("worker_%s" % worker, str(num_iterations - 1)) for worker in range(num_writers))
+    return num_values * 4 / duration, num_reads
+
+
+def _construct(root):
+    FileStore(root)
+
+
+def test_concurrent_construction_on_fresh_root(tmpdir):
+    pool = multiprocessing.Pool(8)
+    try:
+        for i in range(20):
+            root = str(tmpdir.join("mlruns%s" % i))
+            # Every process finds the default experiment missing and tries to create it
+            pool.map(_construct, [root] * 8)
+            experiments = FileStore(root).list_experiments()
+            assert [(e.experiment_id, e.name) for e in experiments] == [(0, "Default")]
+    finally:
+        pool.close()
+        pool.join()
+
+
+@pytest.mark.parametrize("metric_format", [TEXT_FORMAT, BINARY_FORMAT])
+def test_concurrent_writers(tmpdir, metric_format):
+    _run_stress_test(str(tmpdir), num_writers=4, num_readers=2, num_iterations=25,
+                     metric_format=metric_format)
+
+
+@pytest.mark.large
+def test_concurrent_writers_benchmark(tmpdir):
+    writes_per_second, num_reads = _run_stress_test(str(tmpdir), num_writers=16, num_readers=4,
+                                                    num_iterations=200,
+                                                    metric_format=TEXT_FORMAT)
+    print("%.0f writes per second across 16 writer processes, %s concurrent run reads"
+          % (writes_per_second, num_reads))
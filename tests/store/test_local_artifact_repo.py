@@ -58,3 +58,18 @@ class TestLocalArtifactRepo(unittest.TestCase):
             text = open(os.path.join(downloaded_dir, "c.txt")).read()
             self.assertEqual(text, "C")
 
+
+    def test_open_artifact(self):
+        with TempDir() as test_root:
+            repo = ArtifactRepository.from_artifact_uri(test_root.path())
+            with open(test_root.path("test.txt"), "w") as f:
+                f.write("Hello world!")
+            self.assertEqual(repo.get_artifact_size("test.txt"), 12)
+            with repo.open_artifact("test.txt") as f:
+                self.assertEqual(f.read(), b"Hello world!")
+            with repo.open_artifact("test.txt", 6) as f:
+                self.assertEqual(f.read(), b"world!")
+            with repo.open_artifact("test.txt", 2, 7) as f:
+                self.assertEqual(f.read(2), b"ll")
+                self.assertEqual(f.read(), b"o w")
+                self.assertEqual(f.read(), b"")
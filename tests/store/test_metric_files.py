@@ -0,0 +1,73 @@
+import os
+
+import numpy as np
+import pytest
+
+from mlflow.store.metric_files import append_metric_values, is_binary_metric_file, \
+    read_latest_metric_value, read_metric_history, _read_text_metric_history, BINARY_FORMAT, \
+    TEXT_FORMAT
+
+
+@pytest.mark.parametrize("metric_format", [TEXT_FORMAT, BINARY_FORMAT])
+def test_append_and_read(tmpdir, metric_format):
+    path = str(tmpdir.join("loss"))
+    append_metric_values(path, [(1, 0.5), (2, 0.25)], metric_format)
+    append_metric_values(path, [(3, -1.5)], metric_format)
+    assert is_binary_metric_file(path) == (metric_format == BINARY_FORMAT)
+    assert read_latest_metric_value(path) == (3, -1.5)
+    timestamps, values = read_metric_history(path)
+    assert timestamps.tolist() == [1, 2, 3]
+    assert values.tolist() == [0.5, 0.25, -1.5]
+    assert timestamps.dtype == np.int64 and values.dtype == np.float64
+
+
+def test_binary_format_preserves_full_precision(tmpdir):
+    path = str(tmpdir.join("metric"))
+    value = 0.1 + 0.2
+    append_metric_values(path, [(1537480000123, value)], BINARY_FORMAT)
+    assert read_latest_metric_value(path) == (1537480000123, value)
+    assert os.path.getsize(path) == 32
+
+
+def test_text_file_migrated_to_binary_on_binary_append(tmpdir):
+    path = str(tmpdir.join("metric"))
+    with open(path, "w") as f:
+        f.write("1 10\n2 20.5\n")
+    append_metric_values(path, [(3, 30)], BINARY_FORMAT)
+    assert is_binary_metric_file(path)
+    timestamps, values = read_metric_history(path)
+    assert timestamps.tolist() == [1, 2, 3]
+    assert values.tolist() == [10, 20.5, 30]
+    # Binary files stay binary, even for text writers
+    append_metric_values(path, [(4, 40)], TEXT_FORMAT)
+    assert is_binary_metric_file(path)
+    assert read_latest_metric_value(path) == (4, 40)
+
+
+def test_binary_reads_ignore_partial_record(tmpdir):
+    path = str(tmpdir.join("metric"))
+    append_metric_values(path, [(1, 1.0), (2, 2.0)], BINARY_FORMAT)
+    with open(path, "ab") as f:
+        f.write(b"\x00" * 7)
+    assert read_latest_metric_value(path) == (2, 2.0)
+    assert read_metric_history(path)[0].tolist() == [1, 2]
+
+
+@pytest.mark.parametrize("metric_format", [TEXT_FORMAT, BINARY_FORMAT])
+def test_read_metric_history_window(tmpdir, metric_format):
+    path = str(tmpdir.join("metric"))
+    append_metric_values(path, [(ts, ts * 2) for ts in range(10)], metric_format)
+    timestamps, values = read_metric_history(path, start_ts=3, end_ts=5)
+    assert timestamps.tolist() == [3, 4, 5]
+    assert values.tolist() == [6, 8, 10]
+    assert read_metric_history(path, start_ts=8)[0].tolist() == [8, 9]
+    assert read_metric_history(path, end_ts=-1)[0].tolist() == []
+
+
+def test_read_text_metric_history_in_chunks(tmpdir):
+    path = str(tmpdir.join("metric"))
+    with open(path, "w") as f:
+        f.write("".join("%d %d\n" % (i, i) for i in range(1000)) + "1000 1000")
+    timestamps, values = _read_text_metric_history(path, None, None, chunk_size=7)
+    assert timestamps.tolist() == list(range(1001))
+    assert values.tolist() == list(range(1001))
@@ -0,0 +1,173 @@
+import json
+import time
+
+import mock
+import pytest
+import requests
+from google.protobuf.json_format import MessageToJson, ParseDict
+
+from mlflow.entities.metric import Metric
+from mlflow.entities.param import Param
+from mlflow.entities.run_tag import RunTag
+from mlflow.protos.service_pb2 import GetRun, LogBatch, LogMetric, RunInfo, SearchRuns
+from mlflow.store.rest_store import RestStore
+from mlflow.utils.rest_utils import RestException
+
+
+def _mock_response(response_message, content_type):
+    if content_type == "application/x-protobuf":
+        return mock.Mock(headers={"Content-Type": content_type},
+                         content=response_message.SerializeToString())
+    return mock.Mock(headers={"Content-Type": content_type}, text=MessageToJson(response_message))
+
+
+def _get_run_response():
+    response_message = GetRun.Response()
+    response_message.run.info.run_uuid = "abc"
+    response_message.run.data.metrics.add(key="m", value=1.5, timestamp=3)
+    return response_message
+
+
+def test_protobuf_requests():
+    store = RestStore("http://host", use_protobuf=True)
+    with mock.patch("mlflow.store.rest_store.http_request_raw",
+                    return_value=_mock_response(_get_run_response(),
+                                                "application/x-protobuf")) as request_mock:
+        run = store.get_run("abc")
+        assert run.info.run_uuid == "abc"
+        assert run.data.metrics[0].value == 1.5
+        _, kwargs = request_mock.call_args
+        assert kwargs["headers"]["Accept"] == "application/x-protobuf"
+        assert kwargs["headers"]["Content-Type"] == "application/x-protobuf"
+        request_message = GetRun()
+        request_message.ParseFromString(kwargs["data"])
+        assert request_message.run_uuid == "abc"
+
+    # Servers that do not support protobuf answer in JSON
+    with mock.patch("mlflow.store.rest_store.http_request_raw",
+                    return_value=_mock_response(_get_run_response(), "application/json")):
+        assert store.get_run("abc").info.run_uuid == "abc"
+
+
+def test_json_requests():
+    with mock.patch.dict("os.environ", {"MLFLOW_REST_STORE_USE_PROTOBUF": "true"}):
+        assert RestStore("http://host").use_protobuf
+    # JSON is used by default
+    store = RestStore("http://host")
+    assert not store.use_protobuf
+    with mock.patch("mlflow.store.rest_store.http_request_raw",
+                    return_value=_mock_response(LogMetric.Response(),
+                                                "application/json")) as request_mock:
+        store.log_metric("abc", Metric("m", 2.5, 7))
+        _, kwargs = request_mock.call_args
+        assert "data" not in kwargs
+        assert json.loads(kwargs["req_body_json"]) == {"runUuid": "abc", "key": "m",
+                                                        "value": 2.5}
+
+
+@pytest.mark.parametrize("use_protobuf", [False, True])
+def test_log_batch(use_protobuf):
+    store = RestStore("http://host", use_protobuf=use_protobuf)
+    content_type = "application/x-protobuf" if use_protobuf else "application/json"
+    with mock.patch("mlflow.store.rest_store.http_request_raw",
+                    return_value=_mock_response(LogBatch.Response(),
+                                                content_type)) as request_mock:
+        store.log_batch("abc", [Metric("m", 1.5, 1), Metric("m", 2.5, 2)], [Param("p", "v")],
+                        [RunTag("t", "w")])
+        assert request_mock.call_count == 1
+        _, kwargs = request_mock.call_args
+        assert kwargs["endpoint"] == "/api/2.0/preview/mlflow/runs/log-batch"
+        assert kwargs["method"] == "POST"
+        if use_protobuf:
+            request_message = LogBatch()
+            request_message.ParseFromString(kwargs["data"])
+        else:
+            request_message = ParseDict(json.loads(kwargs["req_body_json"]), LogBatch())
+    assert request_message.run_uuid == "abc"
+    assert [(m.key, m.value, m.timestamp) for m in request_message.metrics] == \
+        [("m", 1.5, 1), ("m", 2.5, 2)]
+    assert [(p.key, p.value) for p in request_message.params] == [("p", "v")]
+    assert [(t.key, t.value) for t in request_message.tags] == [("t", "w")]
+
+
+def _json_only_server(response_message, calls):
+    """ Mocks `http_request_raw` for a server that only parses JSON request bodies. """
+    def request(**kwargs):
+        calls.append(kwargs)
+        if kwargs.get("data") is not None:
+            raise RestException("API request failed with code 400 != 200. API response: "
+                                "Failed to decode JSON object", 400,
+                                "Failed to decode JSON object")
+        return _mock_response(response_message, "application/json")
+    return request
+
+
+def test_protobuf_requests_fall_back_to_json():
+    store = RestStore("http://host", use_protobuf=True)
+    calls = []
+    with mock.patch("mlflow.store.rest_store.http_request_raw",
+                    side_effect=_json_only_server(LogMetric.Response(), calls)):
+        store.log_metric("abc", Metric("m", 2.5, 7))
+        assert [call.get("data") is not None for call in calls] == [True, False]
+        assert json.loads(calls[1]["req_body_json"])["value"] == 2.5
+        # Later requests go straight to JSON
+        assert not store.use_protobuf
+        store.log_metric("abc", Metric("m", 3.5, 8))
+        assert len(calls) == 3
+
+
+def test_protobuf_errors_of_protobuf_servers_are_raised():
+    store = RestStore("http://host", use_protobuf=True)
+    with mock.patch("mlflow.store.rest_store.http_request_raw",
+                    return_value=_mock_response(_get_run_response(), "application/x-protobuf")):
+        store.get_run("abc")
+    with mock.patch("mlflow.store.rest_store.http_request_raw",
+                    side_effect=RestException("Run 'abc' not found", 400,
+                                              "Run 'abc' not found")) as request_mock:
+        with pytest.raises(Exception):
+            store.get_run("abc")
+        assert request_mock.call_count == 1
+    assert store.use_protobuf
+
+
+@pytest.mark.parametrize("error", [requests.exceptions.Timeout("timed out"),
+                                   requests.exceptions.ConnectionError("connection reset"),
+                                   RestException("failed", 500, "Internal Server Error")])
+def test_protobuf_requests_are_not_resent_after_other_failures(error):
+    store = RestStore("http://host", use_protobuf=True)
+    with mock.patch("mlflow.store.rest_store.http_request_raw",
+                    side_effect=error) as request_mock:
+        with pytest.raises(type(error)):
+            store.log_metric("abc", Metric("m", 2.5, 7))
+        # The server may have applied the request, so it is not sent again
+        assert request_mock.call_count == 1
+    assert store.use_protobuf
+
+
+@pytest.mark.large
+def test_search_runs_serialization_benchmark():
+    response_message = SearchRuns.Response()
+    for i in range(10000):
+        run = response_message.runs.add()
+        run.info.MergeFrom(RunInfo(run_uuid="%032x" % i, experiment_id=0, name="run",
+                                   source_name="train.py", user_id="user", status=3,
+                                   start_time=i, end_time=i + 1, artifact_uri="/artifacts/%s" % i))
+        for j in range(10):
+            run.data.metrics.add(key="metric_%s" % j, value=j * 0.5, timestamp=i)
+            run.data.params.add(key="param_%s" % j, value=str(j))
+
+    def measure(fn):
+        start = time.time()
+        fn()
+        return time.time() - start
+
+    def json_round_trip():
+        ParseDict(json.loads(MessageToJson(response_message)), SearchRuns.Response())
+
+    def protobuf_round_trip():
+        SearchRuns.Response().ParseFromString(response_message.SerializeToString())
+
+    json_time = measure(json_round_trip)
+    protobuf_time = measure(protobuf_round_trip)
+    print("Round trip of 10k runs: JSON %.2fs, protobuf %.2fs" % (json_time, protobuf_time))
+    assert protobuf_time < json_time
@@ -0,0 +1,239 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from mlflow.entities.experiment import Experiment
+from mlflow.entities.metric import Metric
+from mlflow.entities.param import Param
+from mlflow.entities.run_status import RunStatus
+from mlflow.entities.run_tag import RunTag
+from mlflow.protos.service_pb2 import SearchExpression, MetricSearchExpression, FloatClause, \
+    ParameterSearchExpression, StringClause
+from mlflow.store.file_store import FileStore
+from mlflow.store.sqlalchemy_store import SqlAlchemyStore
+from mlflow.utils.search_utils import sort_run_infos
+
+
+class TestSqlAlchemyStore(unittest.TestCase):
+
+    def setUp(self):
+        self.test_root = tempfile.mkdtemp()
+        self.db_uri = "sqlite:///%s" % os.path.join(self.test_root, "mlflow.db")
+        self.store = SqlAlchemyStore(self.db_uri, os.path.join(self.test_root, "artifacts"))
+
+    def tearDown(self):
+        self.store.engine.dispose()
+        shutil.rmtree(self.test_root)
+
+    def _create_run(self, experiment_id=Experiment.DEFAULT_EXPERIMENT_ID, start_time=0,
+                    tags=None):
+        return self.store.create_run(experiment_id, "user", "name", 1, "source", "entry",
+                                     start_time, "version", tags or [])
+
+    @staticmethod
+    def _metric_expression(key, comparator, value):
+        return SearchExpression(metric=MetricSearchExpression(
+            key=key, float=FloatClause(comparator=comparator, value=value)))
+
+    @staticmethod
+    def _param_expression(key, comparator, value):
+        return SearchExpression(parameter=ParameterSearchExpression(
+            key=key, string=StringClause(comparator=comparator, value=value)))
+
+    def test_experiments(self):
+        default = self.store.get_experiment(Experiment.DEFAULT_EXPERIMENT_ID)
+        self.assertEqual(default.name, "Default")
+        experiment_id = self.store.create_experiment("new")
+        self.assertNotEqual(experiment_id, Experiment.DEFAULT_EXPERIMENT_ID)
+        experiment = self.store.get_experiment(experiment_id)
+        self.assertEqual(experiment.name, "new")
+        self.assertEqual(experiment.artifact_location,
+                         os.path.join(self.test_root, "artifacts", str(experiment_id)))
+        self.assertEqual([e.name for e in self.store.list_experiments()], ["Default", "new"])
+        with self.assertRaises(Exception):
+            self.store.create_experiment("new")
+        with self.assertRaises(Exception):
+            self.store.get_experiment(12345)
+        # Reopening the database keeps the experiments
+        store = SqlAlchemyStore(self.db_uri)
+        self.assertEqual([e.name for e in store.list_experiments()], ["Default", "new"])
+
+    def test_runs(self):
+        run = self._create_run(start_time=5, tags=[RunTag("a", "1")])
+        run_uuid = run.info.run_uuid
+        self.assertEqual(run.info.status, RunStatus.RUNNING)
+        self.assertTrue(run.info.artifact_uri.endswith(os.path.join(run_uuid, "artifacts")))
+        self.store.log_metric(run_uuid, Metric("m", 1.0, 1))
+        self.store.log_metric(run_uuid, Metric("m", 2.0, 2))
+        self.store.log_param(run_uuid, Param("p", "x"))
+        self.store.log_batch(run_uuid, [Metric("m", 3.0, 3), Metric("n", 4.0, 3)],
+                             [Param("q", "y")], [RunTag("a", "2"), RunTag("b", "3")])
+        run_info = self.store.update_run_info(run_uuid, RunStatus.FINISHED, 10)
+        self.assertEqual((run_info.status, run_info.end_time), (RunStatus.FINISHED, 10))
+        self.assertEqual(dict(self.store.get_run_info_by_uuid(run_uuid)), dict(run_info))
+
+        run = self.store.get_run(run_uuid)
+        self.assertEqual(run.info.start_time, 5)
+        self.assertEqual(sorted((m.key, m.value, m.timestamp) for m in run.data.metrics),
+                         [("m", 3.0, 3), ("n", 4.0, 3)])
+        self.assertEqual(sorted((p.key, p.value) for p in run.data.params),
+                         [("p", "x"), ("q", "y")])
+        self.assertEqual(sorted((t.key, t.value) for t in run.info.tags),
+                         [("a", "2"), ("b", "3")])
+        self.assertEqual(self.store.get_metric(run_uuid, "m").value, 3.0)
+        self.assertEqual(self.store.get_param(run_uuid, "q").value, "y")
+        with self.assertRaises(Exception):
+            self.store.get_metric(run_uuid, "missing")
+        with self.assertRaises(Exception):
+            self.store.get_run("missing")
+        with self.assertRaises(Exception):
+            self.store.log_metric("missing", Metric("m", 1.0, 1))
+
+    def test_metric_history(self):
+        run_uuid = self._create_run().info.run_uuid
+        # Values are returned in the order they were logged, whatever their timestamps
+        values = [(3, 1.0), (1, 2.0), (2, 3.0), (4, 4.0), (5, 5.0)]
+        self.store.log_batch(run_uuid, [Metric("m", v, ts) for ts, v in values], [], [])
+        history = self.store.get_metric_history(run_uuid, "m")
+        self.assertEqual([(m.timestamp, m.value) for m in history], values)
+        history = self.store.get_metric_history(run_uuid, "m", start_ts=2, end_ts=4)
+        self.assertEqual([(m.timestamp, m.value) for m in history], [(3, 1.0), (2, 3.0), (4, 4.0)])
+        self.assertEqual(self.store.get_metric_history(run_uuid, "m", start_ts=10), [])
+        history = self.store.get_metric_history(run_uuid, "m", max_points=2, aggregation="max")
+        self.assertEqual([(m.timestamp, m.value) for m in history], [(1, 2.0), (5, 5.0)])
+        with self.assertRaises(Exception):
+            self.store.get_metric_history(run_uuid, "missing")
+
+        other_run_uuid = self._create_run().info.run_uuid
+        self.store.log_metric(other_run_uuid, Metric("n", 7.0, 3))
+        histories = self.store.get_metric_history_bulk([run_uuid, other_run_uuid], ["m", "n"],
+                                                       end_ts=3)
+        self.assertEqual(sorted(histories[run_uuid].keys()), ["m"])
+        self.assertEqual([(m.timestamp, m.value) for m in histories[run_uuid]["m"]],
+                         [(3, 1.0), (1, 2.0), (2, 3.0)])
+        self.assertEqual([(m.timestamp, m.value) for m in histories[other_run_uuid]["n"]],
+                         [(3, 7.0)])
+
+    def test_search_runs(self):
+        experiment_id = self.store.create_experiment("search")
+        run_uuids = []
+        for i in range(6):
+            run_uuid = self._create_run(experiment_id, start_time=i % 3).info.run_uuid
+            self.store.log_metric(run_uuid, Metric("acc", 0.0, 0))
+            self.store.log_metric(run_uuid, Metric("acc", i, 1))
+            self.store.log_param(run_uuid, Param("model", "a" if i % 2 else "b"))
+            run_uuids.append(run_uuid)
+        self._create_run(start_time=100)
+
+        def search(expressions, **kwargs):
+            return [run.info.run_uuid
+                    for run in self.store.search_runs([experiment_id], expressions, **kwargs)]
+
+        # Only the latest value of a metric is compared
+        self.assertEqual(set(search([self._metric_expression("acc", ">=", 3)])),
+                         set(run_uuids[3:]))
+        self.assertEqual(set(search([self._metric_expression("acc", ">=", 1),
+                                     self._param_expression("model", "=", "a")])),
+                         set([run_uuids[1], run_uuids[3], run_uuids[5]]))
+        self.assertEqual(search([self._metric_expression("missing", "<", 1)]), [])
+
+        for order_by in [None, ["start_time ASC"], ["end_time DESC", "run_uuid DESC"]]:
+            expected = [run_info.run_uuid for run_info in sort_run_infos(
+                self.store.list_run_infos(experiment_id), order_by)]
+            self.assertEqual(search([], order_by=order_by), expected)
+            paged, token = [], None
+            while True:
+                page = self.store.search_runs([experiment_id], [], max_results=4,
+                                              page_token=token, order_by=order_by)
+                paged.extend(run.info.run_uuid for run in page)
+                token = page.token
+                if token is None:
+                    break
+            self.assertEqual(paged, expected)
+        page = self.store.list_run_infos(experiment_id, max_results=6)
+        self.assertEqual((len(page), page.token), (6, None))
+
+    def test_page_token_is_stable_across_new_runs(self):
+        experiment_id = self.store.create_experiment("paged")
+        for start_time in range(4):
+            self._create_run(experiment_id, start_time=start_time)
+        first_page = self.store.list_run_infos(experiment_id, max_results=2)
+        self.assertEqual([run_info.start_time for run_info in first_page], [3, 2])
+        self._create_run(experiment_id, start_time=10)
+        second_page = self.store.list_run_infos(experiment_id, max_results=2,
+                                                page_token=first_page.token)
+        self.assertEqual([run_info.start_time for run_info in second_page], [1, 0])
+        self.assertIsNone(second_page.token)
+
+    @staticmethod
+    def _list_files(root):
+        return sorted((os.path.join(path, name), os.path.getmtime(os.path.join(path, name)))
+                      for path, _, names in os.walk(root) for name in names)
+
+    def test_import_file_store(self):
+        file_store_root = os.path.join(self.test_root, "mlruns")
+        file_store = FileStore(file_store_root)
+        experiment_id = file_store.create_experiment("imported")
+        # Values longer than earlier column sizes
+        run = file_store.create_run(experiment_id, "user", "name", 1, "source" * 100,
+                                    "entry" * 20, 3, "version" * 20, [RunTag("t", "v")])
+        run_uuid = run.info.run_uuid
+        file_store.log_batch(run_uuid, [Metric("m", 1.0, 1), Metric("m", 2.0, 2)],
+                             [Param("p", "x")], [])
+        file_store.update_run_info(run_uuid, RunStatus.FINISHED, 4)
+        # Indexes are rebuilt on demand, so their absence must not make the import write them
+        for name in [".run_index", ".experiment_catalog"]:
+            os.remove(os.path.join(file_store_root, name))
+        files = self._list_files(file_store_root)
+
+        source = FileStore(file_store_root, read_only=True)
+        self.assertEqual(self.store.import_file_store(source), (1, 1))
+        # Importing again is a no-op
+        self.assertEqual(self.store.import_file_store(source), (0, 0))
+        self.assertEqual(self._list_files(file_store_root), files)
+        self.assertEqual(self.store.get_experiment(experiment_id).name, "imported")
+        imported = self.store.get_run(run_uuid)
+        self.assertEqual(imported.info.artifact_uri, run.info.artifact_uri)
+        self.assertEqual((imported.info.source_name, imported.info.entry_point_name,
+                          imported.info.source_version),
+                         ("source" * 100, "entry" * 20, "version" * 20))
+        self.assertEqual((imported.info.status, imported.info.end_time), (RunStatus.FINISHED, 4))
+        self.assertEqual([(t.key, t.value) for t in imported.info.tags], [("t", "v")])
+        self.assertEqual([(p.key, p.value) for p in imported.data.params], [("p", "x")])
+        self.assertEqual([(m.timestamp, m.value)
+                          for m in self.store.get_metric_history(run_uuid, "m")],
+                         [(1, 1.0), (2, 2.0)])
+        # New experiments do not collide with imported IDs
+        self.assertGreater(self.store.create_experiment("after import"), experiment_id)
+
+    def test_change_token_scope(self):
+        experiment_id = self.store.create_experiment("experiment")
+        other_experiment_id = self.store.create_experiment("other experiment")
+        run_uuid = self._create_run(experiment_id).info.run_uuid
+
+        def get_tokens():
+            return (self.store.get_change_token(),
+                    self.store.get_change_token([experiment_id], include_run_data=False),
+                    self.store.get_change_token([experiment_id]),
+                    self.store.get_change_token([other_experiment_id]))
+
+        before = get_tokens()
+        self.store.log_metric(run_uuid, Metric("acc", 1, 0))
+        self.store.log_param(run_uuid, Param("p", "v"))
+        after = get_tokens()
+        self.assertEqual([a == b for a, b in zip(before, after)], [True, True, False, True])
+        self.store.log_batch(run_uuid, [], [], [RunTag("t", "v")])
+        after_tags = get_tokens()
+        self.assertEqual([a == b for a, b in zip(after, after_tags)], [True, False, False, True])
+        self.store.update_run_info(run_uuid, RunStatus.FINISHED, 1)
+        after_update = get_tokens()
+        self.assertEqual([a == b for a, b in zip(after_tags, after_update)],
+                         [True, False, False, True])
+        self.store.create_experiment("new experiment")
+        self.assertTrue(all(a != b for a, b in zip(after_update, get_tokens())))
+        # Tokens are shared by the stores of a database
+        other_store = SqlAlchemyStore(self.db_uri)
+        self.assertEqual(other_store.get_change_token([experiment_id]),
+                         self.store.get_change_token([experiment_id]))
+        other_store.engine.dispose()
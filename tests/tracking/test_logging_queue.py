@@ -0,0 +1,59 @@
+import threading
+
+import mock
+import pytest
+
+from mlflow.entities.metric import Metric
+from mlflow.entities.param import Param
+from mlflow.tracking.logging_queue import AsyncLoggingQueue
+
+
+def test_logged_values_are_coalesced_into_batches():
+    store = mock.Mock()
+    writing, unblock = threading.Event(), threading.Event()
+
+    def log_batch(*args):
+        writing.set()
+        unblock.wait()
+    store.log_batch.side_effect = log_batch
+    logging_queue = AsyncLoggingQueue(store, "run-uuid")
+    logging_queue.log_metric(Metric("m", 0, 0))
+    writing.wait()
+    # While the first write is in flight, further values pile up and are written together
+    for i in range(1, 100):
+        logging_queue.log_metric(Metric("m", i, i))
+    logging_queue.log_param(Param("p", "v"))
+    unblock.set()
+    logging_queue.close()
+    assert store.log_batch.call_count == 2
+    (_, first_metrics, _, _), (_, second_metrics, second_params, _) = \
+        [call[0] for call in store.log_batch.call_args_list]
+    assert [m.value for m in first_metrics + second_metrics] == list(range(100))
+    assert [(p.key, p.value) for p in second_params] == [("p", "v")]
+
+
+def test_drop_when_full():
+    store = mock.Mock()
+    unblock = threading.Event()
+    store.log_batch.side_effect = lambda *args: unblock.wait()
+    logging_queue = AsyncLoggingQueue(store, "run-uuid", max_queue_size=2, block_when_full=False)
+    for i in range(10):
+        logging_queue.log_metric(Metric("m", i, i))
+    unblock.set()
+    logging_queue.close()
+    assert logging_queue.num_dropped > 0
+    num_written = sum(len(call[0][1]) for call in store.log_batch.call_args_list)
+    assert num_written + logging_queue.num_dropped == 10
+
+
+def test_errors_surface_on_flush_and_close_is_final():
+    store = mock.Mock()
+    store.log_batch.side_effect = Exception("store unavailable")
+    logging_queue = AsyncLoggingQueue(store, "run-uuid")
+    logging_queue.log_metric(Metric("m", 0, 0))
+    with pytest.raises(Exception) as e:
+        logging_queue.flush()
+    assert "store unavailable" in str(e.value)
+    logging_queue.close()
+    with pytest.raises(Exception):
+        logging_queue.log_metric(Metric("m", 1, 1))
@@ -129,6 +129,41 @@ def test_log_param():
             assert expected_pairs[param.key] == param.value
 
 
+def test_log_metrics_and_params():
+    with temp_directory() as tmp_dir, mock.patch("mlflow.tracking._get_store") as get_store_mock:
+        get_store_mock.return_value = FileStore(tmp_dir)
+        active_run = tracking.start_run()
+        run_uuid = active_run.run_info.run_uuid
+        with active_run:
+            mlflow.log_metrics({"name_1": 25, "name_2": -3, "name_3": "apple"})
+            mlflow.log_metrics({"name_1": 30})
+            mlflow.log_params({"p1": "a", "p2": 2})
+        finished_run = active_run.store.get_run(run_uuid)
+        assert dict((m.key, m.value) for m in finished_run.data.metrics) == \
+            {"name_1": 30, "name_2": -3}
+        assert dict((p.key, p.value) for p in finished_run.data.params) == {"p1": "a", "p2": "2"}
+        assert len(active_run.store.get_metric_history(run_uuid, "name_1")) == 2
+
+
+def test_async_logging():
+    with temp_directory() as tmp_dir, mock.patch("mlflow.tracking._get_store") as get_store_mock:
+        get_store_mock.return_value = FileStore(tmp_dir)
+        active_run = tracking.start_run(async_logging=True)
+        run_uuid = active_run.run_info.run_uuid
+        for i in range(100):
+            mlflow.log_metric("name_1", i)
+        mlflow.log_param("p1", "a")
+        assert len(tracking.active_run().data.metrics) == 1
+        mlflow.log_metrics({"name_1": 100, "name_2": -3})
+        tracking.end_run()
+        store = active_run.store
+        assert [m.value for m in store.get_metric_history(run_uuid, "name_1")] == \
+            list(range(101))
+        assert store.get_metric(run_uuid, "name_2").value == -3
+        assert store.get_param(run_uuid, "p1").value == "a"
+        assert store.get_run(run_uuid).info.status == RunStatus.FINISHED
+
+
 def test_log_artifact():
     with temp_directory() as tmp_dir, temp_directory() as artifact_src_dir, \
             mock.patch("mlflow.tracking._get_store") as get_store_mock:
@@ -164,3 +199,16 @@ def test_log_artifact():
             assert len(dir_comparison.right_only) == 0
             assert len(dir_comparison.diff_files) == 0
             assert len(dir_comparison.funny_files) == 0
+
+
+def test_get_store_from_database_uri():
+    from mlflow.store.sqlalchemy_store import SqlAlchemyStore
+    with temp_directory() as tmp_dir:
+        db_uri = "sqlite:///%s" % os.path.join(tmp_dir, "mlflow.db")
+        with mock.patch("mlflow.tracking._tracking_uri", db_uri):
+            store = tracking._get_store()
+            assert isinstance(store, SqlAlchemyStore)
+            store.engine.dispose()
+        assert tracking._is_database_uri("postgresql+psycopg2://user@host/db")
+        assert not tracking._is_database_uri("http://host:5000")
+        assert not tracking._is_database_uri(tmp_dir)
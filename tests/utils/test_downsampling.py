@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from mlflow.utils.downsampling import downsample
+
+
+def test_downsample_returns_short_histories_unchanged():
+    timestamps, values = np.arange(5), np.arange(5, dtype=np.float64)
+    result_timestamps, result_values = downsample(timestamps, values, 5)
+    assert result_timestamps.tolist() == timestamps.tolist()
+    assert result_values.tolist() == values.tolist()
+
+
+def test_downsample_bucket_aggregations():
+    timestamps = np.arange(10, 20)
+    values = np.array([3, 1, 2, 7, 5, 6, 0, 8, 9, 4], dtype=np.float64)
+    # Buckets: [3, 1, 2, 7, 5] and [6, 0, 8, 9, 4]
+    mean_timestamps, means = downsample(timestamps, values, 2)
+    assert mean_timestamps.tolist() == [10, 15]
+    assert means.tolist() == [3.6, 5.4]
+    min_timestamps, mins = downsample(timestamps, values, 2, "min")
+    assert (min_timestamps.tolist(), mins.tolist()) == ([11, 16], [1, 0])
+    max_timestamps, maxes = downsample(timestamps, values, 2, "max")
+    assert (max_timestamps.tolist(), maxes.tolist()) == ([13, 18], [7, 9])
+
+
+def test_downsample_lttb_keeps_endpoints_and_peaks():
+    timestamps = np.arange(1000)
+    values = np.zeros(1000)
+    values[500] = 100
+    result_timestamps, result_values = downsample(timestamps, values, 10, "lttb")
+    assert len(result_timestamps) == 10
+    assert result_timestamps[0] == 0 and result_timestamps[-1] == 999
+    assert np.all(np.diff(result_timestamps) > 0)
+    assert 100 in result_values.tolist()
+
+
+def test_downsample_rejects_invalid_arguments():
+    timestamps, values = np.arange(10), np.arange(10, dtype=np.float64)
+    with pytest.raises(Exception):
+        downsample(timestamps, values, 3, "median")
+    with pytest.raises(Exception):
+        downsample(timestamps, values, 0)
+    with pytest.raises(Exception):
+        downsample(timestamps, values, 2, "lttb")
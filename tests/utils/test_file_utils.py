@@ -4,6 +4,7 @@ import codecs
 import os
 import shutil
 import unittest
+import mock
 import six
 
 from mlflow.utils import file_utils
@@ -36,6 +37,18 @@ class TestFileUtils(unittest.TestCase):
         # representations of their byte sequences).
         self.assertIn(u"中文", contents)
 
+    def test_yaml_read_dispatches_to_codecs(self):
+        data = {"a": 1, "text_value": u"中文"}
+        for codec in [file_utils.YamlCodec, file_utils.JsonCodec]:
+            file_utils.write_yaml(self.test_folder, codec.name, data, codec=codec)
+            with mock.patch.object(codec, "loads", wraps=codec.loads) as loads_mock:
+                self.assertEqual(file_utils.read_yaml(self.test_folder, codec.name + ".yaml"),
+                                 data)
+                self.assertEqual(loads_mock.call_count, 1)
+        # YAML flow mappings that are not valid JSON fall back to the YAML parser
+        file_utils.write_to(os.path.join(self.test_folder, "flow.yaml"), "{a: 1}")
+        self.assertEqual(file_utils.read_yaml(self.test_folder, "flow.yaml"), {"a": 1})
+
     def test_mkdir(self):
         new_dir_name = "mkdir_test_%d" % random_int()
         file_utils.mkdir(self.test_folder, new_dir_name)
@@ -43,3 +56,56 @@ class TestFileUtils(unittest.TestCase):
 
         with self.assertRaises(OSError):
             file_utils.mkdir("/   bad directory @ name ", "ouch")
+
+    def test_read_last_line(self):
+        def last_line(content, block_size=4):
+            with open(os.path.join(self.test_folder, "file"), "wb") as f:
+                f.write(content)
+            return file_utils.read_last_line(self.test_folder, "file", block_size=block_size)
+
+        self.assertEqual(last_line(b"1 10\n2 20\n3 30\n"), "3 30")
+        self.assertEqual(last_line(b"1 10\n2 20\n3 3000000\n\n"), "3 3000000")
+        self.assertEqual(last_line(b"1 10\n2 20\n3 30", block_size=1), "3 30")
+        self.assertEqual(last_line(b"only line"), "only line")
+        self.assertEqual(last_line(u"a\n中文\n".encode("utf-8"), block_size=1), u"中文")
+        self.assertIsNone(last_line(b""))
+        self.assertIsNone(last_line(b"\n\n"))
+        lines = b"".join(b"%d %d\n" % (i, i) for i in range(100000))
+        self.assertEqual(last_line(lines, block_size=4096), "99999 99999")
+
+    def test_atomic_write(self):
+        path = os.path.join(self.test_folder, "file")
+        file_utils.write_to(path, "old")
+        with file_utils.atomic_write(path) as f:
+            f.write("new")
+            # The file is only replaced once the write completes
+            self.assertEqual(open(path).read(), "old")
+        self.assertEqual(open(path).read(), "new")
+        with self.assertRaises(ValueError):
+            with file_utils.atomic_write(path) as f:
+                f.write("partial")
+                raise ValueError()
+        self.assertEqual(open(path).read(), "new")
+        self.assertEqual(os.listdir(self.test_folder), ["file"])
+
+    def test_atomic_write_replaces_existing_file_without_rename(self):
+        path = os.path.join(self.test_folder, "file")
+        file_utils.write_to(path, "old")
+
+        def windows_rename(src, dst):
+            if os.path.exists(dst):
+                raise OSError("Cannot create a file when that file already exists")
+            os.replace(src, dst)
+
+        # os.rename cannot replace an existing file on Windows
+        with mock.patch("os.rename", side_effect=windows_rename):
+            file_utils.write_to(path, "new")
+        self.assertEqual(open(path).read(), "new")
+        self.assertEqual(os.listdir(self.test_folder), ["file"])
+
+    def test_locked_append(self):
+        path = os.path.join(self.test_folder, "file")
+        file_utils.append_to(path, u"中文\n")
+        with file_utils.locked_append(path) as f:
+            f.write(b"line\n")
+        self.assertEqual(codecs.open(path, encoding="utf-8").read(), u"中文\nline\n")
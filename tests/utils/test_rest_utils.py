@@ -0,0 +1,83 @@
+import threading
+
+import mock
+import pytest
+from six.moves import BaseHTTPServer
+
+from mlflow.utils import rest_utils
+
+
+def test_sessions_are_shared_per_host():
+    session = rest_utils._get_request_session("http://host-a:5000")
+    assert rest_utils._get_request_session("http://host-a:5000") is session
+    assert rest_utils._get_request_session("http://host-b:5000") is not session
+    adapter = session.get_adapter("http://host-a:5000/api")
+    assert adapter.max_retries.total == rest_utils._DEFAULT_MAX_RETRIES
+    assert 503 in adapter.max_retries.status_forcelist
+
+
+def test_http_request_uses_pooled_session():
+    response = mock.Mock(status_code=200, text='{"a": 1}')
+    with mock.patch("requests.Session.request", return_value=response) as request_mock:
+        for _ in range(2):
+            assert rest_utils.http_request(hostname="http://pooled-host", endpoint="/api",
+                                           method="GET", auth=None, headers=None,
+                                           req_body_json=None, params=None) == {"a": 1}
+        assert request_mock.call_count == 2
+        _, kwargs = request_mock.call_args
+        assert kwargs["url"] == "http://pooled-host/api"
+        assert kwargs["timeout"] == rest_utils._DEFAULT_TIMEOUT
+
+
+def test_pool_configuration_from_env():
+    with mock.patch.dict("os.environ", {rest_utils._POOL_SIZE_ENV_VAR: "3",
+                                        rest_utils._MAX_RETRIES_ENV_VAR: "7"}):
+        session = rest_utils._get_request_session("http://configured-host")
+    adapter = session.get_adapter("http://configured-host")
+    assert adapter._pool_maxsize == 3
+    assert adapter.max_retries.total == 7
+
+
+@pytest.fixture
+def status_server():
+    """
+    Serves requests for /<status> with that status, recording the path of each request.
+    """
+    paths = []
+
+    class Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+        def do_GET(self):  # pylint: disable=invalid-name
+            paths.append(self.path)
+            self.send_response(int(self.path[1:]))
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = BaseHTTPServer.HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    try:
+        yield "http://127.0.0.1:%s" % server.server_address[1], paths
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_only_gateway_errors_are_retried(status_server):
+    hostname, paths = status_server
+    with mock.patch.dict("os.environ", {rest_utils._MAX_RETRIES_ENV_VAR: "2",
+                                        rest_utils._BACKOFF_FACTOR_ENV_VAR: "0"}):
+        # Deterministic server errors surface at once
+        with pytest.raises(rest_utils.RestException) as exc:
+            rest_utils.http_request_raw(hostname=hostname, endpoint="/500", method="GET",
+                                        auth=None, headers=None, req_body_json=None, params=None)
+        assert exc.value.status_code == 500
+        assert paths == ["/500"]
+        with pytest.raises(rest_utils.RestException) as exc:
+            rest_utils.http_request_raw(hostname=hostname, endpoint="/503", method="GET",
+                                        auth=None, headers=None, req_body_json=None, params=None)
+        assert exc.value.status_code == 503
+        assert paths == ["/500"] + ["/503"] * 3
@@ -0,0 +1,82 @@
+import json
+import time
+
+import mock
+import numpy as np
+import pandas as pd
+import pytest
+
+import mlflow.utils
+from mlflow.utils import get_jsonable_obj, dumps_jsonable_obj, ndarray2list
+
+
+def _reference_ndarray2list(ndarray):
+    if len(ndarray.shape) <= 1:
+        return [x.item() for x in ndarray]
+    return [_reference_ndarray2list(ndarray[i, :]) for i in range(0, ndarray.shape[0])]
+
+
+def _dumps_reference(data):
+    if isinstance(data, np.ndarray):
+        return json.dumps(_reference_ndarray2list(data))
+    return json.dumps(pd.DataFrame(data).to_dict(orient="records"))
+
+
+def test_ndarray2list():
+    for array in [np.arange(6).reshape(2, 3), np.array([1.5, np.nan], dtype=np.float32),
+                  np.array([[True], [False]]), np.array([np.float64(2.5), np.int64(3)],
+                                                        dtype=object)]:
+        result = ndarray2list(array)
+        assert json.dumps(result) == json.dumps(_reference_ndarray2list(array))
+    # Objects that are not numpy scalars are kept as is
+    assert ndarray2list(np.array([np.int64(1), "a"], dtype=object)) == [1, "a"]
+
+
+def test_get_jsonable_obj_pandas():
+    df = pd.DataFrame({"a": [1, 2], "b": [1.5, 2.5], "c": ["x", "y"], 0: [True, False]})
+    assert get_jsonable_obj(df) == df.to_dict(orient="records")
+    assert get_jsonable_obj(df, pandas_orient="list") == df.to_dict(orient="list")
+    assert get_jsonable_obj(pd.Series([1, 2], name="p")) == [{"p": 1}, {"p": 2}]
+    duplicates = pd.DataFrame([[1, 2]], columns=["a", "a"])
+    assert get_jsonable_obj(duplicates) == duplicates.to_dict(orient="records")
+    assert get_jsonable_obj({"a": 1}) == {"a": 1}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_jsonable_obj(use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    with mock.patch("mlflow.utils.orjson", mlflow.utils.orjson if use_orjson else None):
+        array = np.arange(6, dtype=np.float64).reshape(2, 3) / 4
+        assert json.loads(dumps_jsonable_obj(array)) == array.tolist()
+        # Non-contiguous arrays are converted to lists first
+        assert json.loads(dumps_jsonable_obj(array[:, ::2])) == array[:, ::2].tolist()
+        df = pd.DataFrame(array)
+        assert json.loads(dumps_jsonable_obj(df)) == json.loads(_dumps_reference(df))
+        assert json.loads(dumps_jsonable_obj(df, pandas_orient="list")) == \
+            {"0": [0.0, 0.75], "1": [0.25, 1.0], "2": [0.5, 1.25]}
+        # Non-finite values are encoded as null by both encoders
+        array = np.array([[1.5, np.nan], [np.inf, -np.inf]])
+        assert json.loads(dumps_jsonable_obj(array)) == [[1.5, None], [None, None]]
+        df = pd.DataFrame({"a": [1.5, np.nan]})
+        assert json.loads(dumps_jsonable_obj(df)) == [{"a": 1.5}, {"a": None}]
+        assert json.loads(dumps_jsonable_obj({"a": [float("nan")]})) == {"a": [None]}
+
+
+@pytest.mark.large
+def test_dumps_jsonable_obj_benchmark():
+    predictions = {
+        "ndarray": np.random.rand(100000),
+        "ndarray_2d": np.random.rand(100000, 4),
+        "dataframe": pd.DataFrame(np.random.rand(100000, 4), columns=list("abcd")),
+    }
+    for name, data in predictions.items():
+        timings = []
+        for dumps in [_dumps_reference, dumps_jsonable_obj]:
+            start = time.time()
+            dumps(data)
+            timings.append(time.time() - start)
+        print("%s: %.0f ms with the previous encoder, %.0f ms with dumps_jsonable_obj (%s)"
+              % (name, timings[0] * 1000, timings[1] * 1000,
+                 "orjson" if mlflow.utils.orjson is not None else "json"))
+        assert timings[1] < timings[0]